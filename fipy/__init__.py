@@ -43,64 +43,102 @@ def _getVersion():
 
     return version
 
-__version__ = _getVersion()
-
-from fipy.boundaryConditions import *
-from fipy.meshes import *
-from fipy.solvers import *
-from fipy.steppers import *
-from fipy.terms import *
-from fipy.tools import *
-from fipy.variables import *
-from fipy.viewers import *
-
-__all__ = []
-__all__.extend(boundaryConditions.__all__)
-__all__.extend(meshes.__all__)
-__all__.extend(solvers.__all__)
-__all__.extend(steppers.__all__)
-__all__.extend(terms.__all__)
-__all__.extend(tools.__all__)
-__all__.extend(variables.__all__)
-__all__.extend(viewers.__all__)
+# the subpackages whose names are exported, in the order they were
+# originally star-imported
+_subpackages = ("boundaryConditions",
+                "meshes",
+                "solvers",
+                "steppers",
+                "terms",
+                "tools",
+                "variables",
+                "viewers")
+
+# the order to search them for a name, cheapest first, so that, e.g.,
+# ``from fipy import Grid2D, CellVariable`` neither chooses a solver nor
+# loads a viewer; no name is exported by more than one of them
+_searchOrder = ("tools",
+                "meshes",
+                "variables",
+                "boundaryConditions",
+                "terms",
+                "steppers",
+                "solvers",
+                "viewers")
+
+import sys
+import types
+
+class _LazyModule(types.ModuleType):
+    """The `fipy` package, which imports a subpackage only once one of its
+    names is asked for.
+
+    ``from fipy import *`` still imports every subpackage.
+    """
+    def __getattr__(self, name):
+        # only called for names that have not been found yet
+        if name == "__version__":
+            value = _getVersion()
+        elif name == "__all__":
+            value = []
+            for package in _subpackages:
+                value.extend(self._subpackage(package).__all__)
+            value.extend(_builtins)
+        elif name.startswith("__"):
+            raise AttributeError(name)
+        else:
+            for package in _searchOrder:
+                module = self._subpackage(package)
+                if name in module.__all__:
+                    value = getattr(module, name)
+                    break
+            else:
+                try:
+                    value = self._subpackage(name)
+                except ImportError:
+                    raise AttributeError("'module' object has no attribute '%s'" % name)
+
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__.keys() + self.__all__))
+
+    def _subpackage(self, name):
+        __import__(__name__ + "." + name)
+        return sys.modules[__name__ + "." + name]
 
 # fipy needs to export raw_input whether or not parallel
 
-import sys
-if sys.version_info >= (3, 0):
-    input = input
-    input_original = input
+def _mpi_input(prompt, original):
+    from fipy.tools import parallelComm
 
     if parallelComm.Nproc > 1:
-        def mpi_input(prompt=""):
-            parallelComm.Barrier()
+        parallelComm.Barrier()
+        sys.stdout.flush()
+        if parallelComm.procID == 0:
+            sys.stdout.write(prompt)
             sys.stdout.flush()
-            if parallelComm.procID == 0:
-                sys.stdout.write(prompt)
-                sys.stdout.flush()
-                return sys.stdin.readline()
-            else:
-                return ""
-        input = mpi_input
+            return sys.stdin.readline()
+        else:
+            return ""
+    else:
+        return original(prompt)
+
+if sys.version_info >= (3, 0):
+    input_original = input
+
+    def input(prompt=""):
+        return _mpi_input(prompt, original=input_original)
 
-    __all__.extend(['input', 'input_original'])
+    _builtins = ['input', 'input_original']
 else:
-    raw_input = raw_input
     raw_input_original = raw_input
 
-    if parallelComm.Nproc > 1:
-        def mpi_raw_input(prompt=""):
-            parallelComm.Barrier()
-            sys.stdout.flush()
-            if parallelComm.procID == 0:
-                sys.stdout.write(prompt)
-                sys.stdout.flush()
-                return sys.stdin.readline()
-            else:
-                return ""
-        raw_input = mpi_raw_input
+    def raw_input(prompt=""):
+        return _mpi_input(prompt, original=raw_input_original)
 
-    __all__.extend(['raw_input', 'raw_input_original'])
+    _builtins = ['raw_input', 'raw_input_original']
 
 _saved_stdout = sys.stdout
 
@@ -169,3 +207,10 @@ def test(*args):
         import shutil
         shutil.rmtree(tmpDir)
         raise exitErr
+
+_module = _LazyModule(__name__)
+_module.__dict__.update(globals())
+# the functions above still look up their globals in this module, which
+# Python would clear if nothing referred to it
+_module._original = sys.modules[__name__]
+sys.modules[__name__] = _module
@@ -16,6 +16,11 @@ def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
             SparseMatrix.__init__(self, mesh=mesh, bandwidth=bandwidth, sizeHint=sizeHint,
                                   numberOfVariables=numberOfVariables, numberOfEquations=numberOfEquations)
 
+        @classmethod
+        def _classKey(cls):
+            return (SparseMatrix._classKey(), numberOfVariables, numberOfEquations,
+                    cls.equationIndex, cls.varIndex)
+
         def put(self, vector, id1, id2):
             SparseMatrix.put(self, vector, id1 + self.mesh.numberOfCells * self.equationIndex, id2 + self.mesh.numberOfCells * self.varIndex)
 
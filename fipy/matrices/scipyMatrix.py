@@ -2,11 +2,69 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+import weakref
+
 import scipy.sparse as sp
 from fipy.tools import numerix
 
 from fipy.matrices.sparseMatrix import _SparseMatrix
 
+class _ScipyStencil(object):
+    """Symbolic layout of an assembled CSR matrix.
+
+    Maps an ordered sequence of (`row`, `column`) triplet positions onto
+    the `data` array of a canonical CSR matrix, so that the same layout
+    can be refilled with new values without re-sorting the triplets.
+    """
+
+    def __init__(self, rows, cols, shape):
+        """
+        :Parameters:
+          - `rows`: The sequence of row ID arrays, one per `addAt()` block.
+          - `cols`: The sequence of column ID arrays, one per `addAt()` block.
+          - `shape`: The shape of the assembled matrix.
+        """
+        self.blocks = [len(r) for r in rows]
+        self.rows = numerix.concatenate(rows)
+        self.cols = numerix.concatenate(cols)
+        self.shape = shape
+
+        keys = self.rows * shape[1] + self.cols
+        keys, self.map = numerix.unique(keys, return_inverse=True)
+
+        self.indices = keys % shape[1]
+        self.indptr = numerix.zeros((shape[0] + 1,), dtype=self.indices.dtype)
+        numerix.cumsum(numerix.bincount(keys // shape[1], minlength=shape[0]),
+                       out=self.indptr[1:])
+
+    def matches(self, rows, cols, shape):
+        if shape != self.shape or [len(r) for r in rows] != self.blocks:
+            return False
+
+        start = 0
+        for row, col in zip(rows, cols):
+            stop = start + len(row)
+            if not (numerix.array_equal(row, self.rows[start:stop])
+                    and numerix.array_equal(col, self.cols[start:stop])):
+                return False
+            start = stop
+
+        return True
+
+    def assemble(self, values):
+        """Scatter `values`, ordered like the stencil's triplets, into a new `csr_matrix`
+        """
+        if numerix.iscomplexobj(values):
+            # `bincount` only sums real weights
+            data = (numerix.bincount(self.map, weights=values.real, minlength=len(self.indices))
+                    + 1j * numerix.bincount(self.map, weights=values.imag, minlength=len(self.indices)))
+        else:
+            data = numerix.bincount(self.map, weights=values, minlength=len(self.indices))
+        matrix = sp.csr_matrix((data, self.indices.copy(), self.indptr.copy()), shape=self.shape)
+        matrix.has_sorted_indices = True
+
+        return matrix
+
 class _ScipyMatrix(_SparseMatrix):
 
     """class wrapper for a scipy sparse matrix.
@@ -24,6 +82,37 @@ class _ScipyMatrix(_SparseMatrix):
         """
         self.matrix = matrix
 
+    def _getMatrix(self):
+        if self._triplets:
+            self._assemble()
+        return self._matrix
+
+    def _setMatrix(self, matrix):
+        self._matrix = matrix
+        self._triplets = []
+
+    def _delMatrix(self):
+        del self._matrix
+        self._triplets = []
+
+    matrix = property(_getMatrix, _setMatrix, _delMatrix)
+
+    def _getStencil(self, rows, cols):
+        return _ScipyStencil(rows=rows, cols=cols, shape=self._matrix.shape)
+
+    def _assemble(self):
+        """Sum the deferred `addAt()` contributions into `self.matrix`
+        """
+        values, rows, cols = zip(*self._triplets)
+        self._triplets = []
+
+        temp = self._getStencil(rows, cols).assemble(numerix.concatenate(values))
+
+        if self._matrix.nnz == 0:
+            self._matrix = temp
+        else:
+            self._matrix = self._matrix + temp
+
     def getCoupledClass(self):
         return _CoupledScipyMeshMatrix
 
@@ -41,7 +130,16 @@ class _ScipyMatrix(_SparseMatrix):
         return self._iadd(other)
 
     def _iadd(self, other, sign=1):
-        if hasattr(other, "matrix"):
+        if isinstance(other, _ScipyMatrix):
+            # defer the other matrix's unassembled contributions
+            if sign == 1:
+                self._triplets.extend(other._triplets)
+            else:
+                self._triplets.extend([(-values, rows, cols)
+                                       for values, rows, cols in other._triplets])
+            if other._matrix.nnz > 0:
+                self._matrix = self._matrix + (sign * other._matrix)
+        elif hasattr(other, "matrix"):
             self.matrix = self.matrix + (sign * other.matrix)
         elif type(other) in [float, int]:
             fillVec = numerix.repeat(other, self.matrix.nnz)
@@ -214,12 +312,45 @@ class _ScipyMatrix(_SparseMatrix):
             12.300000  10.000000   3.000000  
                 ---     3.141593   2.960000  
              2.500000      ---     2.200000  
+
+        The contributions are only summed into the sparse matrix when
+        `matrix` is next accessed, so successive calls, and sums of
+        matrices built this way, are assembled in a single pass.
+
+            >>> L.addAt([1., 1.], [0, 2], [0, 2])
+            >>> L.addAt([-1., 2.], [0, 1], [0, 0])
+            >>> len(L._triplets)
+            2
+            >>> print L
+            12.300000  10.000000   3.000000  
+             2.000000   3.141593   2.960000  
+             2.500000      ---     3.200000  
+            >>> len(L._triplets)
+            0
+
+        Changing the arrays that were added does not change the matrix
+
+            >>> L = _ScipyMatrixFromShape(size=2)
+            >>> values = numerix.array([1., 2.])
+            >>> L.addAt(values, [0, 1], [0, 1])
+            >>> values[:] = 5.
+            >>> print L.matrix.diagonal()
+            [ 1.  2.]
+
+        Complex contributions keep their imaginary part
+
+            >>> L = _ScipyMatrixFromShape(size=2)
+            >>> L.addAt([1. + 2.j, 3.j], [0, 0], [1, 1])
+            >>> print L.matrix[0, 1]
+            (1+5j)
         """
         assert(len(id1) == len(id2) == len(vector))
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        # copies, as the caller may change its arrays before `matrix` is
+        # assembled
+        self._triplets.append((numerix.array(vector).ravel(),
+                               numerix.array(id1).ravel(),
+                               numerix.array(id2).ravel()))
 
     def addAtDiagonal(self, vector):
         if type(vector) in [type(1), type(1.)]:
@@ -278,6 +409,49 @@ class _ScipyMeshMatrix(_ScipyMatrixFromShape):
         assert numberOfEquations == self.numberOfVariables
         _ScipyMatrixFromShape.__init__(self, size=size, matrix=matrix)
 
+    _stencils = weakref.WeakKeyDictionary()
+
+    def _getStencil(self, rows, cols):
+        """Reuse the layout of the last matrix assembled from the same
+        sequence of `addAt()` blocks on this `Mesh`.
+
+        The stencil depends only on the mesh and the combination of terms
+        and boundary conditions, so after the first sweep only the values
+        need to be scattered.
+
+            >>> from fipy import Grid1D
+            >>> from fipy.tools import serialComm
+            >>> mesh = Grid1D(nx=3, communicator=serialComm)
+            >>> def build(value):
+            ...     L = _ScipyMeshMatrix(mesh=mesh)
+            ...     L.addAt([value, -value], [0, 1], [1, 0])
+            ...     L.addAtDiagonal([1., 2., 3.])
+            ...     return L
+            >>> L1 = build(1.)
+            >>> print L1
+             1.000000   1.000000      ---    
+            -1.000000   2.000000      ---    
+                ---        ---     3.000000  
+            >>> L2 = build(4.)
+            >>> print L2
+             1.000000   4.000000      ---    
+            -4.000000   2.000000      ---    
+                ---        ---     3.000000  
+            >>> L1.matrix.indices is L2.matrix.indices
+            False
+            >>> len(_ScipyMeshMatrix._stencils[mesh])
+            1
+        """
+        stencils = self._stencils.setdefault(self.mesh, {})
+        key = (self._matrix.shape, tuple(len(r) for r in rows))
+        stencil = stencils.get(key)
+
+        if stencil is None or not stencil.matches(rows, cols, self._matrix.shape):
+            stencil = _ScipyMatrix._getStencil(self, rows, cols)
+            stencils[key] = stencil
+
+        return stencil
+
     def __mul__(self, other):
         if isinstance(other, _ScipyMeshMatrix):
             return _ScipyMeshMatrix(mesh=self.mesh,
@@ -17,6 +17,12 @@ class _SparseMatrix(object):
     numpyArray = property()
     _shape     = property()
 
+    @classmethod
+    def _classKey(cls):
+        """Identify the layout of matrices instantiated from this class
+        """
+        return cls
+
     __array_priority__ = 100.0
 
     def __array_wrap(self, arr, context=None):
@@ -671,6 +671,47 @@ class AbstractMesh(object):
         """
         return self.topology._localOverlappingFaceIDs
 
+    @property
+    def _globalCellLayout(self):
+        """
+        Where the cells owned by each process go among the global cells.
+        Computed collectively, the first time it is needed.
+        """
+        if not hasattr(self, "_globalCellLayout_data"):
+            from fipy.meshes.globalLayout import _GlobalLayout
+            self._globalCellLayout_data = _GlobalLayout(self.communicator,
+                                                        self._localNonOverlappingCellIDs,
+                                                        self._globalNonOverlappingCellIDs,
+                                                        self.globalNumberOfCells)
+        return self._globalCellLayout_data
+
+    @property
+    def _globalFaceLayout(self):
+        """
+        Where the faces owned by each process go among the global faces.
+        Computed collectively, the first time it is needed.
+        """
+        if not hasattr(self, "_globalFaceLayout_data"):
+            from fipy.meshes.globalLayout import _GlobalLayout
+            # partitioned meshes other than `Grid1D` number their faces
+            # locally, so the global faces are not counted or checked
+            self._globalFaceLayout_data = _GlobalLayout(self.communicator,
+                                                        self._localNonOverlappingFaceIDs,
+                                                        self._globalNonOverlappingFaceIDs)
+        return self._globalFaceLayout_data
+
+    @property
+    def _cellHaloExchange(self):
+        """
+        Which cells each process sends to and receives from its neighbors
+        to refresh the overlapping cells. Computed collectively, the first
+        time it is needed.
+        """
+        if not hasattr(self, "_cellHaloExchange_data"):
+            from fipy.meshes.haloExchange import _HaloExchange
+            self._cellHaloExchange_data = _HaloExchange(self)
+        return self._cellHaloExchange_data
+
     @property
     def facesLeft(self):
         """
@@ -979,11 +1020,8 @@ class AbstractMesh(object):
 
     @property
     def _VTKCellType(self):
-        try:
-            from tvtk.api import tvtk
-        except ImportError, e:
-            from enthought.tvtk.api import tvtk
-        return tvtk.ConvexPointSet().cell_type
+        # VTK_CONVEX_POINT_SET, as ``tvtk.ConvexPointSet().cell_type``
+        return 41
 
     @property
     def VTKCellDataSet(self):
@@ -62,6 +62,7 @@ class _AbstractGridBuilder(object):
 
         newNs = self._calcNs(ns, newDs)
 
+        globalNs = list(newNs)
         globalNumCells = reduce(self._mult, newNs)
         globalNumFaces = self._calcGlobalNumFaces(newNs)
 
@@ -74,28 +75,55 @@ class _AbstractGridBuilder(object):
         procID = communicator.procID
         Nproc = communicator.Nproc
 
-        overlap = min(overlap, newNs[-1])
-        cellsPerNode = max(newNs[-1] // Nproc, overlap)
-        occupiedNodes = min(newNs[-1] // (cellsPerNode or 1), Nproc)
+        processShape = self._calcProcessShape(newNs, overlap, Nproc)
 
-        (firstOverlap,
-         secOverlap,
-         overlap) = self._buildOverlap(overlap, procID, occupiedNodes)
+        # position of this process in the grid of processes, with the first
+        # axis changing most quickly, like the cells
+        blockIDs = []
+        rest = procID
+        for blocks in processShape:
+            blockIDs.append(rest % blocks)
+            rest //= blocks
 
-        offsetArg = min(procID, occupiedNodes-1) * cellsPerNode - firstOverlap
-        offset = self._packOffset(offsetArg)
+        firstOverlaps = []
+        secOverlaps = []
+        offsets = []
+        occupied = []
+        for axis, (n, blocks, blockID) in enumerate(zip(newNs, processShape, blockIDs)):
+            axisOverlap = min(overlap, n)
+            cellsPerNode, occupiedNodes = self._calcOccupiedNodes(n, blocks, axisOverlap)
 
-        """
-        local nx, [ny, [nz]] calculation
-        """
-        local_n = cellsPerNode * (procID < occupiedNodes)
+            """
+            local nx, [ny, [nz]] calculation
+            """
+            local_n = cellsPerNode * (blockID < occupiedNodes)
+
+            if blockID == occupiedNodes - 1:
+                local_n += (n - cellsPerNode * occupiedNodes)
+
+            (firstOverlap,
+             secOverlap) = self._buildOverlap(axisOverlap, blockID, occupiedNodes, axis,
+                                              n=n, owned=local_n)
+
+            offsets.append(min(blockID, occupiedNodes-1) * cellsPerNode - firstOverlap)
+
+            local_n += firstOverlap + secOverlap
+
+            newNs[axis] = local_n
+            firstOverlaps.append(firstOverlap)
+            secOverlaps.append(secOverlap)
+            occupied.append(occupiedNodes)
 
-        if procID == occupiedNodes - 1:
-            local_n += (newNs[-1] - cellsPerNode * occupiedNodes)
+        if True in [blockID >= occupiedNodes
+                    for blockID, occupiedNodes in zip(blockIDs, occupied)]:
+            # this process is not needed and holds no cells, not even ghosts
+            firstOverlaps = secOverlaps = [0] * dim
+            newNs = [0] * dim
 
-        local_n += firstOverlap + secOverlap
+        overlap = self._packOverlap(firstOverlaps, secOverlaps)
+        offset = self._packOffset(offsets)
 
-        newNs = tuple(newNs[:-1] + [local_n])
+        newNs = tuple(newNs)
 
         """
         post-parallel
@@ -129,13 +157,15 @@ class _AbstractGridBuilder(object):
 
         self.offset = offset
         self.overlap = overlap
+        self.globalShape = tuple(globalNs)
+        self.processShape = tuple(occupied)
 
         self.spatialDict = spatialDict
         self.numberOfVertices = numVertices
         self.numberOfCells = numCells
 
         if cacheOccupiedNodes:
-            self.occupiedNodes = occupiedNodes
+            self.occupiedNodes = occupied[-1]
 
     @property
     def gridData(self):
@@ -159,7 +189,9 @@ class _AbstractGridBuilder(object):
                 self.numberOfCells,
                 self._calcShape(),
                 self._calcPhysicalShape(),
-                self._calcMeshSpacing()]
+                self._calcMeshSpacing(),
+                self.globalShape,
+                self.processShape]
 
     def _calcShape(self):
         raise NotImplementedError
@@ -191,7 +223,7 @@ class _AbstractGridBuilder(object):
         """
         Dimensionally independent face-number calculation.
 
-        >>> from fipy.meshes.builders import *
+        >>> from fipy.meshes.builders import _Grid1DBuilder, _Grid2DBuilder, _Grid3DBuilder
 
         >>> gb = _Grid1DBuilder()
         >>> gb._calcGlobalNumFaces([1])
@@ -235,16 +267,113 @@ class _AbstractGridBuilder(object):
     def _calcNs(self, ns, ds):
         return self.NumPtsCalcClass.calcNs(ns, ds)
 
-    def _buildOverlap(self, overlap, procID, occupiedNodes):
-        (first, sec) = (overlap * (procID > 0) * (procID < occupiedNodes),
-                        overlap * (procID < occupiedNodes - 1))
+    @staticmethod
+    def _calcOccupiedNodes(n, blocks, overlap):
+        """
+        Return the number of cells in each block when `n` cells are split
+        among `blocks` processes along one axis, and the number of those
+        processes that actually hold cells. Every block gets at least
+        `overlap` cells; the last block takes any remainder.
+
+        >>> _AbstractGridBuilder._calcOccupiedNodes(9, 2, 1)
+        (4, 2)
+        >>> _AbstractGridBuilder._calcOccupiedNodes(3, 4, 2)
+        (2, 1)
+        """
+        cellsPerNode = max(n // blocks, overlap)
+        occupiedNodes = min(n // (cellsPerNode or 1), blocks)
+
+        return cellsPerNode, occupiedNodes
+
+    def _calcProcessShape(self, ns, overlap, Nproc):
+        """
+        Factor `Nproc` processes into a grid of blocks, one factor for each
+        axis of a grid of `ns` cells.
+
+        The factoring that leaves the fewest processes idle is chosen and,
+        of those, the one with the smallest total area of the interfaces
+        between blocks. Remaining ties go to splitting the last axis, which
+        is how grids were always divided when only one axis was split.
+
+        >>> from fipy.meshes.builders import _Grid1DBuilder, _Grid2DBuilder, _Grid3DBuilder
+        >>> gb2 = _Grid2DBuilder()
+        >>> gb2._calcProcessShape([100, 100], 2, 4)
+        (2, 2)
+        >>> gb2._calcProcessShape([100, 100], 2, 2)
+        (1, 2)
+        >>> gb2._calcProcessShape([400, 100], 2, 4)
+        (4, 1)
+        >>> gb2._calcProcessShape([1, 9], 1, 3)
+        (1, 3)
+        >>> gb3 = _Grid3DBuilder()
+        >>> gb3._calcProcessShape([50, 50, 50], 2, 8)
+        (2, 2, 2)
+        >>> gb3._calcProcessShape([50, 50, 50], 2, 6)
+        (1, 2, 3)
+        >>> gb3._calcProcessShape([4, 4, 4], 2, 27)
+        (3, 3, 3)
 
-        return first, sec, self._packOverlap(first, sec)
+        An axis too short to give each block `overlap` cells is not split
+
+        >>> gb3._calcProcessShape([2, 8, 8], 2, 4)
+        (1, 2, 2)
+        """
+        def factorings(Nproc, dim):
+            if dim == 1:
+                yield (Nproc,)
+            else:
+                for blocks in range(1, Nproc + 1):
+                    if Nproc % blocks == 0:
+                        for rest in factorings(Nproc // blocks, dim - 1):
+                            yield (blocks,) + rest
+
+        def cost(processShape):
+            occupied = [self._calcOccupiedNodes(n, blocks, min(overlap, n))[1]
+                        for n, blocks in zip(ns, processShape)]
+            idle = Nproc - reduce(self._mult, occupied)
+            interfaces = 0
+            for axis, blocks in enumerate(occupied):
+                interfaces += (blocks - 1) * reduce(self._mult,
+                                                    ns[:axis] + ns[axis+1:], 1)
+            return (idle, interfaces, [-blocks for blocks in processShape[::-1]])
+
+        return min(factorings(Nproc, len(ns)), key=cost)
+
+    def _buildOverlap(self, overlap, procID, occupiedNodes, axis, n, owned):
+        """
+        Return the number of ghost cells below and above the block of
+        process `procID` along `axis`, which holds `owned` of its `n` cells.
+        """
+        return (overlap * (procID > 0) * (procID < occupiedNodes),
+                overlap * (procID < occupiedNodes - 1))
+
+    @staticmethod
+    def _periodicOverlap(overlap, n, owned):
+        """
+        Return the number of ghost cells below and above a block of `owned`
+        of the `n` cells along a periodic axis, where the ghost cells wrap
+        around the periodic boundary.
+
+        The block and its ghost cells are kept shorter than the axis, so
+        that no cell is a ghost on both sides and a local mesh is never as
+        large as the global one, which would make its values
+        indistinguishable from global values
+
+        >>> _AbstractGridBuilder._periodicOverlap(2, 8, 2)
+        (2, 2)
+        >>> _AbstractGridBuilder._periodicOverlap(2, 6, 2)
+        (1, 2)
+        >>> _AbstractGridBuilder._periodicOverlap(2, 6, 3)
+        (1, 1)
+        """
+        spare = max(n - owned - 1, 0)
+        first = min(overlap, spare // 2)
+        return (first, min(overlap, spare - first))
 
-    def _packOverlap(self, first, sec):
+    def _packOverlap(self, firsts, secs):
         raise NotImplementedError
 
-    def _packOffset(self, arg):
+    def _packOffset(self, args):
         raise NotImplementedError
 
     def _mult(self, x, y):
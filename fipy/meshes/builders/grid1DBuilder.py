@@ -14,11 +14,11 @@ class _Grid1DBuilder(_AbstractGridBuilder):
         kwargs["cacheOccupiedNodes"] = True
         super(_Grid1DBuilder, self).buildGridData(*args, **kwargs)
 
-    def _packOverlap(self, first, second):
-        return {'left': first, 'right': second}
+    def _packOverlap(self, firsts, seconds):
+        return {'left': firsts[0], 'right': seconds[0]}
 
-    def _packOffset(self, arg):
-        return arg
+    def _packOffset(self, args):
+        return args[0]
 
     @property
     def _specificGridData(self):
@@ -158,11 +158,12 @@ class _Grid2DBuilder(_AbstractGridBuilder):
                 cellFaceIDs[3,:] = cellFaceIDs[1,:] - 1
             return cellFaceIDs
 
-    def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom': first, 'top': second}
+    def _packOverlap(self, firsts, seconds):
+        return {'left': firsts[0], 'right': seconds[0],
+                'bottom': firsts[1], 'top': seconds[1]}
 
-    def _packOffset(self, arg):
-        return (0, arg)
+    def _packOffset(self, args):
+        return tuple(args)
 
 class _NonuniformGrid2DBuilder(_Grid2DBuilder):
 
@@ -133,12 +133,13 @@ class _Grid3DBuilder(_AbstractGridBuilder):
         return numerix.ravel(a)
 
 
-    def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom' : 0, 'top' : 0,
-                'front': first, 'back': second}
+    def _packOverlap(self, firsts, seconds):
+        return {'left': firsts[0], 'right': seconds[0],
+                'bottom' : firsts[1], 'top' : seconds[1],
+                'front': firsts[2], 'back': seconds[2]}
 
-    def _packOffset(self, arg):
-        return (0, 0, arg)
+    def _packOffset(self, args):
+        return tuple(args)
 
 class _NonuniformGrid3DBuilder(_Grid3DBuilder):
 
@@ -11,9 +11,9 @@ class _PeriodicGrid1DBuilder(_NonuniformGrid1DBuilder):
         return super(_PeriodicGrid1DBuilder, self).buildGridData(*args,
                                                                 **kwargs)
 
-    def _buildOverlap(self, overlap, procID, occupiedNodes):
+    def _buildOverlap(self, overlap, procID, occupiedNodes, axis, n, owned):
         if occupiedNodes == 1:
             return super(_PeriodicGrid1DBuilder, self)._buildOverlap(overlap,
-                     procID, occupiedNodes)
+                     procID, occupiedNodes, axis, n, owned)
         else:
-            return (overlap, overlap, {'left': overlap, 'right': overlap})
+            return (overlap, overlap)
@@ -0,0 +1,26 @@
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.meshes.builders.grid2DBuilder import _NonuniformGrid2DBuilder
+
+class _PeriodicGrid2DBuilder(_NonuniformGrid2DBuilder):
+    """
+    Builds a grid that wraps around along the axes in `periodicAxes`.
+
+    A process whose block is split along a periodic axis takes ghost cells
+    from across the periodic boundary, as well as from its neighbors, as
+    many as fit in the rest of the axis (see `_periodicOverlap()`).
+    """
+
+    def __init__(self, periodicAxes=(0, 1)):
+        self.periodicAxes = periodicAxes
+
+        super(_PeriodicGrid2DBuilder, self).__init__()
+
+    def _buildOverlap(self, overlap, procID, occupiedNodes, axis, n, owned):
+        if axis in self.periodicAxes and occupiedNodes > 1:
+            return self._periodicOverlap(overlap, n, owned)
+        else:
+            return super(_PeriodicGrid2DBuilder, self)._buildOverlap(overlap,
+                     procID, occupiedNodes, axis, n, owned)
@@ -50,8 +50,17 @@ class _DOffsets(object):
 
         for d, n, i in zip(ds, ns, range(len(ds))):
             if numerix.getShape(d) is not ():
-                offsetList.append(numerix.sum(d[0:offset[i]]))
-                newDs.append(d[offset[i]:offset[i] + n])
+                if offset[i] >= 0:
+                    offsetList.append(numerix.sum(d[0:offset[i]]))
+                else:
+                    # ghost cells of a periodic grid lie before the first
+                    # spacing, so wrap around
+                    offsetList.append(-numerix.sum(d[numerix.arange(offset[i], 0) % len(d)]))
+                if 0 <= offset[i] and offset[i] + n <= len(d):
+                    newDs.append(d[offset[i]:offset[i] + n])
+                else:
+                    # ... or after the last
+                    newDs.append(d[numerix.arange(offset[i], offset[i] + n) % len(d)])
             else:
                 if len(offset) == 1:
                     offsetList.append(d * offset[0])
@@ -0,0 +1,128 @@
+"""Where the values held by each process go in a global array
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+class _GlobalLayout(object):
+    """
+    Gathers the values of elements that each process owns into an array
+    of values for the whole, global mesh.
+
+    The number of elements on each process, the displacement of each
+    process's elements in the gathered buffer and the global IDs of the
+    elements are exchanged once, when the layout is created, so each
+    gather is a single collective on a NumPy buffer.
+
+        >>> from fipy import Grid1D
+        >>> from fipy.tools import serialComm
+        >>> mesh = Grid1D(nx=4, communicator=serialComm)
+        >>> layout = _GlobalLayout(mesh.communicator,
+        ...                        localIDs=numerix.array([0, 1, 2, 3]),
+        ...                        globalIDs=numerix.array([3, 2, 1, 0]),
+        ...                        numberOfElements=4)
+        >>> print layout.counts, layout.displacements
+        [4] [0]
+        >>> print layout.gather(numerix.array([[0., 1., 2., 3.],
+        ...                                    [4., 5., 6., 7.]]))
+        [[ 3.  2.  1.  0.]
+         [ 7.  6.  5.  4.]]
+        >>> print layout.gather(numerix.array([True, False, False, False]), root=0)
+        [False False False  True]
+
+    When the number of global elements is given, every one of them must
+    be owned by exactly one process
+
+        >>> _GlobalLayout(mesh.communicator,
+        ...               localIDs=numerix.array([0, 1, 2, 3]),
+        ...               globalIDs=numerix.array([3, 2, 1, 1]),
+        ...               numberOfElements=4)
+        Traceback (most recent call last):
+            ...
+        AssertionError: global IDs do not cover each of the 4 elements once
+
+    Otherwise, it is taken to be one more than the largest global ID and
+    nothing is checked, for elements that are not numbered globally on
+    every mesh
+
+        >>> layout = _GlobalLayout(mesh.communicator,
+        ...                        localIDs=numerix.array([0, 1, 2]),
+        ...                        globalIDs=numerix.array([2, 1, 1]))
+        >>> print layout.numberOfElements
+        3
+
+    :Parameters:
+      - `communicator`: the communicator the mesh is partitioned over
+      - `localIDs`: the local IDs of the elements owned by this process
+      - `globalIDs`: the global IDs of the same elements
+      - `numberOfElements`: the number of elements of the global mesh, if
+        `globalIDs` number them globally
+    """
+    def __init__(self, communicator, localIDs, globalIDs, numberOfElements=None):
+        self.communicator = communicator
+        self.localIDs = localIDs
+
+        self.counts = numerix.zeros((communicator.Nproc,), 'l')
+        communicator.Allgather(numerix.array([len(globalIDs)], 'l'), self.counts)
+        self.displacements = numerix.concatenate(([0], numerix.cumsum(self.counts)[:-1]))
+
+        self.globalIDs = numerix.empty((self.counts.sum(),), 'l')
+        communicator.Allgatherv(numerix.ascontiguousarray(globalIDs, 'l'), self.globalIDs,
+                                self.counts, self.displacements)
+
+        if numberOfElements is None:
+            if len(self.globalIDs) > 0:
+                numberOfElements = self.globalIDs.max() + 1
+            else:
+                numberOfElements = 0
+        else:
+            assert (len(self.globalIDs) == numberOfElements
+                    and (numerix.bincount(self.globalIDs, minlength=numberOfElements) == 1).all()), \
+              "global IDs do not cover each of the %d elements once" % numberOfElements
+        self.numberOfElements = numberOfElements
+
+    def gather(self, value, root=None):
+        """Return the global array of the values of the local elements
+        in `value`.
+
+        If `root` is given, only that process receives the global array and
+        the others return `None`.
+        """
+        value = numerix.asarray(value)
+        if value.shape[-1] != 0:
+            value = value[..., self.localIDs]
+
+        # the values of one element are sent together, so the elements go
+        # along the first axis of the buffers
+        sendbuf = numerix.ascontiguousarray(numerix.rollaxis(value, -1))
+
+        if root is None or self.communicator.procID == root:
+            recvbuf = numerix.empty((len(self.globalIDs),) + sendbuf.shape[1:],
+                                    dtype=sendbuf.dtype)
+        else:
+            recvbuf = None
+
+        if root is None:
+            self.communicator.Allgatherv(sendbuf, recvbuf,
+                                         self.counts, self.displacements)
+        else:
+            self.communicator.Gatherv(sendbuf, recvbuf,
+                                      self.counts, self.displacements, root=root)
+
+        if recvbuf is None:
+            return None
+
+        globalValue = numerix.empty(value.shape[:-1] + (self.numberOfElements,),
+                                    dtype=value.dtype)
+        globalValue[..., self.globalIDs] = numerix.rollaxis(recvbuf, 0, recvbuf.ndim)
+
+        return globalValue
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
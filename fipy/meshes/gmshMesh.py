@@ -15,6 +15,7 @@ from fipy.tests.doctestPlus import register_skipper
 
 from fipy.meshes.mesh import Mesh
 from fipy.meshes.mesh2D import Mesh2D
+from fipy.meshes.meshCache import _MeshCache
 from fipy.meshes.topologies.meshTopology import _MeshTopology
 
 from fipy.tools.debug import PRINT
@@ -25,6 +26,13 @@ __all__ = ["openMSHFile", "openPOSFile",
 
 DEBUG = False
 
+# number of nodes of each Gmsh element type
+_nodesPerElement = { 1: 2,  2: 3,  3: 4,  4: 4,  5: 8,  6: 6,  7: 5,  8: 3,
+                     9: 6, 10: 9, 11: 10, 12: 27, 13: 18, 14: 14, 15: 1, 16: 8,
+                    17: 20, 18: 15, 19: 13, 20: 9, 21: 10, 22: 12, 23: 15, 24: 15,
+                    25: 21, 26: 4, 27: 5, 28: 6, 29: 20, 30: 35, 31: 56, 92: 64,
+                    93: 125}
+
 def _checkForGmsh():
     hasGmsh = True
     try:
@@ -77,6 +85,25 @@ def gmshVersion(communicator=parallelComm):
 
     return communicator.bcast(verStr)
 
+def _gmshExecutable(communicator=parallelComm):
+    """Identify the `gmsh` program on the path by its location, size and
+    modification time, without running it, or return `None` if there is
+    none.
+    """
+    if communicator.procID == 0:
+        from distutils.spawn import find_executable
+        path = find_executable("gmsh")
+        if path is None:
+            identity = None
+        else:
+            path = os.path.realpath(path)
+            status = os.stat(path)
+            identity = (path, status.st_size, status.st_mtime)
+    else:
+        identity = None
+
+    return communicator.bcast(identity)
+
 def _gmshVersion(communicator=parallelComm):
     version = gmshVersion(communicator) or "0.0"
     return StrictVersion(version)
@@ -158,7 +185,11 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
                 else: # gmsh version is adequate for partitioning
                     gmshFlags += ["-part", "%d" % communicator.Nproc]
 
-            gmshFlags += ["-format", "msh"]
+            if communicator.Nproc > 1 and version >= StrictVersion("4.0"):
+                # partitions are only read from MSH 2 files
+                gmshFlags += ["-format", "msh2"]
+            else:
+                gmshFlags += ["-format", "msh"]
 
             if background is not None:
                 if communicator.procID == 0:
@@ -497,31 +528,6 @@ class MSHFile(GmshFile):
         self.fileobj.seek(0)
         return [float(x) for x in metaData]
 
-    def _isolateData(self, title):
-        """
-        Gets all data between $[title] and $End[title], writes
-        it out to its own file.
-        """
-        newF, newPath = tempfile.mkstemp(title, text=True)
-        newF = os.fdopen(newF, 'w')
-        try:
-            self._seekForHeader(title)
-        except Exception, e:
-            newF.close()
-            os.unlink(newPath)
-            raise
-
-        # extract the actual data within section
-        while True:
-            line = self.fileobj.readline()
-            if ("$End%s" % title) not in line:
-                newF.write(line)
-            else: break
-
-        self.fileobj.seek(0)
-        newF.close()
-        return newPath
-
     def _seekForHeader(self, title):
         """
         Iterate through a file until we end up at the section header
@@ -537,121 +543,440 @@ class MSHFile(GmshFile):
             else:
                 break # found header
 
+    def _sectionStart(self, contents, title, start=0):
+        """
+        Return the offset of the line after the header of section `title`
+        in `contents`, the whole file.
+        """
+        header = "$%s" % title
+        begin = contents.find(header, start)
+        while begin >= 0:
+            end = begin + len(header)
+            if ((begin == 0 or contents[begin - 1] == "\n")
+                and contents[end:end + 1] in ("\n", "\r")):
+                return contents.index("\n", end) + 1
+            begin = contents.find(header, end)
+
+        raise EOFError("No `%s' header found!" % title)
+
+    def _sectionText(self, contents, title):
+        """
+        Return the text of ASCII section `title`, between its header and
+        its end marker.
+        """
+        begin = self._sectionStart(contents, title)
+        end = contents.find("$End%s" % title, begin)
+        if end < 0:
+            raise EOFError("No `$End%s' found!" % title)
+        return contents[begin:end]
+
+    @staticmethod
+    def _tokensPerLine(text):
+        """
+        Return the number of whitespace separated tokens on each non-empty
+        line of `text`.
+
+            >>> print MSHFile._tokensPerLine("1 2 3\\n\\n 4  5\\r\\n6")
+            [3 2 1]
+        """
+        chars = nx.frombuffer(text, dtype=nx.uint8)
+        space = chars <= ord(" ")
+        starts = ~space
+        starts[1:] &= space[:-1]
+
+        ends = nx.nonzero(chars == ord("\n"))[0]
+        if len(chars) > 0 and chars[-1] != ord("\n"):
+            ends = nx.concatenate((ends, [len(chars)]))
+
+        counts = nx.concatenate(([0], nx.cumsum(starts)))
+        tokens = nx.diff(nx.concatenate(([0], counts[ends])))
+
+        return tokens[tokens > 0]
+
+    def _readNodes(self, contents):
+        """
+        Return the Gmsh IDs of the nodes and their (N, 3) coordinates.
+        """
+        if self.fileType == 0:
+            text = self._sectionText(contents, "Nodes")
+            values = nx.fromstring(text, dtype=float, sep=" ")
+
+            if self.version < 4:
+                values = values[1:].reshape((-1, 4))
+                return values[..., 0].astype(nx.INT_DTYPE), values[..., 1:4]
+
+            tags = []
+            coords = []
+            if self.version < 4.1:
+                pos = 2
+            else:
+                pos = 4
+            for block in range(int(values[0])):
+                if self.version < 4.1:
+                    tag, dim, parametric, n = values[pos:pos + 4].astype(int)
+                else:
+                    dim, tag, parametric, n = values[pos:pos + 4].astype(int)
+                pos += 4
+
+                numCoords = 3 + parametric * dim
+                if self.version < 4.1:
+                    nodes = values[pos:pos + n * (1 + numCoords)].reshape((n, 1 + numCoords))
+                    tags.append(nodes[..., 0])
+                    coords.append(nodes[..., 1:4])
+                    pos += n * (1 + numCoords)
+                else:
+                    tags.append(values[pos:pos + n])
+                    pos += n
+                    coords.append(values[pos:pos + n * numCoords].reshape((n, numCoords))[..., :3])
+                    pos += n * numCoords
+        else:
+            pos = self._sectionStart(contents, "Nodes")
+
+            if self.version < 4:
+                end = contents.index("\n", pos)
+                n = int(contents[pos:end])
+                nodes = nx.frombuffer(contents,
+                                      dtype=[("tag", self._int), ("xyz", self._double, 3)],
+                                      count=n, offset=end + 1)
+                return nodes["tag"].astype(nx.INT_DTYPE), nodes["xyz"]
+
+            tags = []
+            coords = []
+            if self.version < 4.1:
+                numBlocks = self._fromBuffer(contents, self._sizeT, 2, pos)[0]
+                pos += 2 * self._sizeT.itemsize
+            else:
+                numBlocks = self._fromBuffer(contents, self._sizeT, 4, pos)[0]
+                pos += 4 * self._sizeT.itemsize
+            for block in range(numBlocks):
+                header = self._fromBuffer(contents, self._int, 3, pos)
+                pos += 3 * self._int.itemsize
+                n = int(self._fromBuffer(contents, self._sizeT, 1, pos)[0])
+                pos += self._sizeT.itemsize
+
+                if self.version < 4.1:
+                    tag, dim, parametric = header
+                    numCoords = 3 + parametric * dim
+                    nodes = self._fromBuffer(contents,
+                                             [("tag", self._int), ("xyz", self._double, numCoords)],
+                                             n, pos)
+                    pos += n * nodes.dtype.itemsize
+                    tags.append(nodes["tag"])
+                    coords.append(nodes["xyz"][..., :3])
+                else:
+                    dim, tag, parametric = header
+                    numCoords = 3 + parametric * dim
+                    tags.append(self._fromBuffer(contents, self._sizeT, n, pos))
+                    pos += n * self._sizeT.itemsize
+                    xyz = self._fromBuffer(contents, self._double, n * numCoords, pos)
+                    pos += n * numCoords * self._double.itemsize
+                    coords.append(xyz.reshape((n, numCoords))[..., :3])
+
+        if len(tags) == 0:
+            return nx.zeros((0,), dtype=nx.INT_DTYPE), nx.zeros((0, 3))
+
+        return (nx.concatenate(tags).astype(nx.INT_DTYPE),
+                nx.concatenate(coords))
+
+    def _readElements(self, contents):
+        """
+        Return a list of blocks of elements of the same type and number of
+        tags.  Each block is a tuple of the position of each element in the
+        file, its Gmsh ID, its type, its physical entity, its geometrical
+        entity, any remaining tags, and its nodes.
+        """
+        blocks = []
+        if self.version < 4:
+            if self.fileType == 0:
+                text = self._sectionText(contents, "Elements")
+                count, text = text.split("\n", 1)
+                tokens = self._tokensPerLine(text)
+                values = nx.fromstring(text, dtype=nx.INT_DTYPE, sep=" ")
+                starts = nx.cumsum(tokens) - tokens
+                numTags = values[starts + 2]
+
+                kinds = numTags * (tokens.max() + 1) + tokens
+                for kind in nx.unique(kinds):
+                    positions = nx.nonzero(kinds == kind)[0]
+                    n = tokens[positions[0]]
+                    rows = values[starts[positions][..., nx.newaxis] + nx.arange(n)]
+                    blocks.append((positions, rows, numTags[positions[0]]))
+            else:
+                pos = self._sectionStart(contents, "Elements")
+                end = contents.index("\n", pos)
+                numElements = int(contents[pos:end])
+                pos = end + 1
+                read = 0
+                while read < numElements:
+                    elType, n, numTags = self._fromBuffer(contents, self._int, 3, pos)
+                    pos += 3 * self._int.itemsize
+                    width = 1 + numTags + self._nodesPerElement(elType)
+                    rows = self._fromBuffer(contents, self._int, n * width, pos).reshape((n, width))
+                    pos += n * width * self._int.itemsize
+                    # insert the element type, as in the ASCII format
+                    rows = nx.concatenate((rows[..., :1],
+                                           nx.zeros((n, 2), dtype=rows.dtype) + (elType, numTags),
+                                           rows[..., 1:]), axis=1)
+                    blocks.append((nx.arange(read, read + n), rows, numTags))
+                    read += n
+
+            elementBlocks = []
+            for positions, rows, numTags in blocks:
+                rows = rows.astype(nx.INT_DTYPE)
+                tags = rows[..., 3:3 + numTags]
+                if numTags >= 2:
+                    physical = tags[..., 0]
+                    geometrical = tags[..., 1]
+                    tags = tags[..., 2:]
+                else:
+                    physical = geometrical = -nx.ones(positions.shape, dtype=nx.INT_DTYPE)
+                elementBlocks.append((positions, rows[..., 0], rows[..., 1],
+                                      physical, geometrical, tags, rows[..., 3 + numTags:]))
+
+            return elementBlocks
+
+        physicalEntities = self._readEntities(contents)
+
+        if self.fileType == 0:
+            values = nx.fromstring(self._sectionText(contents, "Elements"),
+                                   dtype=nx.INT_DTYPE, sep=" ")
+            if self.version < 4.1:
+                pos = 2
+            else:
+                pos = 4
+            numBlocks = values[0]
+        else:
+            pos = self._sectionStart(contents, "Elements")
+            if self.version < 4.1:
+                numBlocks = self._fromBuffer(contents, self._sizeT, 2, pos)[0]
+                pos += 2 * self._sizeT.itemsize
+                dataType = self._int
+            else:
+                numBlocks = self._fromBuffer(contents, self._sizeT, 4, pos)[0]
+                pos += 4 * self._sizeT.itemsize
+                dataType = self._sizeT
+
+        elementBlocks = []
+        read = 0
+        for block in range(numBlocks):
+            if self.fileType == 0:
+                header = values[pos:pos + 4]
+                pos += 4
+            else:
+                header = self._fromBuffer(contents, self._int, 3, pos)
+                pos += 3 * self._int.itemsize
+                header = list(header) + [self._fromBuffer(contents, self._sizeT, 1, pos)[0]]
+                pos += self._sizeT.itemsize
+
+            if self.version < 4.1:
+                tag, dim, elType, n = [int(x) for x in header]
+            else:
+                dim, tag, elType, n = [int(x) for x in header]
+
+            width = 1 + self._nodesPerElement(elType)
+            if self.fileType == 0:
+                rows = values[pos:pos + n * width]
+                pos += n * width
+            else:
+                rows = self._fromBuffer(contents, dataType, n * width, pos)
+                pos += n * width * dataType.itemsize
+            rows = rows.reshape((n, width)).astype(nx.INT_DTYPE)
+
+            ones = nx.ones((n,), dtype=nx.INT_DTYPE)
+            elementBlocks.append((nx.arange(read, read + n), rows[..., 0], elType * ones,
+                                  physicalEntities.get((dim, tag), 0) * ones, tag * ones,
+                                  nx.zeros((n, 0), dtype=nx.INT_DTYPE), rows[..., 1:]))
+            read += n
+
+        return elementBlocks
+
+    def _readEntities(self, contents):
+        """
+        Return the first physical entity of each `(dimension, tag)` geometrical
+        entity of an MSH 4 file.
+        """
+        physicalEntities = {}
+        try:
+            pos = self._sectionStart(contents, "Entities")
+        except EOFError:
+            return physicalEntities
+
+        if self.fileType == 0:
+            tokens = self._sectionText(contents, "Entities").split()
+            counts = [int(x) for x in tokens[:4]]
+            pos = 4
+            for dim in range(4):
+                for entity in range(counts[dim]):
+                    tag = int(tokens[pos])
+                    if dim == 0 and self.version >= 4.1:
+                        pos += 4
+                    else:
+                        pos += 7
+                    numPhysicals = int(tokens[pos])
+                    if numPhysicals > 0:
+                        physicalEntities[(dim, tag)] = int(tokens[pos + 1])
+                    pos += 1 + numPhysicals
+                    if dim > 0:
+                        pos += 1 + int(tokens[pos])
+        else:
+            counts = self._fromBuffer(contents, self._sizeT, 4, pos)
+            pos += 4 * self._sizeT.itemsize
+            for dim in range(4):
+                for entity in range(counts[dim]):
+                    tag = int(self._fromBuffer(contents, self._int, 1, pos)[0])
+                    pos += self._int.itemsize
+                    if dim == 0 and self.version >= 4.1:
+                        pos += 3 * self._double.itemsize
+                    else:
+                        pos += 6 * self._double.itemsize
+                    numPhysicals = int(self._fromBuffer(contents, self._sizeT, 1, pos)[0])
+                    pos += self._sizeT.itemsize
+                    if numPhysicals > 0:
+                        physicalEntities[(dim, tag)] = int(self._fromBuffer(contents, self._int, 1, pos)[0])
+                    pos += numPhysicals * self._int.itemsize
+                    if dim > 0:
+                        numBounds = int(self._fromBuffer(contents, self._sizeT, 1, pos)[0])
+                        pos += self._sizeT.itemsize + numBounds * self._int.itemsize
+
+        return physicalEntities
+
+    def _fromBuffer(self, contents, dtype, count, offset):
+        return nx.frombuffer(contents, dtype=dtype, count=count, offset=offset)
+
+    def _nodesPerElement(self, elType):
+        try:
+            return _nodesPerElement[elType]
+        except KeyError:
+            raise GmshException("Gmsh element type %d is not supported" % elType)
+
+    def _setBinaryTypes(self, contents):
+        """
+        Binary files are written with the byte order of the machine that
+        wrote them, which is found from the integer 1 after `$MeshFormat`.
+        """
+        pos = self._sectionStart(contents, "MeshFormat")
+        pos = contents.index("\n", pos) + 1
+        if nx.frombuffer(contents, dtype="<i4", count=1, offset=pos)[0] == 1:
+            byteOrder = "<"
+        else:
+            byteOrder = ">"
+
+        self._int = nx.dtype(byteOrder + "i4")
+        self._double = nx.dtype(byteOrder + "f8")
+        self._sizeT = nx.dtype(byteOrder + "u%d" % self.dataSize)
+
     def _deriveCellsAndFaces(self, cellsToVertIDs, shapeTypes, numCells):
         """
-        Uses element information obtained from `_parseElementFile` to deliver
+        Uses element information obtained from `_parseElements` to deliver
         `facesToVertices` and `cellsToFaces`.
+
+        Faces are numbered in the order they are first encountered, cell by
+        cell. Also returns the sorted vertices of each face, padded at the
+        front with -2, to identify them.
         """
 
         allShapes  = nx.unique(shapeTypes).tolist()
         maxFaces   = max([self.numFacesPerCell[x] for x in allShapes])
+        numVertices = (cellsToVertIDs >= 0).sum(axis=-1)
 
         # `cellsToFaces` must be padded with -1; see mesh.py
-        currNumFaces = 0
         cellsToFaces = nx.ones((numCells, maxFaces), 'l') * -1
-        facesDict    = {}
-        uniqueFaces  = []
-
-        # we now build `cellsToFaces` and `uniqueFaces`,
-        # the latter will result in `facesToVertices`.
-        for cellIdx in range(numCells):
-            shapeType = shapeTypes[cellIdx]
-            cell = cellsToVertIDs[cellIdx]
-
-            if shapeType in [5, 12, 17]: # hexahedron
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3], # ordering of vertices gleaned from
-                                                                 [4, 5, 6, 7], # a one-cube Grid3D example
-                                                                 [0, 1, 5, 4],
-                                                                 [3, 2, 6, 7],
-                                                                 [0, 3, 7, 4],
-                                                                 [1, 2, 6, 5]])
-            elif shapeType in [6, 13, 18]: # prism
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2],
-                                                                 [5, 4, 3],
-                                                                 [3, 4, 1, 0],
-                                                                 [4, 5, 2, 1],
-                                                                 [5, 3, 0, 2]])
-            elif shapeType in [7, 14, 19]: # pyramid
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3],
-                                                                 [0, 1, 4],
-                                                                 [1, 2, 4],
-                                                                 [2, 3, 4],
-                                                                 [3, 0, 4]])
-            else:
-                if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
-                    faceLength = 2 # triangle
-                elif shapeType in [3, 10, 16]:
-                    faceLength = 2 # quadrangle
-                elif shapeType in [4, 11, 29, 30, 31]:
-                    faceLength = 3 # tetrahedron
-
-                faces = self._extractRegularFaces(cell=cell,
-                                                  faceLength=faceLength,
-                                                  facesPerCell=self.numFacesPerCell[shapeType])
-
-            for faceIdx in range(len(faces)):
-                # NB: currFace is sorted for the key to spot duplicates
-                currFace = faces[faceIdx]
-                keyStr   = ' '.join([str(x) for x in sorted(currFace)])
-
-                if keyStr in facesDict:
-                    cellsToFaces[cellIdx][faceIdx] = facesDict[keyStr]
-                else: # new face
-                    facesDict[keyStr] = currNumFaces
-                    cellsToFaces[cellIdx][faceIdx] = currNumFaces
-                    uniqueFaces.append(currFace)
-                    currNumFaces += 1
-
-        # pad short faces with -1
-        maxFaceLen = max([len(f) for f in uniqueFaces])
-        uniqueFaces = [[-1] * (maxFaceLen - len(f)) + f for f in uniqueFaces]
-
-        facesToVertices = nx.array(uniqueFaces, dtype=nx.INT_DTYPE)
-
-        return facesToVertices.swapaxes(0,1)[::-1], cellsToFaces.swapaxes(0,1).copy('C'), facesDict
 
-    def _translateNodesToVertices(self, entitiesNodes, vertexMap):
-        """Translates entitiesNodes from Gmsh node IDs to `vertexCoords` indices.
+        # gather every face of every cell, with its position in `cellsToFaces`
+        positions = []
+        faces = []
+        for shapeType in allShapes:
+            ofShape = (shapeTypes == shapeType)
+            for length in nx.unique(numVertices[ofShape]):
+                cellIDs = nx.nonzero(ofShape & (numVertices == length))[0]
+                cells = cellsToVertIDs[cellIDs]
+                for faceIdx, ordering in enumerate(self._faceOrderings(shapeType, length)):
+                    face = -nx.ones((len(cellIDs), 4), dtype=nx.INT_DTYPE)
+                    face[..., :len(ordering)] = nx.take(cells, ordering, axis=-1)
+                    positions.append(cellIDs * maxFaces + faceIdx)
+                    faces.append(face)
+
+        # visit the faces cell by cell
+        positions = nx.concatenate(positions)
+        order = nx.argsort(positions, kind='mergesort')
+        positions = positions[order]
+        faces = nx.concatenate(faces)[order]
+
+        # NB: faces are sorted to spot duplicates
+        keys = nx.sort(nx.where(faces < 0, -2, faces), axis=-1)
+        first, inverse = _uniqueRows(keys)
+
+        # number faces in the order they were first encountered
+        order = nx.argsort(first, kind='mergesort')
+        faceIDs = nx.empty(order.shape, dtype='l')
+        faceIDs[order] = nx.arange(len(order))
+        cellsToFaces.flat[positions] = faceIDs[inverse]
+
+        uniqueFaces = faces[first[order]]
+        keys = keys[first[order]]
+
+        # pad short faces with -1 at the front
+        lengths = (uniqueFaces >= 0).sum(axis=-1)
+        maxFaceLen = lengths.max()
+        facesToVertices = -nx.ones((len(uniqueFaces), maxFaceLen), dtype=nx.INT_DTYPE)
+        for length in nx.unique(lengths):
+            ofLength = (lengths == length)
+            facesToVertices[ofLength, maxFaceLen - length:] = uniqueFaces[ofLength, :length]
+
+        return (facesToVertices.swapaxes(0,1)[::-1],
+                cellsToFaces.swapaxes(0,1).copy('C'),
+                keys[..., 4 - maxFaceLen:])
+
+    def _faceOrderings(self, shapeType, numVertices):
         """
-        entitiesVertices = []
-
-        for entity in entitiesNodes:
-            try:
-                vertIndices = vertexMap[nx.array(entity)]
-            except IndexError:
-                vertIndices = nx.ones((len(entity),), 'l') * -1
-            entitiesVertices.append(vertIndices)
+        Return the positions, within a cell of `shapeType` with `numVertices`
+        vertices, of the vertices of each of its faces.
+        """
+        if shapeType in [5, 12, 17]: # hexahedron
+            return [[0, 1, 2, 3], # ordering of vertices gleaned from
+                    [4, 5, 6, 7], # a one-cube Grid3D example
+                    [0, 1, 5, 4],
+                    [3, 2, 6, 7],
+                    [0, 3, 7, 4],
+                    [1, 2, 6, 5]]
+        elif shapeType in [6, 13, 18]: # prism
+            return [[0, 1, 2],
+                    [5, 4, 3],
+                    [3, 4, 1, 0],
+                    [4, 5, 2, 1],
+                    [5, 3, 0, 2]]
+        elif shapeType in [7, 14, 19]: # pyramid
+            return [[0, 1, 2, 3],
+                    [0, 1, 4],
+                    [1, 2, 4],
+                    [2, 3, 4],
+                    [3, 0, 4]]
+        else:
+            if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
+                faceLength = 2 # triangle
+            elif shapeType in [3, 10, 16]:
+                faceLength = 2 # quadrangle
+            elif shapeType in [4, 11, 29, 30, 31]:
+                faceLength = 3 # tetrahedron
 
-        return entitiesVertices
+            # we may wrap
+            return [[(i + j) % numVertices for j in range(faceLength)]
+                    for i in range(self.numFacesPerCell[shapeType])]
 
-    def _extractRegularFaces(self, cell, faceLength, facesPerCell):
-        """Return faces for a regular poly(gon|hedron)
+    def _translateNodesToVertices(self, entitiesNodes, vertexMap):
+        """Translates entitiesNodes from Gmsh node IDs to `vertexCoords` indices.
 
-        Given `cell`, defined by node IDs, returns an array of
-        `facesPerCell` faces of length `faceLength` in terms of nodes.
-        """
-        faces = []
-        for i in range(facesPerCell):
-            aFace = []
-            for j in range(faceLength):
-                aVertex = (i + j) % len(cell) # we may wrap
-                aFace.append(int(cell[aVertex]))
-            faces.append(aFace)
-        return faces
-
-    def _extractOrderedFaces(self, cell, faceOrderings):
-        """Return faces for a 8-node hexahedron cell.
+        Padding is translated to -2. Nodes that are not vertices are -1, as
+        are all the nodes of an entity with a node beyond `vertexMap`.
         """
-        def orderingToFace(vertList):
-            aFace = []
-            for i in vertList:
-                aFace.append(int(cell[i]))
-            return aFace
+        present = (entitiesNodes >= 0)
+        outside = ((entitiesNodes >= len(vertexMap)) & present).any(axis=-1)
+        entitiesVertices = nx.where(present,
+                                    nx.take(vertexMap, nx.clip(entitiesNodes, 0, len(vertexMap) - 1)),
+                                    -2)
+        entitiesVertices[outside] = nx.where(present[outside], -1, -2)
 
-        return [orderingToFace(o) for o in faceOrderings]
+        return entitiesVertices
 
     def read(self):
         """
@@ -662,162 +987,156 @@ class MSHFile(GmshFile):
         3. Build faces
         4. Build cellsToFaces
 
-        Isolate relevant data into three files, store in
-        `self.nodesPath` for $Nodes,
-        `self.elemsPath` for $Elements.
-        `self.namesFile` for $PhysicalNames.
+        The $Nodes, $Elements, $PhysicalNames and, for MSH 4, $Entities
+        sections are parsed in bulk. MSH 2 and MSH 4, in ASCII or binary,
+        are supported.
 
         Returns vertexCoords, facesToVertexID, cellsToFaceID,
                 cellGlobalIDMap, ghostCellGlobalIDMap.
         """
         self.version, self.fileType, self.dataSize = self._getMetaData()
-        self.nodesPath = self._isolateData("Nodes")
-        self.elemsPath = self._isolateData("Elements")
-        try:
-            self.namesPath = self._isolateData("PhysicalNames")
-        except EOFError, e:
-            self.namesPath = None
 
-        try:
-            if self.dimensions is None:
-                nodesFile = open(self.nodesPath, 'r')
-                nodesFile.readline() # skip number of nodes
+        if self.version >= 5:
+            raise GmshException("Gmsh MSH file format version %g is not supported" % self.version)
+        elif self.version >= 4 and self.communicator.Nproc > 1:
+            raise GmshException("Partitioned Gmsh MSH files must be in format version 2")
 
-                # We assume we have a 2D file unless we find a node
-                # with a non-zero Z coordinate
-                self.dimensions = 2
-                for node in nodesFile:
-                    line   = node.split()
+        self.fileobj.seek(0)
+        contents = self.fileobj.read()
+        self.fileobj.seek(0)
 
-                    newVert = [float(x) for x in line]
+        if self.fileType != 0:
+            self._setBinaryTypes(contents)
 
-                    if newVert[2] != 0.0:
-                        self.dimensions = 3
-                        break
+        parprint("Parsing nodes.")
+        nodeIDs, nodeCoords = self._readNodes(contents)
 
-                nodesFile.close()
-
-            self.coordDimensions = self.coordDimensions or self.dimensions
-
-            # we need a conditional here so we don't pick up 2D shapes in 3D
-            if self.dimensions == 2:
-                self.numVertsPerFace = {1: 2, # 2-node line
-                                        8: 2} # 3-node line
-                self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 faces)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-            elif self.dimensions == 3:
-                self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 vertices)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-                self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
-                                        11: 4, # 10-node tetrahedron (we only read 1st 4)
-                                        29: 4, # 20-node tetrahedron (we only read 1st 4)
-                                        30: 4, # 35-node tetrahedron (we only read 1st 4)
-                                        31: 4, # 56-node tetrahedron (we only read 1st 4)
-                                         5: 6, # 8-node hexahedron (6 faces)
-                                        12: 6, # 27-node tetrahedron (we only read 1st 6)
-                                        17: 6, # 20-node tetrahedron (we only read 1st 6)
-                                         6: 5, # 6-node prism (5 faces)
-                                        13: 5, # 18-node prism (we only read 1st 6)
-                                        18: 5, # 15-node prism (we only read 1st 6)
-                                         7: 5, # 5-node pyramid (5 faces)
-                                        14: 5, # 14-node pyramid (we only read 1st 5)
-                                        19: 5} # 13-node pyramid (we only read 1st 5)
+        if self.dimensions is None:
+            # We assume we have a 2D file unless we find a node
+            # with a non-zero Z coordinate
+            if (nodeCoords[..., 2] != 0.0).any():
+                self.dimensions = 3
             else:
-                raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
-
-            parprint("Parsing elements.")
-            (cellsData,
-             ghostsData,
-             facesData) = self._parseElementFile()
-
-            cellsToGmshVerts = cellsData.nodes + ghostsData.nodes
-            numCellsTotal    = len(cellsData.nodes) + len(ghostsData.nodes)
-            allShapeTypes    = cellsData.shapes + ghostsData.shapes
-            allShapeTypes    = nx.array(allShapeTypes)
-            allShapeTypes    = nx.delete(allShapeTypes, nx.s_[numCellsTotal:])
-            self.physicalCellMap = nx.array(cellsData.physicalEntities
-                                            + ghostsData.physicalEntities)
-            self.geometricalCellMap = nx.array(cellsData.geometricalEntities
-                                               + ghostsData.geometricalEntities)
-
-            if numCellsTotal < 1:
-                errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
-                errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
-                raise GmshException(errStr)
-
-            parprint("Recovering coords.")
-            parprint("numcells %d" % numCellsTotal)
-            vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellsToGmshVerts)
-
-            # translate Gmsh IDs to `vertexCoord` indices
-            cellsToVertIDs = self._translateNodesToVertices(cellsToGmshVerts,
-                                                            vertIDtoIdx)
-
-            parprint("Building cells and faces.")
-            (facesToV,
-             cellsToF,
-             facesDict) = self._deriveCellsAndFaces(cellsToVertIDs,
-                                                    allShapeTypes,
-                                                    numCellsTotal)
-
-            # cell entities were easy to record on parsing
-            # but we don't use Gmsh faces, so we need to correlate the nodes
-            # that make up the Gmsh faces with the vertex IDs of the FiPy faces
-            # so that we can check if any are named
-            faceEntitiesDict = dict()
+                self.dimensions = 2
 
+        self.coordDimensions = self.coordDimensions or self.dimensions
+
+        # we need a conditional here so we don't pick up 2D shapes in 3D
+        if self.dimensions == 2:
+            self.numVertsPerFace = {1: 2, # 2-node line
+                                    8: 2} # 3-node line
+            self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 faces)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+        elif self.dimensions == 3:
+            self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 vertices)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+            self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
+                                    11: 4, # 10-node tetrahedron (we only read 1st 4)
+                                    29: 4, # 20-node tetrahedron (we only read 1st 4)
+                                    30: 4, # 35-node tetrahedron (we only read 1st 4)
+                                    31: 4, # 56-node tetrahedron (we only read 1st 4)
+                                     5: 6, # 8-node hexahedron (6 faces)
+                                    12: 6, # 27-node tetrahedron (we only read 1st 6)
+                                    17: 6, # 20-node tetrahedron (we only read 1st 6)
+                                     6: 5, # 6-node prism (5 faces)
+                                    13: 5, # 18-node prism (we only read 1st 6)
+                                    18: 5, # 15-node prism (we only read 1st 6)
+                                     7: 5, # 5-node pyramid (5 faces)
+                                    14: 5, # 14-node pyramid (we only read 1st 5)
+                                    19: 5} # 13-node pyramid (we only read 1st 5)
+        else:
+            raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
+
+        parprint("Parsing elements.")
+        (cellsData,
+         ghostsData,
+         facesData) = self._parseElements(self._readElements(contents))
+
+        allCells = cellsData + ghostsData
+        numCellsTotal = len(allCells)
+        self.physicalCellMap = allCells.physicalEntities
+        self.geometricalCellMap = allCells.geometricalEntities
+
+        if numCellsTotal < 1:
+            errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
+            errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
+            raise GmshException(errStr)
+
+        parprint("Recovering coords.")
+        parprint("numcells %d" % numCellsTotal)
+        vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(allCells.nodes, nodeIDs, nodeCoords)
+
+        # translate Gmsh IDs to `vertexCoord` indices
+        cellsToVertIDs = self._translateNodesToVertices(allCells.nodes,
+                                                        vertIDtoIdx)
+
+        parprint("Building cells and faces.")
+        (facesToV,
+         cellsToF,
+         faceKeys) = self._deriveCellsAndFaces(cellsToVertIDs,
+                                               allCells.shapes,
+                                               numCellsTotal)
+
+        # cell entities were easy to record on parsing
+        # but we don't use Gmsh faces, so we need to correlate the nodes
+        # that make up the Gmsh faces with the vertex IDs of the FiPy faces
+        # so that we can check if any are named
+        self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+        self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+
+        if len(facesData) > 0:
             # translate Gmsh IDs to `vertexCoord` indices
             facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
                                                             vertIDtoIdx)
-
-            for face, physicalEntity, geometricalEntity in zip(facesToVertIDs,
-                                                               facesData.physicalEntities,
-                                                               facesData.geometricalEntities):
-                faceEntitiesDict[' '.join([str(x) for x in sorted(face)])] = (physicalEntity, geometricalEntity)
-
-            self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            for face in facesDict.keys():
-                # not all faces are necessarily tagged
-                if face in faceEntitiesDict:
-                    self.physicalFaceMap[facesDict[face]] = faceEntitiesDict[face][0]
-                    self.geometricalFaceMap[facesDict[face]] = faceEntitiesDict[face][1]
-
-            self.physicalNames = self._parseNamesFile()
-
-        finally:
-            os.unlink(self.nodesPath)
-            os.unlink(self.elemsPath)
-            if self.namesPath is not None:
-                os.unlink(self.namesPath)
-
-        # convert lists of cell vertices to a properly oriented masked array
-        maxVerts = max([len(v) for v in cellsToVertIDs])
-        # ticket:539 - NumPy 1.7 casts to array before concatenation and empty array defaults to float
-        cellsToVertIDs = [nx.concatenate((v, nx.array([-1] * (maxVerts-len(v)), dtype=nx.INT_DTYPE))) for v in cellsToVertIDs]
+            gmshKeys = nx.sort(facesToVertIDs, axis=-1)
+
+            width = max(faceKeys.shape[-1], gmshKeys.shape[-1])
+            keys = -2 * nx.ones((len(faceKeys) + len(gmshKeys), width), dtype=nx.INT_DTYPE)
+            keys[:len(faceKeys), width - faceKeys.shape[-1]:] = faceKeys
+            keys[len(faceKeys):, width - gmshKeys.shape[-1]:] = gmshKeys
+            first, inverse = _uniqueRows(keys)
+
+            # the last Gmsh face that matches each FiPy face wins
+            gmshFaces = inverse[len(faceKeys):]
+            order = nx.lexsort((nx.arange(len(gmshFaces)), gmshFaces))
+            last = nx.ones(order.shape, dtype=bool)
+            last[:-1] = gmshFaces[order][1:] != gmshFaces[order][:-1]
+            matches = -nx.ones(first.shape, dtype=nx.INT_DTYPE)
+            matches[gmshFaces[order][last]] = order[last]
+
+            matches = matches[inverse[:len(faceKeys)]]
+            named = (matches >= 0)
+            self.physicalFaceMap[named] = facesData.physicalEntities[matches[named]]
+            self.geometricalFaceMap[named] = facesData.geometricalEntities[matches[named]]
+
+        self.physicalNames = self._parsePhysicalNames(contents)
+
+        # convert padded cell vertices to a properly oriented masked array
+        maxVerts = (cellsToVertIDs >= 0).sum(axis=-1).max()
+        cellsToVertIDs = nx.where(cellsToVertIDs[..., :maxVerts] < 0, -1, cellsToVertIDs[..., :maxVerts])
         cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs, value=-1).swapaxes(0,1)
 
         parprint("Done with cells and faces.")
         return (vertexCoords, facesToV, cellsToF,
-                cellsData.idmap, ghostsData.idmap,
+                cellsData.idmap.tolist(), ghostsData.idmap.tolist(),
                 cellsToVertIDs)
 
     def write(self, obj, time=0.0, timeindex=0):
@@ -947,50 +1266,30 @@ class MSHFile(GmshFile):
 
         self.fileobj.write("$EndElementData\n")
 
-    def _vertexCoordsAndMap(self, cellsToGmshVerts):
+    def _vertexCoordsAndMap(self, cellsToGmshVerts, nodeIDs, nodeCoords):
         """
         Returns `vertexCoords` and mapping from Gmsh ID to `vertexCoords`
         indices (same as in MSHFile).
 
-        Unlike parent, doesn't use genfromtxt
-        because we want to avoid loading the entire msh file into memory.
+        Only the nodes that are vertices of cells are kept, in the order of
+        their Gmsh IDs.
         """
-        allVerts     = [v for c in cellsToGmshVerts for v in c] # flatten
-        allVerts     = nx.unique(nx.array(allVerts, dtype=nx.INT_DTYPE)) # remove dups
-        allVerts     = nx.sort(allVerts)
+        allVerts     = nx.unique(cellsToGmshVerts[cellsToGmshVerts >= 0]) # sorted, without dups
         maxVertIdx   = allVerts[-1] + 1 # add one to offset zero
         vertGIDtoIdx = nx.ones(maxVertIdx, 'l') * -1 # gmsh ID -> vertexCoords idx
-        vertexCoords = nx.empty((len(allVerts), self.coordDimensions))
-        nodeCount    = 0
 
         # establish map. This works because allVerts is a sorted set.
         vertGIDtoIdx[allVerts] = nx.arange(len(allVerts))
 
-        nodesFile = open(self.nodesPath, 'r')
-        nodesFile.readline() # skip number of nodes
-
-        # now we walk through node file with a sorted unique list of vertices
-        # in hand. When we encounter 0th element in `allVerts`, save it
-        # to `vertexCoords` then pop its ID off `allVerts`.
-        for node in nodesFile:
-            line   = node.split()
-            nodeID = int(line[0])
-
-            if nodeID == allVerts[nodeCount]:
-                newVert = [float(x) for x in line[1:self.coordDimensions+1]]
-                vertexCoords[nodeCount,:] = nx.array(newVert)
-                nodeCount += 1
-
-            if len(allVerts) == nodeCount:
-                break
-
-        nodesFile.close()
+        order = nx.argsort(nodeIDs, kind='mergesort')
+        found = nx.searchsorted(nodeIDs[order], allVerts)
+        vertexCoords = nodeCoords[order[nx.clip(found, 0, len(order) - 1)], :self.coordDimensions]
 
         # transpose for FiPy
         transCoords = vertexCoords.swapaxes(0,1)
         return transCoords, vertGIDtoIdx
 
-    def _parseElementFile(self):
+    def _parseElements(self, elementBlocks):
         """
         Return three objects, the first for non-ghost cells, the second for
         ghost cells, and the third for faces.
@@ -999,149 +1298,125 @@ class MSHFile(GmshFile):
         calculation is consolidated here: if we were ever to need to CALCULATE
         GHOST CELLS OURSELVES, the only code we'd have to change is in here.
         """
-
-        def _parseTags(offset, currLineInts):
-            if offset == -1:
-                # if first valid shape
-                offset = currLineInts[0]
-
-            numTags = currLineInts[2]
-            tags    = currLineInts[3:(3+numTags)]
-
-            # the partition tags for don't seem to always be present
-            # and don't always make much sense when they are
-
-            if len(tags) >= 2:
-                physicalEntity = tags.pop(0)
-                geometricalEntity = tags.pop(0)
-            else:
-                physicalEntity = geometricalEntity = -1
-
-            return offset, tags, physicalEntity, geometricalEntity
-
-
-        cellsData = _ElementData()
-        ghostsData = _ElementData()
-        facesData = _ElementData()
-
-        cellOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        faceOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
         pid = self.communicator.procID + 1
 
-        elemsFile = open(self.elemsPath, 'r')
-
-        elemsFile.readline() # skip number of elements
-        for el in elemsFile:
-            currLineInts = [int(x) for x in el.split()]
-            elemType     = currLineInts[1]
-
-            if elemType in self.numFacesPerCell.keys():
-                # element is a cell
-
-                (cellOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=cellOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= cellOffset
-
-                if len(tags) > 0:
-                    # next item is a count
-                    if tags[0] != len(tags) - 1:
-                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (tags[0], len(tags) - 1),
+        cells = []
+        ghosts = []
+        faces = []
+        # this will be subtracted from gmsh ID to obtain global ID
+        firstCell = firstFace = (nx.inf, None)
+        for (positions, ids, shapes,
+             physical, geometrical, tags, nodes) in elementBlocks:
+
+            isCell = nx.in1d(shapes, self.numFacesPerCell.keys())
+            isFace = nx.in1d(shapes, self.numVertsPerFace.keys()) & ~isCell
+
+            if isCell.any():
+                # the partition tags for don't seem to always be present
+                # and don't always make much sense when they are
+                partitions = tags[isCell]
+                if partitions.shape[-1] > 0:
+                    # first item is a count
+                    if (partitions[..., 0] != partitions.shape[-1] - 1).any():
+                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (partitions[..., 0].max(), partitions.shape[-1] - 1),
                                       SyntaxWarning, stacklevel=2)
-                    tags = tags[1:]
+                    partitions = partitions[..., 1:]
 
+                block = [a[isCell] for a in (positions, ids, shapes, physical, geometrical, nodes)]
+                firstCell = min(firstCell, (block[0][0], block[1][0]))
                 if self.communicator.Nproc > 1:
-                    for tag in tags:
-                        if -tag == pid:
-                            # if we're collecting ghost cells and this is our ghost cell
-                            ghostsData.add(currLine=currLineInts, elType=elemType,
-                                           physicalEntity=physicalEntity,
-                                           geometricalEntity=geometricalEntity)
-                        elif tag == pid:
-                            # el is in this processor's partition or we collect all cells
-                            cellsData.add(currLine=currLineInts, elType=elemType,
-                                          physicalEntity=physicalEntity,
-                                          geometricalEntity=geometricalEntity)
+                    # the element is our ghost cell or in this processor's partition
+                    ghost = (partitions == -pid).any(axis=-1)
+                    own = (partitions == pid).any(axis=-1)
+                    ghosts.append([a[ghost] for a in block])
+                    cells.append([a[own] for a in block])
                 else:
                     # we collect all cells
-                    cellsData.add(currLine=currLineInts, elType=elemType,
-                                  physicalEntity=physicalEntity,
-                                  geometricalEntity=geometricalEntity)
-            elif elemType in self.numVertsPerFace.keys():
-                # element is a face
-
-                (faceOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=faceOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= faceOffset
+                    cells.append(block)
 
-                facesData.add(currLine=currLineInts, elType=elemType,
-                              physicalEntity=physicalEntity,
-                              geometricalEntity=geometricalEntity)
+            if isFace.any():
+                block = [a[isFace] for a in (positions, ids, shapes, physical, geometrical, nodes)]
+                firstFace = min(firstFace, (block[0][0], block[1][0]))
+                faces.append(block)
 
-        elemsFile.close()
+        return (self._collectElements(cells, offset=firstCell[1]),
+                self._collectElements(ghosts, offset=firstCell[1]),
+                self._collectElements(faces, offset=firstFace[1]))
 
-        return cellsData, ghostsData, facesData
-
-
-    def _parseNamesFile(self):
+    def _collectElements(self, blocks, offset):
+        """
+        Gather blocks of elements back into the order they appear in the
+        file, offsetting their Gmsh IDs to obtain global IDs.
+        """
+        blocks = [block for block in blocks if len(block[0]) > 0]
+        if len(blocks) == 0:
+            return _ElementData()
+
+        positions, ids, shapes, physical, geometrical = [nx.concatenate([block[i] for block in blocks])
+                                                         for i in range(5)]
+        width = max([block[5].shape[-1] for block in blocks])
+        nodes = nx.concatenate([nx.concatenate((block[5],
+                                                -nx.ones((len(block[5]), width - block[5].shape[-1]),
+                                                         dtype=nx.INT_DTYPE)), axis=-1)
+                                for block in blocks])
+
+        order = nx.argsort(positions, kind='mergesort')
+
+        return _ElementData(nodes=nodes[order],
+                            shapes=shapes[order],
+                            idmap=ids[order] - offset,
+                            physicalEntities=physical[order],
+                            geometricalEntities=geometrical[order])
+
+    def _parsePhysicalNames(self, contents):
         physicalNames = {
             0: dict(),
             1: dict(),
             2: dict(),
             3: dict()
         }
-        if self.namesPath is not None:
-            namesFile = open(self.namesPath, 'r')
-
-            namesFile.readline() # skip number of elements
-            for nm in namesFile:
-                nm = nm.split()
-                if self.version > 2.0:
-                    dim = [int(nm.pop(0))]
-                else:
-                    # Gmsh format prior to 2.1 did not unambiguously tie
-                    # physical names to physical entities of different dimensions
-                    # http://article.gmane.org/gmane.comp.cad.gmsh.general/1601
-                    dim = [0, 1, 2, 3]
-                num = int(nm.pop(0))
-                name = " ".join(nm)[1:-1]
-                for d in dim:
-                    physicalNames[d][name] = int(num)
+        try:
+            names = self._sectionText(contents, "PhysicalNames").splitlines()
+        except EOFError:
+            return physicalNames
 
-            namesFile.close()
+        for nm in names[1:]:
+            nm = nm.split()
+            if len(nm) == 0:
+                continue
+            if self.version > 2.0:
+                dim = [int(nm.pop(0))]
+            else:
+                # Gmsh format prior to 2.1 did not unambiguously tie
+                # physical names to physical entities of different dimensions
+                # http://article.gmane.org/gmane.comp.cad.gmsh.general/1601
+                dim = [0, 1, 2, 3]
+            num = int(nm.pop(0))
+            name = " ".join(nm)[1:-1]
+            for d in dim:
+                physicalNames[d][name] = int(num)
 
         return physicalNames
 
     def makeMapVariables(self, mesh):
         """Utility function to make MeshVariables that define different domains in the mesh
         """
-        from fipy.variables.cellVariable import CellVariable
-        from fipy.variables.faceVariable import FaceVariable
-
-        self.physicalCellMap = CellVariable(mesh=mesh, value=self.physicalCellMap)
-        self.geometricalCellMap = CellVariable(mesh=mesh, value=self.geometricalCellMap)
-        self.physicalFaceMap = FaceVariable(mesh=mesh, value=self.physicalFaceMap)
-        self.geometricalFaceMap = FaceVariable(mesh=mesh, value=self.geometricalFaceMap)
-
-        physicalCells = dict()
-        for name in self.physicalNames[self.dimensions].keys():
-            physicalCells[name] = (self.physicalCellMap == self.physicalNames[self.dimensions][name])
+        maps = _makeMapVariables(mesh=mesh,
+                                 dimensions=self.dimensions,
+                                 physicalCellMap=self.physicalCellMap,
+                                 geometricalCellMap=self.geometricalCellMap,
+                                 physicalFaceMap=self.physicalFaceMap,
+                                 geometricalFaceMap=self.geometricalFaceMap,
+                                 physicalNames=self.physicalNames)
 
-        physicalFaces = dict()
-        for name in self.physicalNames[self.dimensions-1].keys():
-            physicalFaces[name] = (self.physicalFaceMap == self.physicalNames[self.dimensions-1][name])
+        (self.physicalCellMap,
+         self.geometricalCellMap,
+         physicalCells,
+         self.physicalFaceMap,
+         self.geometricalFaceMap,
+         physicalFaces) = maps
 
-        return (self.physicalCellMap,
-                self.geometricalCellMap,
-                physicalCells,
-                self.physicalFaceMap,
-                self.geometricalFaceMap,
-                physicalFaces)
+        return maps
 
     def _test(self):
         """
@@ -1219,30 +1494,319 @@ class MSHFile(GmshFile):
         """
         pass
 
+    def _testRead(self):
+        r"""
+        Test parsing, without Gmsh, of the same mesh of two triangles and a
+        quadrangle, with a named bottom edge and named cells, written as
+        ASCII MSH 2.2, binary MSH 2.2 and ASCII MSH 4.1
+
+        >>> import os
+        >>> import struct
+        >>> import tempfile
+
+        >>> names = ('$PhysicalNames\n3\n1 1 "bottom"\n2 2 "left"\n2 3 "right"\n'
+        ...          '$EndPhysicalNames\n')
+        >>> coords = [(0, 0), (1, 0), (1, 1), (0, 1), (2, 0), (2, 1)]
+
+        >>> ascii2 = ('$MeshFormat\n2.2 0 8\n$EndMeshFormat\n' + names
+        ...           + '$Nodes\n6\n'
+        ...           + ''.join(['%d %g %g 0\n' % (i + 1, x, y) for i, (x, y) in enumerate(coords)])
+        ...           + '$EndNodes\n$Elements\n4\n'
+        ...           + '1 1 2 1 1 1 2\n'
+        ...           + '2 2 2 2 3 1 2 3\n3 2 2 2 3 1 3 4\n'
+        ...           + '4 3 2 3 4 2 5 6 3\n'
+        ...           + '$EndElements\n')
+
+        >>> binary2 = ('$MeshFormat\n2.2 1 8\n' + struct.pack('=i', 1) + '\n$EndMeshFormat\n'
+        ...            + names + '$Nodes\n6\n'
+        ...            + ''.join([struct.pack('=i3d', i + 1, x, y, 0.) for i, (x, y) in enumerate(coords)])
+        ...            + '\n$EndNodes\n$Elements\n4\n'
+        ...            + struct.pack('=3i', 1, 1, 2) + struct.pack('=5i', 1, 1, 1, 1, 2)
+        ...            + struct.pack('=3i', 2, 2, 2) + struct.pack('=12i', 2, 2, 3, 1, 2, 3,
+        ...                                                                3, 2, 3, 1, 3, 4)
+        ...            + struct.pack('=3i', 3, 1, 2) + struct.pack('=7i', 4, 3, 4, 2, 5, 6, 3)
+        ...            + '\n$EndElements\n')
+
+        >>> ascii4 = ('$MeshFormat\n4.1 0 8\n$EndMeshFormat\n' + names
+        ...           + '$Entities\n0 1 2 0\n'
+        ...           + '1 0 0 0 1 0 0 1 1 0\n'
+        ...           + '3 0 0 0 1 1 0 1 2 0\n4 1 0 0 2 1 0 1 3 0\n'
+        ...           + '$EndEntities\n'
+        ...           + '$Nodes\n2 6 1 6\n'
+        ...           + '2 3 0 4\n1\n2\n3\n4\n0 0 0\n1 0 0\n1 1 0\n0 1 0\n'
+        ...           + '2 4 0 2\n5\n6\n2 0 0\n2 1 0\n'
+        ...           + '$EndNodes\n'
+        ...           + '$Elements\n3 4 1 4\n'
+        ...           + '1 1 1 1\n1 1 2\n'
+        ...           + '2 3 2 2\n2 1 2 3\n3 1 3 4\n'
+        ...           + '2 4 3 1\n4 2 5 6 3\n'
+        ...           + '$EndElements\n')
+
+        >>> def readMSH(contents):
+        ...     fd, name = tempfile.mkstemp('.msh')
+        ...     os.write(fd, contents)
+        ...     os.close(fd)
+        ...     f = MSHFile(name, dimensions=2, communicator=serialComm, mode='rb')
+        ...     (vertexCoords, facesToV, cellsToF,
+        ...      idmap, ghostIdmap, cellsToV) = f.read()
+        ...     f.close()
+        ...     os.unlink(name)
+        ...     return (vertexCoords, facesToV, cellsToF, idmap, cellsToV,
+        ...             f.physicalCellMap, f.geometricalCellMap,
+        ...             f.physicalFaceMap, f.physicalNames)
+
+        >>> (vertexCoords, facesToV, cellsToF, idmap, cellsToV,
+        ...  physicalCells, geometricalCells,
+        ...  physicalFaces, physicalNames) = readMSH(ascii2)
+        >>> print vertexCoords
+        [[ 0.  1.  1.  0.  2.  2.]
+         [ 0.  0.  1.  1.  0.  1.]]
+        >>> print facesToV
+        [[1 2 0 3 0 4 5 2]
+         [0 1 2 2 3 1 4 5]]
+        >>> print cellsToF
+        [[ 0  2  5]
+         [ 1  3  6]
+         [ 2  4  7]
+         [-1 -1  1]]
+        >>> print cellsToV
+        [[0 0 1]
+         [1 2 4]
+         [2 3 5]
+         [-- -- 2]]
+        >>> print idmap
+        [0, 1, 2]
+        >>> print physicalCells, geometricalCells
+        [2 2 3] [3 3 4]
+        >>> print physicalFaces
+        [1 0 0 0 0 0 0 0]
+        >>> print sorted(physicalNames[1].items()), sorted(physicalNames[2].items())
+        [('bottom', 1)] [('left', 2), ('right', 3)]
+
+        >>> reference = readMSH(ascii2)
+        >>> for contents in (binary2, ascii4):
+        ...     parsed = readMSH(contents)
+        ...     print [nx.allequal(a, b) for a, b in zip(parsed[:-1], reference[:-1])], \
+        ...           parsed[-1] == reference[-1]
+        [True, True, True, True, True, True, True, True] True
+        [True, True, True, True, True, True, True, True] True
+        """
+        pass
+
+def _makeMapVariables(mesh, dimensions,
+                      physicalCellMap, geometricalCellMap,
+                      physicalFaceMap, geometricalFaceMap,
+                      physicalNames):
+    from fipy.variables.cellVariable import CellVariable
+    from fipy.variables.faceVariable import FaceVariable
+
+    physicalCellMap = CellVariable(mesh=mesh, value=physicalCellMap)
+    geometricalCellMap = CellVariable(mesh=mesh, value=geometricalCellMap)
+    physicalFaceMap = FaceVariable(mesh=mesh, value=physicalFaceMap)
+    geometricalFaceMap = FaceVariable(mesh=mesh, value=geometricalFaceMap)
+
+    physicalCells = dict()
+    for name in physicalNames[dimensions].keys():
+        physicalCells[name] = (physicalCellMap == physicalNames[dimensions][name])
+
+    physicalFaces = dict()
+    for name in physicalNames[dimensions-1].keys():
+        physicalFaces[name] = (physicalFaceMap == physicalNames[dimensions-1][name])
+
+    return (physicalCellMap,
+            geometricalCellMap,
+            physicalCells,
+            physicalFaceMap,
+            geometricalFaceMap,
+            physicalFaces)
+
+def _openMeshCache(cacheDir, arg, dimensions, coordDimensions,
+                   communicator, order, background):
+    """
+    Return the `_MeshCache` entry for the mesh that Gmsh makes from `arg`,
+    or `None` if neither `cacheDir` nor the `FIPY_MESH_CACHE` environment
+    variable name a cache directory.
+
+    The entry is keyed on the contents of the MSH or geometry file, or on
+    the geometry script itself, together with the options used to mesh
+    it, the version of FiPy and the number of processes. Files included
+    by a geometry file are not part of the key. The Gmsh that made the
+    mesh is recorded in the entry, to be checked only when it is loaded
+    (see `_madeByCurrentGmsh()`), so that finding the entry does not
+    need to run Gmsh.
+    """
+    if cacheDir is None:
+        cacheDir = os.environ.get("FIPY_MESH_CACHE", None)
+    if cacheDir is None:
+        return None
+
+    if order > 1:
+        communicator = serialComm
+
+    if os.path.exists(arg):
+        f = open(arg, 'rb')
+        geometry = f.read()
+        f.close()
+    else:
+        geometry = arg
+
+    if background is None:
+        backgroundKey = None
+    else:
+        backgroundKey = (nx.array(background.globalValue).tostring(),
+                         nx.array(background.mesh.cellCenters.globalValue).tostring())
+
+    import fipy
+
+    return _MeshCache(cacheDir, communicator,
+                      geometry, dimensions, coordDimensions, order, backgroundKey,
+                      fipy.__version__)
+
+def _madeByCurrentGmsh(gmsh, communicator):
+    """
+    Whether a cached mesh, made by the Gmsh described by `gmsh`, is what
+    the Gmsh that is installed now would make.
+
+    `gmsh` is `None` for a mesh that was read from an MSH file, and
+    otherwise the identity, from `_gmshExecutable()`, and version of the
+    program. The installed Gmsh is only run to find its version if it is
+    not the same program. If Gmsh is not installed, the cached mesh is
+    the only one available.
+
+        >>> print _madeByCurrentGmsh(None, serialComm)
+        True
+        >>> made = (_gmshExecutable(serialComm), gmshVersion(serialComm))
+        >>> print _madeByCurrentGmsh(made, serialComm)
+        True
+        >>> print _madeByCurrentGmsh((("gmsh", 0, 0.), "0.1"), serialComm) # doctest: +GMSH
+        False
+    """
+    if gmsh is None:
+        return True
+
+    executable, version = gmsh
+    current = _gmshExecutable(communicator=communicator)
+    if current is None or current == executable:
+        return True
+
+    return gmshVersion(communicator=communicator) == version
+
+def _readMesh(arg, dimensions, coordDimensions, communicator, order, background, cacheDir):
+    """
+    Return the arrays that describe the mesh that Gmsh makes from `arg`,
+    and the `_MeshCache` entry, if any, that they should be saved to once
+    the mesh has been built.
+
+    If the mesh is already in the cache, it is loaded, along with its
+    derived topology and geometry, without running Gmsh.
+    """
+    cache = _openMeshCache(cacheDir, arg, dimensions, coordDimensions,
+                           communicator, order, background)
+    if cache is not None:
+        state = cache.load()
+        if (state is not None
+            and _madeByCurrentGmsh(state.get("gmsh", None),
+                                   communicator=cache.communicator)):
+            return state, None
+
+    mshFile = openMSHFile(arg,
+                          dimensions=dimensions,
+                          coordDimensions=coordDimensions,
+                          communicator=communicator,
+                          order=order,
+                          mode='r',
+                          background=background)
+
+    (verts,
+     faces,
+     cells,
+     cellGlobalIDs,
+     gCellGlobalIDs,
+     orderedCellVertexIDs) = mshFile.read()
+
+    if cache is not None and mshFile.communicator.bcast(mshFile.fileIsTemporary):
+        # Gmsh meshed a geometry
+        gmsh = (_gmshExecutable(communicator=mshFile.communicator),
+                gmshVersion(communicator=mshFile.communicator))
+    else:
+        gmsh = None
+
+    mshFile.close()
+
+    state = dict(vertexCoords=verts,
+                 faceVertexIDs=faces,
+                 cellFaceIDs=cells,
+                 cellGlobalIDs=cellGlobalIDs,
+                 gCellGlobalIDs=gCellGlobalIDs,
+                 orderedCellVertexIDs=orderedCellVertexIDs,
+                 physicalCellMap=mshFile.physicalCellMap,
+                 geometricalCellMap=mshFile.geometricalCellMap,
+                 physicalFaceMap=mshFile.physicalFaceMap,
+                 geometricalFaceMap=mshFile.geometricalFaceMap,
+                 physicalNames=mshFile.physicalNames,
+                 gmsh=gmsh,
+                 derivedArrays=None)
+
+    return state, cache
+
 class _ElementData(object):
     """
-    Bookkeeping for cells. Declared as own class for generality.
+    Bookkeeping for elements, in the order they appear in the file.
 
-    "nodes": A Python list of the vertices that make up this element
-    "shapes": A shapeTypes Python list
-    "idmap": A Python list which maps vertexCoords idx -> global ID
-    "physicalEntities": A Python list of the Gmsh physical entities each element is in
-    "geometricalEntities": A Python list of the Gmsh geometrical entities each element is in
+    "nodes": An array of the Gmsh nodes of each element, padded with -1
+    "shapes": An array of the Gmsh element types
+    "idmap": An array which maps vertexCoords idx -> global ID
+    "physicalEntities": An array of the Gmsh physical entity each element is in
+    "geometricalEntities": An array of the Gmsh geometrical entity each element is in
+    """
+    def __init__(self, nodes=None, shapes=None, idmap=None,
+                 physicalEntities=None, geometricalEntities=None):
+        empty = nx.zeros((0,), dtype=nx.INT_DTYPE)
+        if nodes is None:
+            nodes = nx.zeros((0, 0), dtype=nx.INT_DTYPE)
+        self.nodes = nodes
+        self.shapes = shapes if shapes is not None else empty
+        self.idmap = idmap if idmap is not None else empty
+        self.physicalEntities = physicalEntities if physicalEntities is not None else empty
+        self.geometricalEntities = geometricalEntities if geometricalEntities is not None else empty
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def __add__(self, other):
+        width = max(self.nodes.shape[-1], other.nodes.shape[-1])
+        nodes = -nx.ones((len(self) + len(other), width), dtype=nx.INT_DTYPE)
+        nodes[:len(self), :self.nodes.shape[-1]] = self.nodes
+        nodes[len(self):, :other.nodes.shape[-1]] = other.nodes
+
+        return _ElementData(nodes=nodes,
+                            shapes=nx.concatenate((self.shapes, other.shapes)),
+                            idmap=nx.concatenate((self.idmap, other.idmap)),
+                            physicalEntities=nx.concatenate((self.physicalEntities,
+                                                             other.physicalEntities)),
+                            geometricalEntities=nx.concatenate((self.geometricalEntities,
+                                                                other.geometricalEntities)))
+
+def _uniqueRows(rows):
     """
-    def __init__(self):
-        self.nodes = []
-        self.shapes = []
-        self.idmap = [] # vertexCoords idx -> gmsh ID (global ID)
-        self.physicalEntities = []
-        self.geometricalEntities = []
-
-    def add(self, currLine, elType, physicalEntity, geometricalEntity):
-        numTags = currLine[2]
-        self.nodes.append(currLine[(numTags+3):])
-        self.shapes.append(elType)
-        self.idmap.append(currLine[0])
-        self.physicalEntities.append(physicalEntity)
-        self.geometricalEntities.append(geometricalEntity)
+    Return the index of the first occurrence of each distinct row of
+    `rows`, in sorted order, and the index of the distinct row of each row.
+
+        >>> first, inverse = _uniqueRows(nx.array([[1, 2], [0, 5], [1, 2], [0, 4]]))
+        >>> print first
+        [3 1 0]
+        >>> print inverse
+        [2 1 2 0]
+    """
+    order = nx.lexsort(rows.swapaxes(0, 1)[::-1])
+    sortedRows = rows[order]
+    new = nx.ones((len(rows),), dtype=bool)
+    new[1:] = (sortedRows[1:] != sortedRows[:-1]).any(axis=-1)
+    inverse = nx.empty((len(rows),), dtype=nx.INT_DTYPE)
+    inverse[order] = nx.cumsum(new) - 1
+
+    return order[new], inverse
+
 
 class _GmshTopology(_MeshTopology):
 
@@ -1515,6 +2079,10 @@ class Gmsh2D(Mesh2D):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to save the mesh, and from which
+        to load it the next time the same mesh is requested, instead of
+        running Gmsh and recalculating its geometry. Defaults to the
+        `FIPY_MESH_CACHE` environment variable, if set.
     """
 
     def __init__(self,
@@ -1522,44 +2090,49 @@ class Gmsh2D(Mesh2D):
                  coordDimensions=2,
                  communicator=parallelComm,
                  order=1,
-                 background=None):
+                 background=None,
+                 cacheDir=None):
 
-        self.mshFile = openMSHFile(arg,
-                                   dimensions=2,
-                                   coordDimensions=coordDimensions,
-                                   communicator=communicator,
-                                   order=order,
-                                   mode='r',
-                                   background=background)
+        state, cache = _readMesh(arg,
+                                 dimensions=2,
+                                 coordDimensions=coordDimensions,
+                                 communicator=communicator,
+                                 order=order,
+                                 background=background,
+                                 cacheDir=cacheDir)
 
-        (verts,
-         faces,
-         cells,
-         self.cellGlobalIDs,
-         self.gCellGlobalIDs,
-         self._orderedCellVertexIDs_data) = self.mshFile.read()
-
-        self.mshFile.close()
+        self.cellGlobalIDs = state["cellGlobalIDs"]
+        self.gCellGlobalIDs = state["gCellGlobalIDs"]
+        self._orderedCellVertexIDs_data = state["orderedCellVertexIDs"]
 
         if communicator.Nproc > 1:
             self.globalNumberOfCells = communicator.sum(len(self.cellGlobalIDs))
             parprint("  I'm solving with %d cells total." % self.globalNumberOfCells)
             parprint("  Got global number of cells")
 
-        Mesh2D.__init__(self, vertexCoords=verts,
-                              faceVertexIDs=faces,
-                              cellFaceIDs=cells,
+        Mesh2D.__init__(self, vertexCoords=state["vertexCoords"],
+                              faceVertexIDs=state["faceVertexIDs"],
+                              cellFaceIDs=state["cellFaceIDs"],
                               communicator=communicator,
-                              _TopologyClass=_GmshTopology)
+                              _TopologyClass=_GmshTopology,
+                              _derivedArrays=state["derivedArrays"])
 
         (self.physicalCellMap,
          self.geometricalCellMap,
          self.physicalCells,
          self.physicalFaceMap,
          self.geometricalFaceMap,
-         self.physicalFaces) = self.mshFile.makeMapVariables(mesh=self)
-
-        del self.mshFile
+         self.physicalFaces) = _makeMapVariables(mesh=self,
+                                                 dimensions=2,
+                                                 physicalCellMap=state["physicalCellMap"],
+                                                 geometricalCellMap=state["geometricalCellMap"],
+                                                 physicalFaceMap=state["physicalFaceMap"],
+                                                 geometricalFaceMap=state["geometricalFaceMap"],
+                                                 physicalNames=state["physicalNames"])
+
+        if cache is not None:
+            state["derivedArrays"] = self._getDerivedArrays()
+            cache.save(state)
 
         parprint("Exiting Gmsh2D")
 
@@ -1796,6 +2369,33 @@ class Gmsh2D(Mesh2D):
 
         >>> os.remove(mshFile)
 
+        A mesh saved in a cache directory is loaded from there the next time
+
+        >>> import shutil
+        >>> from fipy.tools import numerix
+        >>> cacheDir = tempfile.mkdtemp()
+        >>> geo = '''
+        ... Point(1) = {0, 0, 0, 0.2};
+        ... Point(2) = {1, 0, 0, 0.2};
+        ... Point(3) = {0, 1, 0, 0.2};
+        ... Line(4) = {1, 2};
+        ... Line(5) = {2, 3};
+        ... Line(6) = {3, 1};
+        ... Line Loop(7) = {4, 5, 6};
+        ... Plane Surface(8) = {7};
+        ... Physical Line("hypotenuse") = {5};
+        ... '''
+        >>> saved = Gmsh2D(geo, communicator=serialComm, cacheDir=cacheDir) # doctest: +GMSH
+        >>> loaded = Gmsh2D(geo, communicator=serialComm, cacheDir=cacheDir) # doctest: +GMSH
+        >>> print len(os.listdir(cacheDir)) # doctest: +GMSH
+        1
+        >>> print numerix.allclose(saved.cellVolumes, loaded.cellVolumes) # doctest: +GMSH
+        True
+        >>> print numerix.allequal(saved.physicalFaces["hypotenuse"],
+        ...                        loaded.physicalFaces["hypotenuse"]) # doctest: +GMSH
+        True
+        >>> shutil.rmtree(cacheDir)
+
         """
 
 class Gmsh2DIn3DSpace(Gmsh2D):
@@ -1808,14 +2408,19 @@ class Gmsh2DIn3DSpace(Gmsh2D):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to save the mesh, and from which
+        to load it the next time the same mesh is requested, instead of
+        running Gmsh and recalculating its geometry. Defaults to the
+        `FIPY_MESH_CACHE` environment variable, if set.
     """
-    def __init__(self, arg, communicator=parallelComm, order=1, background=None):
+    def __init__(self, arg, communicator=parallelComm, order=1, background=None, cacheDir=None):
         Gmsh2D.__init__(self,
                         arg,
                         coordDimensions=3,
                         communicator=communicator,
                         order=order,
-                        background=background)
+                        background=background,
+                        cacheDir=cacheDir)
 
     def _test(self):
         """
@@ -1883,29 +2488,30 @@ class Gmsh3D(Mesh):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to save the mesh, and from which
+        to load it the next time the same mesh is requested, instead of
+        running Gmsh and recalculating its geometry. Defaults to the
+        `FIPY_MESH_CACHE` environment variable, if set.
     """
-    def __init__(self, arg, communicator=parallelComm, order=1, background=None):
-        self.mshFile  = openMSHFile(arg,
-                                    dimensions=3,
-                                    communicator=communicator,
-                                    order=order,
-                                    mode='r',
-                                    background=background)
-
-        (verts,
-         faces,
-         cells,
-         self.cellGlobalIDs,
-         self.gCellGlobalIDs,
-         self._orderedCellVertexIDs_data) = self.mshFile.read()
-
-        self.mshFile.close()
-
-        Mesh.__init__(self, vertexCoords=verts,
-                            faceVertexIDs=faces,
-                            cellFaceIDs=cells,
+    def __init__(self, arg, communicator=parallelComm, order=1, background=None, cacheDir=None):
+        state, cache = _readMesh(arg,
+                                 dimensions=3,
+                                 coordDimensions=None,
+                                 communicator=communicator,
+                                 order=order,
+                                 background=background,
+                                 cacheDir=cacheDir)
+
+        self.cellGlobalIDs = state["cellGlobalIDs"]
+        self.gCellGlobalIDs = state["gCellGlobalIDs"]
+        self._orderedCellVertexIDs_data = state["orderedCellVertexIDs"]
+
+        Mesh.__init__(self, vertexCoords=state["vertexCoords"],
+                            faceVertexIDs=state["faceVertexIDs"],
+                            cellFaceIDs=state["cellFaceIDs"],
                             communicator=communicator,
-                            _TopologyClass=_GmshTopology)
+                            _TopologyClass=_GmshTopology,
+                            _derivedArrays=state["derivedArrays"])
 
         if self.communicator.Nproc > 1:
             self.globalNumberOfCells = self.communicator.sum(len(self.cellGlobalIDs))
@@ -1915,9 +2521,17 @@ class Gmsh3D(Mesh):
          self.physicalCells,
          self.physicalFaceMap,
          self.geometricalFaceMap,
-         self.physicalFaces) = self.mshFile.makeMapVariables(mesh=self)
-
-        del self.mshFile
+         self.physicalFaces) = _makeMapVariables(mesh=self,
+                                                 dimensions=3,
+                                                 physicalCellMap=state["physicalCellMap"],
+                                                 geometricalCellMap=state["geometricalCellMap"],
+                                                 physicalFaceMap=state["physicalFaceMap"],
+                                                 geometricalFaceMap=state["geometricalFaceMap"],
+                                                 physicalNames=state["physicalNames"])
+
+        if cache is not None:
+            state["derivedArrays"] = self._getDerivedArrays()
+            cache.save(state)
 
     def __setstate__(self, state):
         super(Gmsh3D, self).__setstate__(state)
@@ -2110,7 +2724,7 @@ class Gmsh3D(Mesh):
 class GmshGrid2D(Gmsh2D):
     """Should serve as a drop-in replacement for Grid2D."""
     def __init__(self, dx=1., dy=1., nx=1, ny=None,
-                 coordDimensions=2, communicator=parallelComm, order=1):
+                 coordDimensions=2, communicator=parallelComm, order=1, cacheDir=None):
         self.dx = dx
         self.dy = dy or dx
         self.nx = nx
@@ -2118,7 +2732,8 @@ class GmshGrid2D(Gmsh2D):
 
         arg = self._makeGridGeo(self.dx, self.dy, self.nx, self.ny)
 
-        Gmsh2D.__init__(self, arg, coordDimensions, communicator, order, background=None)
+        Gmsh2D.__init__(self, arg, coordDimensions, communicator, order, background=None,
+                        cacheDir=cacheDir)
 
     @property
     def _meshSpacing(self):
@@ -2179,7 +2794,7 @@ class GmshGrid2D(Gmsh2D):
 class GmshGrid3D(Gmsh3D):
     """Should serve as a drop-in replacement for Grid3D."""
     def __init__(self, dx=1., dy=1., dz=1., nx=1, ny=None, nz=None,
-                 communicator=parallelComm, order=1):
+                 communicator=parallelComm, order=1, cacheDir=None):
         self.dx = dx
         self.dy = dy or dx
         self.dz = dz or dx
@@ -2191,7 +2806,7 @@ class GmshGrid3D(Gmsh3D):
         arg = self._makeGridGeo(self.dx, self.dy, self.dz,
                                 self.nx, self.ny, self.nz)
 
-        Gmsh3D.__init__(self, arg, communicator=communicator, order=order)
+        Gmsh3D.__init__(self, arg, communicator=communicator, order=order, cacheDir=cacheDir)
 
     @property
     def _meshSpacing(self):
@@ -0,0 +1,134 @@
+"""Refresh the ghost cells of a parallel mesh from the processes that own them
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+class _HaloExchange(object):
+    """
+    Copies the values of the cells that each process owns into the
+    overlapping (ghost) cells of its neighbors, without going through a
+    :term:`Trilinos` solve.
+
+    The cells to send to and receive from each neighbor are found once,
+    when the exchange is created, from the global IDs of the overlapping
+    and non-overlapping cells. Each exchange then posts a nonblocking
+    receive and send of a NumPy buffer for each neighbor.
+
+    On a single process there are no ghost cells and nothing is exchanged
+
+        >>> from fipy import Grid1D
+        >>> from fipy.tools import serialComm
+        >>> exchange = _HaloExchange(Grid1D(nx=3, communicator=serialComm))
+        >>> print exchange.neighbors
+        []
+        >>> value = numerix.array([1., 2., 3.])
+        >>> exchange.start(value).wait()
+        >>> print value
+        [ 1.  2.  3.]
+
+    :Parameters:
+      - `mesh`: the mesh whose cells are exchanged
+      - `tag`: the MPI tag of the exchanged messages
+    """
+    def __init__(self, mesh, tag=0):
+        self.communicator = mesh.communicator
+        self.tag = tag
+        self.neighbors = []
+        self.sendIDs = {}
+        self.recvIDs = {}
+
+        Nproc = self.communicator.Nproc
+        if Nproc == 1:
+            return
+
+        # the process that owns each global cell
+        layout = mesh._globalCellLayout
+        owners = numerix.empty((layout.numberOfElements,), 'l')
+        owners[layout.globalIDs] = numerix.repeat(numerix.arange(Nproc), layout.counts)
+
+        ghostIDs = numerix.setdiff1d(mesh._localOverlappingCellIDs,
+                                     mesh._localNonOverlappingCellIDs)
+        ghostGlobalIDs = numerix.take(mesh._globalOverlappingCellIDs, ghostIDs)
+        ghostOwners = numerix.take(owners, ghostGlobalIDs)
+
+        wanted = self.communicator.alltoall([ghostGlobalIDs[ghostOwners == proc]
+                                             for proc in range(Nproc)])
+
+        ownedIDs = mesh._localNonOverlappingCellIDs
+        ownedGlobalIDs = mesh._globalNonOverlappingCellIDs
+        order = numerix.argsort(ownedGlobalIDs)
+
+        for proc in range(Nproc):
+            recvIDs = ghostIDs[ghostOwners == proc]
+            sendIDs = numerix.take(ownedIDs,
+                                   numerix.take(order,
+                                                numerix.searchsorted(numerix.take(ownedGlobalIDs, order),
+                                                                     wanted[proc])))
+            if len(recvIDs) > 0 or len(sendIDs) > 0:
+                self.neighbors.append(proc)
+                self.recvIDs[proc] = recvIDs
+                self.sendIDs[proc] = sendIDs
+
+    def start(self, value, done=None):
+        """Begin refreshing the ghost cells of the array `value`, whose last
+        axis runs over the cells.
+
+        Returns an `_HaloRequest` whose `wait()` completes the exchange and
+        then calls `done()`. Only the ghost cells of `value` change, so the
+        cells that the process owns may be used until then.
+        """
+        return _HaloRequest(self, value, done=done)
+
+class _HaloRequest(object):
+    def __init__(self, exchange, value, done=None):
+        self.exchange = exchange
+        self.value = value
+        self.done = done
+        self.requests = []
+        self.recvbufs = {}
+        self.sendbufs = {}
+
+        communicator = exchange.communicator
+        procID = communicator.procID
+
+        for proc in exchange.neighbors:
+            # the values of one cell are sent together, so the cells go
+            # along the first axis of the buffers
+            sendbuf = numerix.ascontiguousarray(numerix.rollaxis(value[..., exchange.sendIDs[proc]], -1))
+            recvbuf = numerix.empty((len(exchange.recvIDs[proc]),) + value.shape[:-1],
+                                    dtype=value.dtype)
+            if proc == procID:
+                # a periodic grid can wrap around onto its own cells
+                recvbuf[...] = sendbuf
+            else:
+                self.requests.append(communicator.Irecv(recvbuf, source=proc, tag=exchange.tag))
+                self.requests.append(communicator.Isend(sendbuf, dest=proc, tag=exchange.tag))
+            self.recvbufs[proc] = recvbuf
+            self.sendbufs[proc] = sendbuf
+
+    def wait(self):
+        """Complete the exchange and copy the received values into the
+        ghost cells.
+        """
+        if len(self.requests) > 0:
+            self.exchange.communicator.Waitall(self.requests)
+        self.requests = []
+
+        for proc, recvbuf in self.recvbufs.items():
+            self.value[..., self.exchange.recvIDs[proc]] = numerix.rollaxis(recvbuf, 0, recvbuf.ndim)
+        self.recvbufs = {}
+        self.sendbufs = {}
+
+        if self.done is not None:
+            self.done()
+            self.done = None
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -22,7 +22,7 @@ class Mesh(AbstractMesh):
         This is built for a non-mixed element mesh.
     """
 
-    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_MeshTopology):
+    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_MeshTopology, _derivedArrays=None):
         super(Mesh, self).__init__(communicator=communicator,
                                    _RepresentationClass=_RepresentationClass,
                                    _TopologyClass=_TopologyClass)
@@ -44,10 +44,13 @@ class Mesh(AbstractMesh):
         if not hasattr(self, "globalNumberOfFaces"):
             self.globalNumberOfFaces = self.numberOfFaces
 
-        self.faceCellIDs = self._calcFaceCellIDs()
+        if _derivedArrays is None:
+            self.faceCellIDs = self._calcFaceCellIDs()
 
-        self._setTopology()
-        self._setGeometry(scaleLength = 1.)
+            self._setTopology()
+            self._setGeometry(scaleLength = 1.)
+        else:
+            self._setDerivedArrays(_derivedArrays)
 
     """
     Topology set and calc
@@ -272,6 +275,69 @@ class Mesh(AbstractMesh):
         else:
             return cellNormals
 
+    """
+    Derived topology and geometry, for storage in a `_MeshCache`
+    """
+
+    _derivedArrayNames = ("faceCellIDs",
+                          "_interiorCellIDs",
+                          "_exteriorCellIDs",
+                          "_cellToFaceOrientations",
+                          "_adjacentCellIDs",
+                          "_cellToCellIDs",
+                          "_cellToCellIDsFilled",
+                          "_faceCenters",
+                          "_faceAreas",
+                          "_cellCenters",
+                          "_internalFaceToCellDistances",
+                          "_cellToFaceDistanceVectors",
+                          "_internalCellDistances",
+                          "_cellDistanceVectors",
+                          "faceNormals",
+                          "_cellVolumes",
+                          "_faceCellToCellNormals",
+                          "_faceTangents1",
+                          "_faceTangents2",
+                          "_cellToCellDistances",
+                          "_cellAreas",
+                          "_cellNormals")
+
+    def _getDerivedArrays(self):
+        """Return the arrays calculated by `_calcFaceCellIDs`,
+        `_setTopology` and `_setGeometry`, which can be passed back to
+        `__init__` to build the same mesh without recalculating them.
+
+            >>> from fipy import Tri2D
+            >>> m0 = Tri2D(nx=2, ny=2)
+            >>> m1 = Mesh(vertexCoords=m0.vertexCoords,
+            ...           faceVertexIDs=m0.faceVertexIDs,
+            ...           cellFaceIDs=m0.cellFaceIDs,
+            ...           _derivedArrays=m0._getDerivedArrays())
+            >>> print numerix.allclose(m0.cellVolumes, m1.cellVolumes)
+            True
+            >>> print numerix.allequal(m0.exteriorFaces, m1.exteriorFaces)
+            True
+            >>> print numerix.allclose(m0._faceToCellDistanceRatio,
+            ...                        m1._faceToCellDistanceRatio)
+            True
+        """
+        arrays = dict((name, getattr(self, name)) for name in self._derivedArrayNames)
+        arrays["_exteriorFaces"] = numerix.array(self._exteriorFaces.value)
+        return arrays
+
+    def _setDerivedArrays(self, arrays):
+        from fipy.variables.faceVariable import FaceVariable
+
+        for name in self._derivedArrayNames:
+            setattr(self, name, arrays[name])
+
+        mask = arrays["_exteriorFaces"]
+        self._exteriorFaces = FaceVariable(mesh=self, value=mask)
+        self._interiorFaces = FaceVariable(mesh=self, value=numerix.logical_not(mask))
+        self._orientedFaceNormals = self._calcOrientedFaceNormals()
+
+        self._setScaledGeometry(self.scale['length'])
+
     """settable geometry properties"""
     def _getFaceToCellDistances(self):
         return self._internalFaceToCellDistances
@@ -539,8 +605,31 @@ class Mesh(AbstractMesh):
            >>> print m0._getNearestCellID(m1.cellCenters.globalValue)
            [4 5 7 8]
 
+        The index of cell centers is kept until the mesh is rescaled
+
+           >>> index = m0._cellCenterIndex
+           >>> print m0._getNearestCellID(((4.,), (6.,)))
+           [8]
+           >>> m0._cellCenterIndex is index
+           True
+
         """
-        return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+        centers = self.cellCenters.globalValue
+        if type(centers) is not numerix.ndarray or numerix._isPhysical(points):
+            return numerix.nearest(data=centers, points=points)
+
+        return self._cellCenterIndex.nearest(points)
+
+    @property
+    def _cellCenterIndex(self):
+        from fipy.tools.bucketGrid import _BucketGrid
+
+        index = getattr(self, '_cellCenterIndexCache', None)
+        if index is None or index[0] is not self._scaledCellCenters:
+            index = (self._scaledCellCenters, _BucketGrid(self.cellCenters.globalValue))
+            self._cellCenterIndexCache = index
+
+        return index[1]
 
     def _test(self):
         """
@@ -54,8 +54,5 @@ class Mesh1D(Mesh):
 
     @property
     def _VTKCellType(self):
-        try:
-            from tvtk.api import tvtk
-        except ImportError, e:
-            from enthought.tvtk.api import tvtk
-        return tvtk.Line().cell_type
+        # VTK_LINE, as ``tvtk.Line().cell_type``
+        return 3
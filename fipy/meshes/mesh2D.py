@@ -30,9 +30,9 @@ def _orderVertices(vertexCoords, vertices):
 __all__ = ["Mesh2D"]
 
 class Mesh2D(Mesh):
-    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_Mesh2DTopology):
+    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_Mesh2DTopology, _derivedArrays=None):
         super(Mesh2D, self).__init__(vertexCoords=vertexCoords, faceVertexIDs=faceVertexIDs, cellFaceIDs=cellFaceIDs, communicator=communicator,
-                                     _RepresentationClass=_RepresentationClass, _TopologyClass=_TopologyClass)
+                                     _RepresentationClass=_RepresentationClass, _TopologyClass=_TopologyClass, _derivedArrays=_derivedArrays)
 
     def _calcScaleArea(self):
         return self.scale['length']
@@ -222,11 +222,8 @@ class Mesh2D(Mesh):
 
     @property
     def _VTKCellType(self):
-        try:
-            from tvtk.api import tvtk
-        except ImportError, e:
-            from enthought.tvtk.api import tvtk
-        return tvtk.Polygon().cell_type
+        # VTK_POLYGON, as ``tvtk.Polygon().cell_type``
+        return 7
 
     def _test(self):
         """
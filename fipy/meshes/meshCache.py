@@ -0,0 +1,187 @@
+"""Persistent storage of the arrays that describe a mesh
+"""
+__docformat__ = 'restructuredtext'
+
+import cPickle
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+
+__all__ = []
+
+class _MeshCache(object):
+    """
+    Entry in a directory of meshes, named for a hash of the `inputs` that
+    produced the mesh and of the number of processes sharing it.
+
+    Each array is saved in its own ``.npy`` file and is memory-mapped when
+    the entry is loaded, so only the pages that are actually used are
+    read from disk. Each process of a parallel run keeps its own
+    partition of the mesh.
+
+        >>> import os, shutil, tempfile
+        >>> from fipy.tools import serialComm
+        >>> directory = tempfile.mkdtemp()
+        >>> cache = _MeshCache(directory, serialComm, "square", 1.)
+        >>> print cache.load()
+        None
+
+        >>> cache.save(dict(coords=numerix.arange(3.),
+        ...                 ids=MA.masked_values([0, -1, 2], -1),
+        ...                 adjacent=(numerix.arange(2), numerix.arange(2) + 1),
+        ...                 globalIDs=[0, 1, 2],
+        ...                 names={"left": 1},
+        ...                 geometry=dict(areas=numerix.ones(2))))
+        >>> values = _MeshCache(directory, serialComm, "square", 1.).load()
+        >>> print values["coords"], values["ids"], values["globalIDs"]
+        [ 0.  1.  2.] [0 -- 2] [0, 1, 2]
+        >>> print values["adjacent"], values["names"], values["geometry"]
+        (array([0, 1]), array([1, 2])) {'left': 1} {'areas': array([ 1.,  1.])}
+
+    Loaded arrays can be changed without changing the cache
+
+        >>> values["coords"][0] = 10.
+        >>> print _MeshCache(directory, serialComm, "square", 1.).load()["coords"]
+        [ 0.  1.  2.]
+
+    Saving again replaces the entry, e.g., one made by an older
+    :term:`Gmsh`
+
+        >>> cache.save(dict(coords=numerix.arange(4.)))
+        >>> print _MeshCache(directory, serialComm, "square", 1.).load()
+        {'coords': array([ 0.,  1.,  2.,  3.])}
+        >>> print os.listdir(cache.entry)
+        ['0']
+
+    Different inputs give a different entry
+
+        >>> print _MeshCache(directory, serialComm, "square", 2.).load()
+        None
+
+        >>> shutil.rmtree(directory)
+
+    :Parameters:
+      - `directory`: the directory holding all of the cached meshes
+      - `communicator`: the communicator that the mesh is partitioned over
+      - `inputs`: strings or numbers that together determine the mesh
+    """
+    def __init__(self, directory, communicator, *inputs):
+        self.communicator = communicator
+        self.directory = directory
+
+        key = hashlib.sha1()
+        for part in inputs + (communicator.Nproc,):
+            key.update(repr(part))
+            key.update("\0")
+        self.entry = os.path.join(directory, key.hexdigest())
+        self.path = os.path.join(self.entry, "%d" % communicator.procID)
+
+    def load(self):
+        """Return the dictionary of saved values, or `None` if any process
+        has no complete entry.
+        """
+        try:
+            values = self._load()
+        except (IOError, OSError, EOFError, ValueError, KeyError, cPickle.UnpicklingError):
+            values = None
+
+        if not self.communicator.all(numerix.array(values is not None)):
+            values = None
+
+        return values
+
+    def _load(self):
+        f = open(os.path.join(self.path, "index.pickle"), "rb")
+        try:
+            index = cPickle.load(f)
+        finally:
+            f.close()
+
+        return dict((name, self._restore(description))
+                    for name, description in index.items())
+
+    def _restore(self, description):
+        kind, value = description
+        if kind == "array":
+            # a copy-on-write map, so that the mesh may change it freely
+            return numerix.asarray(numerix.load(os.path.join(self.path, value),
+                                                mmap_mode="c"))
+        elif kind == "masked":
+            data, mask = value
+            return MA.array(self._restore(data), mask=self._restore(mask))
+        elif kind == "list":
+            return self._restore(value).tolist()
+        elif kind == "tuple":
+            return tuple([self._restore(item) for item in value])
+        elif kind == "dict":
+            return dict((key, self._restore(item)) for key, item in value.items())
+        else:
+            return value
+
+    def save(self, values):
+        """Store the dictionary `values` of arrays and picklable objects.
+
+        The entry is written to a temporary directory and then moved into
+        place, replacing any previous entry, so a partially written entry
+        is never loaded.
+        """
+        try:
+            os.makedirs(self.entry)
+        except OSError, e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        temporary = tempfile.mkdtemp(dir=self.entry)
+        try:
+            self._files = 0
+            index = dict((name, self._store(temporary, value))
+                         for name, value in values.items())
+
+            f = open(os.path.join(temporary, "index.pickle"), "wb")
+            try:
+                cPickle.dump(index, f, cPickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+
+            if os.path.exists(self.path):
+                previous = temporary + ".previous"
+                os.rename(self.path, previous)
+                os.rename(temporary, self.path)
+                # the arrays of a loaded mesh may still be mapped from it
+                shutil.rmtree(previous, ignore_errors=True)
+            else:
+                os.rename(temporary, self.path)
+        except (IOError, OSError):
+            # another run saved the same mesh first, or there is no room
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def _store(self, directory, value):
+        if isinstance(value, MA.MaskedArray):
+            return ("masked", (self._store(directory, MA.getdata(value)),
+                               self._store(directory, MA.getmaskarray(value))))
+        elif isinstance(value, numerix.ndarray):
+            name = "%d.npy" % self._files
+            self._files += 1
+            numerix.save(os.path.join(directory, name), value)
+            return ("array", name)
+        elif isinstance(value, list):
+            return ("list", self._store(directory, numerix.array(value)))
+        elif isinstance(value, tuple):
+            return ("tuple", [self._store(directory, item) for item in value])
+        elif isinstance(value, dict):
+            return ("dict", dict((key, self._store(directory, item))
+                                 for key, item in value.items()))
+        else:
+            return ("object", value)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
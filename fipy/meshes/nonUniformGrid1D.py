@@ -60,6 +60,8 @@ class NonUniformGrid1D(Mesh1D):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.occupiedNodes,
          vertices,
          faces,
@@ -18,9 +18,10 @@ class NonUniformGrid2D(Mesh2D):
     first and then vertical faces.
     """
     def __init__(self, dx=1., dy=1., nx=None, ny=None, overlap=2, communicator=parallelComm,
+                 _BuilderClass=_NonuniformGrid2DBuilder,
                  _RepresentationClass=_Grid2DRepresentation, _TopologyClass=_Grid2DTopology):
 
-        builder = _NonuniformGrid2DBuilder()
+        builder = _BuilderClass()
 
         self.args = {
             'dx': dx, 
@@ -46,6 +47,8 @@ class NonUniformGrid2D(Mesh2D):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.numberOfHorizontalRows,
          self.numberOfVerticalColumns,
          self.numberOfHorizontalFaces,
@@ -241,6 +244,16 @@ class NonUniformGrid2D(Mesh2D):
             >>> print min(m.y) == 5.5 # doctest: +PROCESSOR_2_OF_3
             True
 
+        A grid that is wider than it is tall is split along `x` instead.
+
+            >>> m = NonUniformGrid2D(nx=6, ny=4, overlap=1)
+            >>> print m._globalNonOverlappingCellIDs # doctest: +PROCESSOR_1_OF_2
+            [ 3  4  5  9 10 11 15 16 17 21 22 23]
+            >>> print min(m.x) == 3.5 # doctest: +PROCESSOR_2_OF_3
+            True
+            >>> print min(m.y) == 0.5
+            True
+
         """
 
 def _test():
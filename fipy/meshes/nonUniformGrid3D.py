@@ -27,9 +27,10 @@ class NonUniformGrid3D(Mesh):
     Faces: XY faces numbered first, then XZ faces, then YZ faces. Within each subcategory, it is numbered in the usual way.
     """
     def __init__(self, dx = 1., dy = 1., dz = 1., nx = None, ny = None, nz = None, overlap=2, communicator=parallelComm,
+                 _BuilderClass=_NonuniformGrid3DBuilder,
                  _RepresentationClass=_Grid3DRepresentation, _TopologyClass=_Grid3DTopology):
 
-        builder = _NonuniformGrid3DBuilder()
+        builder = _BuilderClass()
 
         self.args = {
             'dx': dx,
@@ -58,6 +59,8 @@ class NonUniformGrid3D(Mesh):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.numberOfXYFaces,
          self.numberOfXZFaces,
          self.numberOfYZFaces,
@@ -364,6 +367,15 @@ class NonUniformGrid3D(Mesh):
             >>> print min(m.z) == 5.5 # doctest: +PROCESSOR_2_OF_3
             True
 
+        The grid is split along whichever axis gives the processes the
+        least boundary to share.
+
+            >>> m = NonUniformGrid3D(nx=2, ny=6, nz=4, overlap=1)
+            >>> print min(m.y) == 2.5 # doctest: +PROCESSOR_1_OF_2
+            True
+            >>> print min(m.x) == 0.5 and min(m.z) == 0.5
+            True
+
         """
 
 def _test():
@@ -3,14 +3,22 @@
 """
 __docformat__ = 'restructuredtext'
 
+import functools
+
 from fipy.tools import numerix
 from fipy.tools import parallelComm
 from fipy.meshes.nonUniformGrid2D import NonUniformGrid2D
+from fipy.meshes.builders import _PeriodicGrid2DBuilder
 
 __all__ = ["PeriodicGrid2D", "PeriodicGrid2DLeftRight", "PeriodicGrid2DTopBottom"]
 
 class _BasePeriodicGrid2D(NonUniformGrid2D):
+
+    _periodicAxes = ()
+
     def __init__(self, dx = 1., dy = 1., nx = None, ny = None, overlap=2, communicator=parallelComm, *args, **kwargs):
+        kwargs["_BuilderClass"] = functools.partial(_PeriodicGrid2DBuilder,
+                                                    periodicAxes=self._periodicAxes)
         super(_BasePeriodicGrid2D, self).__init__(dx = dx, dy = dy, nx = nx, ny = ny, overlap=overlap, communicator=communicator, *args, **kwargs)
         self._nonPeriodicCellVertexIDs = super(_BasePeriodicGrid2D, self)._cellVertexIDs
         self._orderedCellVertexIDs_data = super(_BasePeriodicGrid2D, self)._orderedCellVertexIDs
@@ -21,6 +29,17 @@ class _BasePeriodicGrid2D(NonUniformGrid2D):
     def _cellVertexIDs(self):
         return self._nonPeriodicCellVertexIDs
 
+    def _makePeriodic(self):
+        boundaries = (("facesLeft", "facesRight"),
+                      ("facesBottom", "facesTop"))
+        for axis in self._periodicAxes:
+            # along an axis that is split among processes, the ghost cells
+            # wrap around the periodic boundary instead
+            if self._processShape[axis] == 1:
+                lower, upper = boundaries[axis]
+                self._connectFaces(numerix.nonzero(getattr(self, lower)),
+                                   numerix.nonzero(getattr(self, upper)))
+
     def _translate(self, vector):
         """
         Test for ticket:298.
@@ -94,21 +113,44 @@ class PeriodicGrid2D(_BasePeriodicGrid2D):
         True
     """
 
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
+    _periodicAxes = (0, 1)
+
+    def _test(self):
+        """
+        When a process's block and its ghost cells reach all the way
+        around a periodic axis, the ghosts must not wrap back onto the
+        block. Each process's own cells must lie where the serial mesh
+        puts them, and the faces must stay within the global numbering.
+
+        >>> from fipy.tools.comms.dummyComm import _RankComm
+        >>> def checkPartition(cls, Nproc, **kwargs):
+        ...     serial = cls(communicator=_RankComm(), **kwargs)
+        ...     for procID in range(Nproc):
+        ...         m = cls(communicator=_RankComm(procID, Nproc), **kwargs)
+        ...         local = m.cellCenters.value[..., m._localNonOverlappingCellIDs]
+        ...         glob = serial.cellCenters.value[..., m._globalNonOverlappingCellIDs]
+        ...         print numerix.allclose(local, glob),
+        ...         print m._globalNonOverlappingFaceIDs.max() < serial.numberOfFaces
+        >>> checkPartition(PeriodicGrid2D, Nproc=3, nx=6, ny=6)
+        True True
+        True True
+        True True
+        >>> checkPartition(PeriodicGrid2D, Nproc=2, nx=6, ny=6)
+        True True
+        True True
+        >>> checkPartition(PeriodicGrid2DTopBottom, Nproc=3, nx=3, ny=6)
+        True True
+        True True
+        True True
+        """
+
+        pass
 
 class PeriodicGrid2DLeftRight(_BasePeriodicGrid2D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
+    _periodicAxes = (0,)
 
 class PeriodicGrid2DTopBottom(_BasePeriodicGrid2D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
+    _periodicAxes = (1,)
 
 def _test():
     import fipy.tests.doctestPlus
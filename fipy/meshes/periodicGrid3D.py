@@ -3,16 +3,24 @@
 """
 __docformat__ = 'restructuredtext'
 
+import functools
+
 from fipy.tools import numerix
 from fipy.tools import parallelComm
 from fipy.meshes.nonUniformGrid3D import NonUniformGrid3D
+from fipy.meshes.builders import _PeriodicGrid3DBuilder
 
 __all__ = ["PeriodicGrid3D", "PeriodicGrid3DLeftRight", "PeriodicGrid3DTopBottom",
            "PeriodicGrid3DFrontBack", "PeriodicGrid3DLeftRightTopBottom",
            "PeriodicGrid3DLeftRightFrontBack", "PeriodicGrid3DTopBottomFrontBack"]
 
 class _BasePeriodicGrid3D(NonUniformGrid3D):
+
+    _periodicAxes = ()
+
     def __init__(self, dx=1., dy=1., dz=1., nx=None, ny=None, nz=None, overlap=2, communicator=parallelComm, *args, **kwargs):
+        kwargs["_BuilderClass"] = functools.partial(_PeriodicGrid3DBuilder,
+                                                    periodicAxes=self._periodicAxes)
         super(_BasePeriodicGrid3D, self).__init__(dx=dx, dy=dy, dz=dz, nx=nx, ny=ny, nz=nz, overlap=overlap, communicator=communicator, *args, **kwargs)
         self._nonPeriodicCellVertexIDs = super(_BasePeriodicGrid3D, self)._cellVertexIDs
         self._orderedCellVertexIDs_data = super(_BasePeriodicGrid3D, self)._orderedCellVertexIDs
@@ -23,6 +31,18 @@ class _BasePeriodicGrid3D(NonUniformGrid3D):
     def _cellVertexIDs(self):
         return self._nonPeriodicCellVertexIDs
 
+    def _makePeriodic(self):
+        boundaries = (("facesLeft", "facesRight"),
+                      ("facesBottom", "facesTop"),
+                      ("facesFront", "facesBack"))
+        for axis in self._periodicAxes:
+            # along an axis that is split among processes, the ghost cells
+            # wrap around the periodic boundary instead
+            if self._processShape[axis] == 1:
+                lower, upper = boundaries[axis]
+                self._connectFaces(numerix.nonzero(getattr(self, lower)),
+                                   numerix.nonzero(getattr(self, upper)))
+
     def _translate(self, vector):
         """
         Test for ticket:298.
@@ -112,13 +132,7 @@ class PeriodicGrid3D(_BasePeriodicGrid3D):
         True
     """
 
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
-        self._connectFaces(numerix.nonzero(self.facesFront),
-                           numerix.nonzero(self.facesBack))
+    _periodicAxes = (0, 1, 2)
 
     def _test(self):
         """
@@ -133,47 +147,43 @@ class PeriodicGrid3D(_BasePeriodicGrid3D):
         >>> (fp.TransientTerm() == fp.DiffusionTerm()).solve(v, dt=1.)
         >>> assert numerix.allclose(v[13], v[26]) # doctest: +PROCESSOR_0
 
+        Each process's own cells lie where the serial mesh puts them,
+        even when a block and its ghost cells span the whole periodic
+        axis.
+
+        >>> from fipy.tools.comms.dummyComm import _RankComm
+        >>> serial = fp.PeriodicGrid3D(nx=4, ny=4, nz=4, communicator=_RankComm())
+        >>> for procID in range(2):
+        ...     m = fp.PeriodicGrid3D(nx=4, ny=4, nz=4,
+        ...                           communicator=_RankComm(procID, 2))
+        ...     local = m.cellCenters.value[..., m._localNonOverlappingCellIDs]
+        ...     glob = serial.cellCenters.value[..., m._globalNonOverlappingCellIDs]
+        ...     print numerix.allclose(local, glob),
+        ...     print m._globalNonOverlappingFaceIDs.max() < serial.numberOfFaces
+        True True
+        True True
+
         """
 
         pass
 
 class PeriodicGrid3DLeftRight(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
+    _periodicAxes = (0,)
 
 class PeriodicGrid3DLeftRightTopBottom(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
+    _periodicAxes = (0, 1)
 
 class PeriodicGrid3DLeftRightFrontBack(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesLeft),
-                           numerix.nonzero(self.facesRight))
-        self._connectFaces(numerix.nonzero(self.facesFront),
-                           numerix.nonzero(self.facesBack))
+    _periodicAxes = (0, 2)
 
 class PeriodicGrid3DTopBottom(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
+    _periodicAxes = (1,)
 
 class PeriodicGrid3DTopBottomFrontBack(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesBottom),
-                           numerix.nonzero(self.facesTop))
-        self._connectFaces(numerix.nonzero(self.facesFront),
-                           numerix.nonzero(self.facesBack))
+    _periodicAxes = (1, 2)
 
 class PeriodicGrid3DFrontBack(_BasePeriodicGrid3D):
-    def _makePeriodic(self):
-        self._connectFaces(numerix.nonzero(self.facesFront),
-                           numerix.nonzero(self.facesBack))
-
-
+    _periodicAxes = (2,)
 
 def _test():
     import fipy.tests.doctestPlus
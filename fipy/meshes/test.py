@@ -15,6 +15,9 @@ def _suite():
         'fipy.meshes.nonUniformGrid3D',
         'fipy.meshes.tri2D',
         'fipy.meshes.gmshMesh',
+        'fipy.meshes.meshCache',
+        'fipy.meshes.globalLayout',
+        'fipy.meshes.haloExchange',
         'fipy.meshes.periodicGrid1D',
         'fipy.meshes.periodicGrid2D',
         'fipy.meshes.periodicGrid3D',
@@ -27,7 +30,9 @@ def _suite():
         'fipy.meshes.cylindricalNonUniformGrid2D',
         'fipy.meshes.factoryMeshes',
         'fipy.meshes.abstractMesh',
-        'fipy.meshes.representations.gridRepresentation'))
+        'fipy.meshes.representations.gridRepresentation',
+        'fipy.meshes.builders.abstractGridBuilder',
+        'fipy.meshes.topologies.gridTopology'))
 
 if __name__ == '__main__':
     fipy.tests.testProgram.main(defaultTest='_suite')
@@ -16,6 +16,50 @@ class _GridTopology(_AbstractTopology):
     def _isOrthogonal(self):
         return True
 
+    @staticmethod
+    def _blockIDs(shape, lower, upper, offset=None):
+        """Return the IDs, in a grid of `shape` cells numbered with the
+        first axis changing most quickly, of the block of cells from `lower`
+        up to, but not including, `upper`.
+
+        If given, `offset` shifts the block along each axis. Indices that
+        pass the end of an axis wrap around to its beginning, as they do
+        for the ghost cells of periodic grids.
+
+        >>> print _GridTopology._blockIDs((4, 3), (1, 0), (3, 2))
+        [1 2 5 6]
+        >>> print _GridTopology._blockIDs((4, 3), (0, 0), (2, 2), offset=(3, 2))
+        [11  8  3  0]
+        """
+        if offset is None:
+            offset = [0] * len(shape)
+
+        ids = numerix.zeros((), 'l')
+        stride = 1
+        for n, l, u, o in zip(shape, lower, upper, offset):
+            index = (numerix.arange(l, u) + o) % (n or 1)
+            # each later axis changes more slowly, so it goes in front
+            ids = numerix.add.outer(index * stride, ids)
+            stride *= n
+
+        return numerix.ravel(ids)
+
+    _lowerOverlaps = ('left', 'bottom', 'front')
+    _upperOverlaps = ('right', 'top', 'back')
+
+    def _cellIDs(self, overlapping, offset=None):
+        shape = self.mesh.shape
+        if overlapping:
+            lower = [0] * len(shape)
+            upper = shape
+        else:
+            lower = [self.mesh.overlap[name] for name in self._lowerOverlaps[:len(shape)]]
+            upper = [n - self.mesh.overlap[name] for n, name in zip(shape, self._upperOverlaps)]
+        if offset is None:
+            return self._blockIDs(shape, lower, upper)
+        else:
+            return self._blockIDs(self.mesh._globalShape, lower, upper, offset)
+
 class _Grid1DTopology(_GridTopology):
 
     _concatenatedClass = Mesh1D
@@ -191,8 +235,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[1] + self.mesh.overlap['bottom']) * self.mesh.nx,
-                              (self.mesh.offset[1] + self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._cellIDs(overlapping=False, offset=self.mesh.offset)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -212,7 +255,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.offset[1] * self.mesh.nx, (self.mesh.offset[1] + self.mesh.ny) * self.mesh.nx)
+        return self._cellIDs(overlapping=True, offset=self.mesh.offset)
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -232,8 +275,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['bottom'] * self.mesh.nx,
-                              (self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._cellIDs(overlapping=False)
 
     @property
     def _localOverlappingCellIDs(self):
@@ -253,7 +295,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(0, self.mesh.ny * self.mesh.nx)
+        return self._cellIDs(overlapping=True)
 
     @property
     def _cellTopology(self):
@@ -276,8 +318,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[2] + self.mesh.overlap['front']) * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._cellIDs(overlapping=False, offset=self.mesh.offset)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -287,9 +328,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-
-        return numerix.arange(self.mesh.offset[2] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz) * self.mesh.nx * self.mesh.ny)
+        return self._cellIDs(overlapping=True, offset=self.mesh.offset)
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -299,8 +338,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['front'] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._cellIDs(overlapping=False)
 
     @property
     def _localOverlappingCellIDs(self):
@@ -310,7 +348,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(0, self.mesh.ny * self.mesh.nx * self.mesh.nz)
+        return self._cellIDs(overlapping=True)
 
     @property
     def _cellTopology(self):
@@ -325,3 +363,10 @@ class _PeriodicGrid1DTopology(_Grid1DTopology):
     @property
     def _globalOverlappingCellIDs(self):
         return super(_PeriodicGrid1DTopology, self)._globalOverlappingCellIDs % self.mesh.args['nx']
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
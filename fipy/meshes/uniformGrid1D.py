@@ -66,6 +66,8 @@ class UniformGrid1D(UniformGrid):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.occupiedNodes,
          self.origin) = builder.gridData
 
@@ -59,6 +59,8 @@ class UniformGrid2D(UniformGrid):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.numberOfHorizontalRows,
          self.numberOfVerticalColumns,
          self.numberOfHorizontalFaces,
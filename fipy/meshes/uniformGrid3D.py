@@ -67,6 +67,8 @@ class UniformGrid3D(UniformGrid):
          self.shape,
          self.physicalShape,
          self._meshSpacing,
+         self._globalShape,
+         self._processShape,
          self.numberOfXYFaces,
          self.numberOfXZFaces,
          self.numberOfYZFaces,
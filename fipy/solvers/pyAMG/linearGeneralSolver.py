@@ -18,4 +18,10 @@ class LinearGeneralSolver(_ScipySolver):
         else:
             verbosity = False
 
-        return solve(L.matrix, b, verb=verbosity, tol=self.tolerance)
+        x = solve(L.matrix, b, verb=verbosity, tol=self.tolerance)
+
+        # `pyamg.solve` reports neither its iterations nor whether it
+        # converged
+        self._setResult(residuals=[numerix.L2norm(b - L.matrix * x) / (numerix.L2norm(b) or 1.)])
+
+        return x
@@ -1,10 +1,12 @@
 from pyamg import smoothed_aggregation_solver
 
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+
 __all__ = ["SmoothedAggregationPreconditioner"]
 
-class SmoothedAggregationPreconditioner():
-    def __init__(self):
-        pass
+class SmoothedAggregationPreconditioner(Preconditioner):
+    def __init__(self, reuse=False):
+        Preconditioner.__init__(self, reuse=reuse)
 
-    def _applyToMatrix(self, A):
+    def _makePreconditioner(self, A, numberOfBlocks):
         return smoothed_aggregation_solver(A).aspreconditioner(cycle='V')
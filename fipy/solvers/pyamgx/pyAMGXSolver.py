@@ -71,6 +71,13 @@ class PyAMGXSolver(Solver):
 
         # download values from GPU to CPU
         self.x_gpu.download(x)
+
+        status = self.solver.status
+        self._setResult(iterations=self.solver.iterations_number,
+                        residuals=[numerix.L2norm(b - L.matrix * x) / (numerix.L2norm(b) or 1.)],
+                        converged=(status == "success"),
+                        reason=status)
+
         return x
 
     def _solve(self):
@@ -37,6 +37,7 @@ class LinearJORSolver(PysparseSolver):
         tol = 1e+10
         xold = x.copy()
 
+        residuals = []
         for iteration in range(self.iterations):
             if tol <= self.tolerance:
                 break
@@ -49,5 +50,15 @@ class LinearJORSolver(PysparseSolver):
             x[:] = xold + self.relaxation * (x - xold)
 
             tol = max(abs(residual))
+            residuals.append(tol)
 
             print iteration,tol
+
+        if tol <= self.tolerance:
+            reason = "converged"
+        else:
+            reason = "MaximumIterationWarning"
+        self._setResult(iterations=len(residuals),
+                        residuals=residuals,
+                        converged=(tol <= self.tolerance),
+                        reason=reason)
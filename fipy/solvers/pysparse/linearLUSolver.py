@@ -58,17 +58,31 @@ class LinearLUSolver(PysparseSolver):
 
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
+        residuals = []
+        converged = False
         for iteration in range(self.iterations):
             errorVector = L * x - b
 
-            if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
+            residuals.append(numerix.sqrt(numerix.sum(errorVector**2)))
+
+            if residuals[-1] <= self.tolerance * error0:
+                converged = True
                 break
 
             xError = numerix.zeros(len(b),'d')
             LU.solve(errorVector, xError)
             x[:] = x - xError
 
+        if converged:
+            reason = "converged"
+        else:
+            reason = "MaximumIterationWarning"
+        self._setResult(iterations=iteration + 1,
+                        residuals=residuals,
+                        converged=converged,
+                        reason=reason)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration+1, self.iterations))
-            PRINT('residual:', numerix.sqrt(numerix.sum(errorVector**2)))
+            PRINT('residual:', residuals[-1])
@@ -42,6 +42,15 @@ class PysparseSolver(_PysparseMatrixSolver):
 
         self._raiseWarning(info, iter, relres)
 
+        if info < 0:
+            reason = self._warningList[info].__name__
+        else:
+            reason = "converged"
+        self._setResult(iterations=iter,
+                        residuals=[relres],
+                        converged=(info >= 0),
+                        reason=reason)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iter, self.iterations))
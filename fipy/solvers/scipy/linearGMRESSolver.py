@@ -12,13 +12,17 @@ class LinearGMRESSolver(_ScipyKrylovSolver):
     Scipy, with no preconditioning by default.
     """
 
-    def __init__(self, tolerance=1e-15, iterations=2000, precon=None):
+    _callbackResidual = True
+
+    def __init__(self, tolerance=1e-15, iterations=2000, precon=None, warmStart=False):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
           - `precon`: Preconditioner to use.
+          - `warmStart`: Start each time step from the solution extrapolated
+            from the previous two time steps.
         """
 
-        super(LinearGMRESSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon)
+        super(LinearGMRESSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon, warmStart=warmStart)
         self.solveFnc = gmres
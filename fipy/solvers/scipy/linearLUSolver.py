@@ -14,8 +14,80 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorization.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` moduleq.
+
+    The factorization is kept between calls to the same solver. It is
+    reused as is if the matrix has not changed and, if only the matrix
+    values have changed, the new factorization reuses the column
+    permutation of the last one.
+
+    >>> from fipy import *
+    >>> m = Grid1D(nx=10)
+    >>> v = CellVariable(mesh=m, hasOld=True)
+    >>> v.constrain(1., where=m.facesLeft)
+    >>> D = Variable(1.)
+    >>> eq = TransientTerm() == DiffusionTerm(coeff=D)
+    >>> solver = LinearLUSolver()
+    >>> eq.solve(v, dt=1., solver=solver)
+    >>> LU = solver._factorization[3]
+
+    >>> v.updateOld()
+    >>> eq.solve(v, dt=1., solver=solver)
+    >>> solver._factorization[3] is LU
+    True
+
+    >>> D.value = 2.
+    >>> eq.solve(v, dt=1., solver=solver)
+    >>> solver._factorization[3] is LU
+    False
+    >>> solver._factorization[4] is not None
+    True
+
+    >>> v2 = CellVariable(mesh=m, value=v.old)
+    >>> v2.constrain(1., where=m.facesLeft)
+    >>> eq2 = TransientTerm() == DiffusionTerm(coeff=2.)
+    >>> eq2.solve(v2, dt=1., solver=LinearLUSolver())
+    >>> print numerix.allclose(v, v2)
+    True
     """
 
+    _factorization = None
+
+    def _factorize(self, L):
+        """Return a callable that solves with the LU-factorization of `L`.
+
+        The factorization of the last matrix is stored as
+        `(indptr, indices, data, LU, perm)`, where `perm` is the column
+        permutation that was applied before factorizing, or `None`.
+        """
+        A = L.matrix.asformat("csc")
+
+        cached = self._factorization
+        if (cached is not None
+            and numerix.array_equal(cached[0], A.indptr)
+            and numerix.array_equal(cached[1], A.indices)):
+            indptr, indices, data, LU, perm = cached
+            if not numerix.array_equal(data, A.data):
+                if perm is None:
+                    perm = LU.perm_c
+                LU = splu(A[:, numerix.argsort(perm)].asformat("csc"),
+                          diag_pivot_thresh=1.,
+                          relax=1,
+                          panel_size=10,
+                          permc_spec="NATURAL")
+        else:
+            LU = splu(A, diag_pivot_thresh=1.,
+                         relax=1,
+                         panel_size=10,
+                         permc_spec=3)
+            perm = None
+
+        self._factorization = (A.indptr.copy(), A.indices.copy(), A.data.copy(), LU, perm)
+
+        if perm is None:
+            return LU.solve
+        else:
+            return lambda b: LU.solve(b)[perm]
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
         maxdiag = max(numerix.absolute(diag))
@@ -23,25 +95,43 @@ class LinearLUSolver(_ScipySolver):
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+        solveLU = self._factorize(L)
 
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
+        residuals = []
+        converged = False
         for iteration in range(min(self.iterations, 10)):
             errorVector = L * x - b
 
-            if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
+            residuals.append(numerix.sqrt(numerix.sum(errorVector**2)))
+
+            if residuals[-1] <= self.tolerance * error0:
+                converged = True
                 break
 
-            xError = LU.solve(errorVector)
+            xError = solveLU(errorVector)
             x[:] = x - xError
 
+        if converged:
+            reason = "converged"
+        else:
+            reason = "MaximumIterationWarning"
+        self._setResult(iterations=iteration + 1,
+                        residuals=residuals,
+                        converged=converged,
+                        reason=reason)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration+1, self.iterations))
-            PRINT('residual:', numerix.sqrt(numerix.sum(errorVector**2)))
+            PRINT('residual:', residuals[-1])
 
         return x
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,10 @@
+from fipy.solvers.scipy.preconditioners.jacobiPreconditioner import *
+from fipy.solvers.scipy.preconditioners.blockJacobiPreconditioner import *
+from fipy.solvers.scipy.preconditioners.iluPreconditioner import *
+from fipy.solvers.scipy.preconditioners.ssorPreconditioner import *
+
+__all__ = []
+__all__.extend(jacobiPreconditioner.__all__)
+__all__.extend(blockJacobiPreconditioner.__all__)
+__all__.extend(iluPreconditioner.__all__)
+__all__.extend(ssorPreconditioner.__all__)
@@ -0,0 +1,36 @@
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator, splu
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+from fipy.tools import numerix
+
+__all__ = ["BlockJacobiPreconditioner"]
+
+class BlockJacobiPreconditioner(Preconditioner):
+    """
+    Block-Jacobi preconditioner for the Scipy solvers.
+
+    Each diagonal block of a coupled system, i.e., the coupling of each
+    equation to its own solution variable, is factorized exactly with
+    `scipy.sparse.linalg.splu`; the off-diagonal coupling blocks are
+    ignored. For a single equation this is a complete LU-factorization.
+    """
+
+    def _makePreconditioner(self, A, numberOfBlocks):
+        N = A.shape[0]
+        size = N // numberOfBlocks
+        bounds = [(i * size, (i + 1) * size) for i in range(numberOfBlocks)]
+
+        LUs = [splu(A[start:stop, start:stop].asformat("csc"),
+                    diag_pivot_thresh=1.,
+                    relax=1,
+                    panel_size=10,
+                    permc_spec=3) for start, stop in bounds]
+
+        def matvec(x):
+            x = numerix.ravel(x)
+            return numerix.concatenate([LU.solve(x[start:stop])
+                                        for LU, (start, stop) in zip(LUs, bounds)])
+
+        return LinearOperator(A.shape, matvec=matvec, dtype=A.dtype)
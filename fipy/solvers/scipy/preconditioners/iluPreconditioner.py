@@ -0,0 +1,34 @@
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator, spilu
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+
+__all__ = ["ILUPreconditioner"]
+
+class ILUPreconditioner(Preconditioner):
+    """
+    Incomplete LU preconditioner for the Scipy solvers.
+    Really just a wrapper class for `scipy.sparse.linalg.spilu`.
+    """
+
+    def __init__(self, dropTolerance=1e-4, fillFactor=20, reuse=False):
+        """
+        :Parameters:
+          - `dropTolerance`: Entries of the factors smaller than this are
+            dropped.
+          - `fillFactor`: Upper bound on the fill of the factors, relative
+            to the number of nonzeros of the matrix. Entries dropped to
+            honor a tight bound can spoil the preconditioner.
+          - `reuse`: Keep the factorization until the structure of the
+            matrix changes.
+        """
+        Preconditioner.__init__(self, reuse=reuse)
+        self.dropTolerance = dropTolerance
+        self.fillFactor = fillFactor
+
+    def _makePreconditioner(self, A, numberOfBlocks):
+        ILU = spilu(A.asformat("csc"),
+                    drop_tol=self.dropTolerance,
+                    fill_factor=self.fillFactor)
+        return LinearOperator(A.shape, matvec=ILU.solve, dtype=A.dtype)
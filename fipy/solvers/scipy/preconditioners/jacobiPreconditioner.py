@@ -0,0 +1,21 @@
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse import diags
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+from fipy.tools import numerix
+
+__all__ = ["JacobiPreconditioner"]
+
+class JacobiPreconditioner(Preconditioner):
+    """
+    Jacobi preconditioner for the Scipy solvers.
+
+    Scales by the inverse of the matrix diagonal; zero diagonal entries
+    are left unscaled.
+    """
+
+    def _makePreconditioner(self, A, numberOfBlocks):
+        diagonal = numerix.array(A.diagonal(), dtype=float)
+        diagonal[diagonal == 0] = 1.
+        return diags(1. / diagonal, format="csr")
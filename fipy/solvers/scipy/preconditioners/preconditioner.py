@@ -0,0 +1,111 @@
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = ["Preconditioner"]
+
+class Preconditioner:
+    """
+    The base Preconditioner class for the Scipy solvers.
+
+    .. attention:: This class is abstract. Always create one of its subclasses.
+
+    All the preconditioners give the same solution to a coupled system
+
+    >>> from fipy import *
+    >>> from fipy.solvers.scipy.preconditioners import *
+    >>> m = Grid2D(nx=10, ny=10)
+    >>> v0 = CellVariable(mesh=m)
+    >>> v1 = CellVariable(mesh=m)
+    >>> v0.constrain(1., where=m.facesLeft)
+    >>> v1.constrain(0., where=m.facesRight)
+    >>> eq0 = DiffusionTerm(coeff=1., var=v0) - ImplicitSourceTerm(coeff=1., var=v1)
+    >>> eq1 = DiffusionTerm(coeff=2., var=v1) - ImplicitSourceTerm(coeff=1., var=v0)
+    >>> eq = eq0 & eq1
+    >>> eq.solve(solver=LinearLUSolver())
+    >>> exact = numerix.array(eq.var)
+    >>> for precon in (JacobiPreconditioner(), BlockJacobiPreconditioner(),
+    ...                ILUPreconditioner(), SsorPreconditioner(),
+    ...                SsorPreconditioner(omega=1.5, reuse=True)):
+    ...     v0.value = v1.value = 0.
+    ...     eq.solve(solver=LinearGMRESSolver(tolerance=1e-12, precon=precon))
+    ...     print precon.__class__.__name__, numerix.allclose(eq.var, exact)
+    JacobiPreconditioner True
+    BlockJacobiPreconditioner True
+    ILUPreconditioner True
+    SsorPreconditioner True
+    SsorPreconditioner True
+
+    and, with `reuse`, the preconditioner is only rebuilt when the structure
+    of the matrix changes
+
+    >>> precon = ILUPreconditioner(reuse=True)
+    >>> v = CellVariable(mesh=m, hasOld=True)
+    >>> v.constrain(1., where=m.facesLeft)
+    >>> D = Variable(1.)
+    >>> eq = TransientTerm() == DiffusionTerm(coeff=D)
+    >>> solver = LinearPCGSolver(tolerance=1e-12, precon=precon)
+    >>> eq.solve(v, dt=1., solver=solver)
+    >>> M = precon._preconditioner[-1]
+    >>> D.value = 2.
+    >>> eq.solve(v, dt=1., solver=solver)
+    >>> precon._preconditioner[-1] is M
+    True
+    >>> v2 = CellVariable(mesh=Grid2D(nx=5, ny=5), hasOld=True)
+    >>> eq2 = TransientTerm() == DiffusionTerm(coeff=D)
+    >>> eq2.solve(v2, dt=1., solver=solver)
+    >>> precon._preconditioner[-1] is M
+    False
+    """
+
+    def __init__(self, reuse=False):
+        """
+        Create a `Preconditioner` object.
+
+        :Parameters:
+          - `reuse`: If `True`, the preconditioner is only rebuilt when the
+            structure of the matrix changes, not when its values do, e.g.,
+            between sweeps or time steps.
+        """
+        if self.__class__ is Preconditioner:
+            raise NotImplementedError, "can't instantiate abstract base class"
+
+        self.reuse = reuse
+        self._preconditioner = None
+
+    def _applyToMatrix(self, A, numberOfBlocks=1):
+        """
+        Returns the preconditioner for `A`, suitable as the `M` argument
+        of the `scipy.sparse.linalg` solvers.
+
+        :Parameters:
+          - `A`: The `scipy.sparse` matrix to precondition.
+          - `numberOfBlocks`: The number of coupled equations in `A`.
+        """
+        A = A.asformat("csr")
+
+        if self.reuse and self._preconditioner is not None:
+            shape, blocks, indptr, indices, M = self._preconditioner
+            if (shape == A.shape
+                and blocks == numberOfBlocks
+                and numerix.array_equal(indptr, A.indptr)
+                and numerix.array_equal(indices, A.indices)):
+                return M
+
+        M = self._makePreconditioner(A, numberOfBlocks)
+
+        if self.reuse:
+            self._preconditioner = (A.shape, numberOfBlocks,
+                                    A.indptr.copy(), A.indices.copy(), M)
+
+        return M
+
+    def _makePreconditioner(self, A, numberOfBlocks):
+        raise NotImplementedError
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
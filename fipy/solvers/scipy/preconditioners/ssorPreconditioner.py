@@ -0,0 +1,56 @@
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse import diags, tril, triu
+from scipy.sparse.linalg import LinearOperator, splu
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+from fipy.tools import numerix
+
+__all__ = ["SsorPreconditioner"]
+
+class SsorPreconditioner(Preconditioner):
+    r"""
+    SSOR preconditioner for the Scipy solvers.
+
+    For :math:`A = L + D + U`, applies the inverse of
+
+    .. math::
+
+       M = \frac{1}{\omega (2 - \omega)} (D + \omega L) D^{-1} (D + \omega U)
+
+    using a forward and a backward triangular solve.
+    """
+
+    def __init__(self, omega=1., reuse=False):
+        """
+        :Parameters:
+          - `omega`: The relaxation parameter, between 0 and 2.
+          - `reuse`: Keep the preconditioner until the structure of the
+            matrix changes.
+        """
+        Preconditioner.__init__(self, reuse=reuse)
+        self.omega = omega
+
+    @staticmethod
+    def _triangularSolver(T):
+        # the natural ordering without pivoting factorizes a triangular
+        # matrix without fill, so the solves run in SuperLU
+        return splu(T.asformat("csc"),
+                    permc_spec="NATURAL",
+                    diag_pivot_thresh=0.,
+                    options=dict(SymmetricMode=True)).solve
+
+    def _makePreconditioner(self, A, numberOfBlocks):
+        omega = self.omega
+        diagonal = numerix.array(A.diagonal(), dtype=float)
+        diagonal[diagonal == 0] = 1.
+        D = diags(diagonal, format="csr")
+
+        lower = self._triangularSolver(D + omega * tril(A, k=-1))
+        upper = self._triangularSolver(D + omega * triu(A, k=1))
+        scale = omega * (2. - omega)
+
+        def matvec(x):
+            return scale * upper(diagonal * lower(numerix.ravel(x)))
+
+        return LinearOperator(A.shape, matvec=matvec, dtype=A.dtype)
@@ -5,28 +5,126 @@ __all__ = []
 import os
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.tools import numerix
 
 class _ScipyKrylovSolver(_ScipySolver):
     """
     The base `ScipyKrylovSolver` class.
 
     .. attention:: This class is abstract. Always create one of its subclasses.
+
+    With `warmStart`, the first solve of a time step starts from the
+    solution extrapolated from the two previous old values
+
+    >>> from fipy import *
+    >>> v = CellVariable(mesh=Grid1D(nx=3), value=1., hasOld=True)
+    >>> solver = LinearPCGSolver(warmStart=True)
+    >>> solver.var = v
+    >>> solver._warmStart()
+    False
+    >>> v.value = 2.
+    >>> v.updateOld()
+    >>> solver._warmStart()
+    True
+    >>> print v
+    [ 3.  3.  3.]
+
+    but later sweeps start from the current value
+
+    >>> solver._warmStart()
+    False
+
+    The solution is unchanged
+
+    >>> m = Grid1D(nx=50)
+    >>> v1 = CellVariable(mesh=m, hasOld=True)
+    >>> v2 = CellVariable(mesh=m, hasOld=True)
+    >>> for v in (v1, v2):
+    ...     v.constrain(1., where=m.facesLeft)
+    >>> eq1 = TransientTerm() == DiffusionTerm(coeff=1.)
+    >>> eq2 = TransientTerm() == DiffusionTerm(coeff=1.)
+    >>> solver1 = LinearPCGSolver(tolerance=1e-12)
+    >>> solver2 = LinearPCGSolver(tolerance=1e-12, warmStart=True)
+    >>> for step in range(5):
+    ...     v1.updateOld()
+    ...     v2.updateOld()
+    ...     eq1.solve(v1, dt=1., solver=solver1)
+    ...     eq2.solve(v2, dt=1., solver=solver2)
+    >>> print numerix.allclose(v1, v2)
+    True
     """
 
+    def __init__(self, tolerance=1e-15, iterations=2000, precon=None, warmStart=False):
+        """
+        :Parameters:
+          - `tolerance`: The required error tolerance.
+          - `iterations`: The maximum number of iterative steps to perform.
+          - `precon`: Preconditioner to use.
+          - `warmStart`: Start each time step from the solution extrapolated
+            from the previous two time steps.
+        """
+        if self.__class__ is _ScipyKrylovSolver:
+            raise NotImplementedError, "can't instantiate abstract base class"
+
+        super(_ScipyKrylovSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon)
+        self.warmStart = warmStart
+
+    # whether `solveFnc` passes the residual norm to its callback, rather
+    # than the solution
+    _callbackResidual = False
+
+    def _solve(self):
+        self._warmStart()
+        super(_ScipyKrylovSolver, self)._solve()
+
     def _solve_(self, L, x, b):
         A = L.matrix
         if self.preconditioner is None:
             M = None
         else:
-            M = self.preconditioner._applyToMatrix(A)
+            M = self.preconditioner._applyToMatrix(A, numberOfBlocks=L.numberOfVariables)
+
+        iterations = [0]
+        residuals = []
+        bnorm = numerix.L2norm(b) or 1.
+        def callback(xk):
+            iterations[0] += 1
+            if self._callbackResidual:
+                residuals.append(xk)
+            elif self._residualHistory:
+                residuals.append(numerix.L2norm(b - A * xk) / bnorm)
 
         x, info = self.solveFnc(A, b, x,
                                 tol=self.tolerance,
                                 maxiter=self.iterations,
-                                M=M)
+                                M=M,
+                                callback=callback)
+
+        if len(residuals) == 0 or not (self._callbackResidual or self._residualHistory):
+            residuals = [numerix.L2norm(b - A * x) / bnorm]
+
+        if info == 0:
+            reason = "converged"
+        elif info > 0:
+            reason = "MaximumIterationWarning"
+        else:
+            reason = "breakdown"
+        self._setResult(iterations=iterations[0],
+                        residuals=residuals,
+                        converged=(info == 0),
+                        reason=reason)
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
-            if info < 0:
-                PRINT('failure', self._warningList[info].__class__.__name__)
+            from fipy.tools.debug import PRINT
+            PRINT('iterations: %d / %d' % (iterations[0], self.iterations))
+            PRINT('reason:', reason)
+            PRINT('residual:', self.result.residual)
 
         return x
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
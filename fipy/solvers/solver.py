@@ -13,12 +13,17 @@ can abort whenever it has problems with::
 """
 __docformat__ = 'restructuredtext'
 
+import time
+import weakref
+
 from fipy.tools import numerix
+from fipy.tools.performance import instrumentation
 
 __all__ = ["SolverConvergenceWarning", "MaximumIterationWarning",
            "PreconditionerWarning", "IllConditionedPreconditionerWarning",
            "PreconditionerNotPositiveDefiniteWarning", "MatrixIllConditionedWarning",
-           "StagnatedSolverWarning", "ScalarQuantityOutOfRangeWarning", "Solver"]
+           "StagnatedSolverWarning", "ScalarQuantityOutOfRangeWarning", "Solver",
+           "SolverResult"]
 
 class SolverConvergenceWarning(Warning):
     def __init__(self, solver, iter, relres):
@@ -56,6 +61,79 @@ class ScalarQuantityOutOfRangeWarning(SolverConvergenceWarning):
     def __str__(self):
         return "A scalar quantity became too small or too large to continue computing. Iterations: %g. Relative error: %g" % (self.iter, self.relres)
 
+class SolverResult(object):
+    """
+    What a solver reports of one solve of a linear system.
+
+    It is kept as the `result` of the solver, and is returned by
+    :meth:`~fipy.terms.term.Term.solve` and
+    :meth:`~fipy.terms.term.Term.sweep` when `returnResult` is `True`
+
+        >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm, LinearLUSolver
+        >>> mesh = Grid1D(nx=10)
+        >>> phi = CellVariable(mesh=mesh, value=0.)
+        >>> phi.constrain(1., where=mesh.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=1.)
+        >>> result = eq.solve(var=phi, dt=1., solver=LinearLUSolver(), returnResult=True)
+        >>> print result.solver, result.converged, result.reason
+        LinearLUSolver True converged
+        >>> print result.iterations == len(result.residuals), result.residual < 1e-10
+        True True
+        >>> print result.time > 0
+        True
+
+    :Attributes:
+      - `solver`: the name of the solver class
+      - `iterations`: the number of iterations, or `None` if the backend
+        does not report it
+      - `residuals`: the residual norms that the backend reports, from the
+        first iteration to the last. The norms, and whether they are
+        scaled, differ from one backend to another. Backends that do not
+        report every iteration only give the final residual, and the
+        Krylov solvers of SciPy, other than GMRES, only give the whole
+        history when a result is asked for.
+      - `residual`: the last of `residuals`, or `None`
+      - `converged`: whether the solver reached its tolerance, or `None`
+        if the backend does not say
+      - `reason`: why the solver stopped, e.g., "converged" or the name
+        of a `SolverConvergenceWarning`
+      - `time`: the wall time of the solve, in seconds
+    """
+    def __init__(self, solver, iterations=None, residuals=(), converged=None, reason=None):
+        self.solver = solver
+        self.iterations = iterations
+        self.residuals = [float(residual) for residual in residuals]
+        self.converged = converged
+        self.reason = reason
+        self.time = 0.
+
+    @property
+    def residual(self):
+        if len(self.residuals) > 0:
+            return self.residuals[-1]
+        else:
+            return None
+
+    def __repr__(self):
+        return "%s(solver=%s, iterations=%s, residual=%s, converged=%s, reason=%s, time=%g)" \
+            % (self.__class__.__name__, self.solver, self.iterations, self.residual,
+               self.converged, repr(self.reason), self.time)
+
+# the `_SolverResults` that are collecting results
+_collectors = []
+
+class _SolverResults(list):
+    """
+    The `SolverResult` of every solve made within a ``with`` block.
+    """
+    def __enter__(self):
+        _collectors.append(self)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        _collectors.remove(self)
+        return False
+
 class Solver(object):
     """
     The base `LinearXSolver` class.
@@ -92,6 +170,95 @@ class Solver(object):
     def _solve_(self, L, x, b):
         raise NotImplementedError
 
+    result = None
+
+    # whether a backend that must do extra work to find the residual of
+    # each iteration should do it
+    _residualHistory = False
+
+    def _setResult(self, iterations=None, residuals=(), converged=None, reason=None):
+        """Called by the backend with what it knows of the solve."""
+        self.result = SolverResult(solver=self.__class__.__name__,
+                                   iterations=iterations,
+                                   residuals=residuals,
+                                   converged=converged,
+                                   reason=reason)
+
+    def _timedSolve(self, residualHistory=False):
+        """Solve, and return the `SolverResult` of the solve."""
+        self.result = None
+        self._residualHistory = residualHistory
+        try:
+            with instrumentation.timer("solve"):
+                start = time.time()
+                self._solve()
+                elapsed = time.time() - start
+        finally:
+            self._residualHistory = False
+
+        if self.result is None:
+            self._setResult()
+        self.result.time = elapsed
+
+        for collector in _collectors:
+            collector.append(self.result)
+
+        instrumentation.record("solver",
+                               name=self.result.solver,
+                               iterations=self.result.iterations,
+                               residual=self.result.residual,
+                               converged=self.result.converged,
+                               reason=self.result.reason)
+
+        return self.result
+
+    warmStart = False
+
+    def _warmStart(self):
+        """Start the first solve of each time step from a prediction.
+
+        When `warmStart` is set, the solution variable is extrapolated
+        linearly from its last two old values, assuming equal time
+        steps, instead of starting from its old value. Later sweeps of the
+        same time step, and variables that have been changed since
+        `updateOld()`, are left alone.
+
+        Returns `True` if the value of the solution variable was changed.
+        """
+        if not self.warmStart:
+            return False
+
+        vars = getattr(self.var, "vars", [self.var])
+        if any([getattr(var, "_old", None) is None for var in vars]):
+            return False
+
+        if not hasattr(self, "_oldValues"):
+            self._oldValues = {}
+
+        # keyed by `id`, as `Variable` comparisons are elementwise
+        for key, (refs, value) in self._oldValues.items():
+            if any([ref() is None for ref in refs]):
+                del self._oldValues[key]
+
+        IDs = tuple([id(var) for var in vars])
+        old = numerix.concatenate([numerix.array(var.old).ravel() for var in vars])
+
+        previous = self._oldValues.get(IDs, (None, None))[1]
+        self._oldValues[IDs] = ([weakref.ref(var) for var in vars], old)
+
+        if (previous is None
+            or previous.shape != old.shape
+            or numerix.array_equal(previous, old)):
+            return False
+
+        value = numerix.concatenate([numerix.array(var.value).ravel() for var in vars])
+        if not numerix.array_equal(value, old):
+            return False
+
+        self.var.value = numerix.reshape(2 * old - previous, self.var.shape)
+
+        return True
+
     def _applyUnderRelaxation(self, underRelaxation=None):
         if underRelaxation is not None:
             self.matrix.putDiagonal(numerix.asarray(self.matrix.takeDiagonal()) / underRelaxation)
@@ -15,14 +15,17 @@ class LinearBicgstabSolver(TrilinosAztecOOSolver):
 
     """
 
-    def __init__(self, tolerance=1e-10, iterations=1000, precon=JacobiPreconditioner()):
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=JacobiPreconditioner(), warmStart=False):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
           - `precon`: Preconditioner to use.
+          - `warmStart`: Start each time step from the solution extrapolated
+            from the previous two time steps.
 
         """
         TrilinosAztecOOSolver.__init__(self, tolerance=tolerance,
-                                       iterations=iterations, precon=precon)
+                                       iterations=iterations, precon=precon,
+                                       warmStart=warmStart)
         self.solver = AztecOO.AZ_bicgstab
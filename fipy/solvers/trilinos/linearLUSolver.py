@@ -38,6 +38,8 @@ class LinearLUSolver(TrilinosSolver):
 
     def _solve_(self, L, x, b):
 
+        residuals = []
+        converged = False
         for iteration in range(self.iterations):
              # errorVector = L*x - b
              errorVector = Epetra.Vector(L.RangeMap())
@@ -53,7 +55,10 @@ class LinearLUSolver(TrilinosSolver):
              if iteration == 0:
                  tol0 = tol
 
-             if (tol / tol0) <= self.tolerance:
+             residuals.append(errorVector.Norm2())
+
+             if tol <= self.tolerance * tol0:
+                 converged = True
                  break
 
              xError = Epetra.Vector(L.RowMap())
@@ -64,7 +69,16 @@ class LinearLUSolver(TrilinosSolver):
 
              x[:] = x - xError
 
+        if converged:
+            reason = "converged"
+        else:
+            reason = "MaximumIterationWarning"
+        self._setResult(iterations=iteration + 1,
+                        residuals=residuals,
+                        converged=converged,
+                        reason=reason)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration + 1, self.iterations))
-            PRINT('residual:', errorVector.Norm2())
+            PRINT('residual:', residuals[-1])
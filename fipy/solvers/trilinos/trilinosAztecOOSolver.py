@@ -16,12 +16,14 @@ class TrilinosAztecOOSolver(TrilinosSolver):
 
     """
 
-    def __init__(self, tolerance=1e-10, iterations=1000, precon=JacobiPreconditioner()):
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=JacobiPreconditioner(), warmStart=False):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
           - `precon`: Preconditioner object to use.
+          - `warmStart`: Start each time step from the solution extrapolated
+            from the previous two time steps.
 
         """
         if self.__class__ is TrilinosAztecOOSolver:
@@ -30,6 +32,21 @@ class TrilinosAztecOOSolver(TrilinosSolver):
         TrilinosSolver.__init__(self, tolerance=tolerance,
                                 iterations=iterations, precon=None)
         self.preconditioner = precon
+        self.warmStart = warmStart
+
+    _reasons = {AztecOO.AZ_normal : "converged",
+                AztecOO.AZ_param : "invalid parameter",
+                AztecOO.AZ_breakdown : "breakdown",
+                AztecOO.AZ_loss : "loss of precision",
+                AztecOO.AZ_ill_cond : "MatrixIllConditionedWarning",
+                AztecOO.AZ_maxits : "MaximumIterationWarning"}
+
+    def _solve(self):
+        if self._warmStart() and hasattr(self, 'globalVectors'):
+            # the vectors were built from the old value
+            del self.globalVectors
+
+        TrilinosSolver._solve(self)
 
     def _solve_(self, L, x, b):
 
@@ -51,9 +68,14 @@ class TrilinosAztecOOSolver(TrilinosSolver):
             if hasattr(self.preconditioner, 'Prec'):
                 del self.preconditioner.Prec
 
-        if 'FIPY_VERBOSE_SOLVER' in os.environ:
-            status = Solver.GetAztecStatus()
+        status = Solver.GetAztecStatus()
+        why = status[AztecOO.AZ_why]
+        self._setResult(iterations=int(status[AztecOO.AZ_its]),
+                        residuals=[status[AztecOO.AZ_r]],
+                        converged=(why == AztecOO.AZ_normal),
+                        reason=self._reasons.get(why, str(why)))
 
+        if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (status[AztecOO.AZ_its], self.iterations))
             failure = {AztecOO.AZ_normal : 'AztecOO.AZ_normal',
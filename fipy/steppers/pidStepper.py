@@ -16,6 +16,10 @@ class PIDStepper(Stepper):
            year =    2005,
            pages =   {201-231},
         }
+
+    The error of each step is the value returned by `sweepFn`, as
+    adjusted by `solverFn` from the effort of the linear solvers, so
+    that steps that were hard to solve can be rejected or shortened.
     """
     def __init__(self, vardata=(), proportional=0.075, integral=0.175, derivative=0.01):
         Stepper.__init__(self, vardata=vardata)
@@ -29,7 +33,7 @@ class PIDStepper(Stepper):
 
     def _step(self, dt, dtPrev, sweepFn, failFn, *args, **kwargs):
         while 1:
-            self.error[2] = sweepFn(vardata=self.vardata, dt=dt, *args, **kwargs)
+            self.error[2] = self._sweep(dt, sweepFn, *args, **kwargs)
 
             # omitting nsa > nsaMax check since it's unclear from
             # the paper what it's supposed to do
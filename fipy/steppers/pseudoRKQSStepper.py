@@ -21,7 +21,7 @@ class PseudoRKQSStepper(Stepper):
     def _step(self, dt, dtPrev, sweepFn, failFn, *args, **kwargs):
         residual = 1e100
         while residual > 1.:
-            residual = sweepFn(vardata=self.vardata, dt=dt, *args, **kwargs)
+            residual = self._sweep(dt, sweepFn, *args, **kwargs)
 
             if residual > 1.:
                 # step failed
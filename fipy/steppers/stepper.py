@@ -22,6 +22,31 @@ class Stepper:
         pass
     failFn = staticmethod(failFn)
 
+    def solverFn(vardata, dt, error, results, *args, **kwargs):
+        """
+        Return the error of a step, given the `error` returned by
+        `sweepFn` and the :class:`~fipy.solvers.solver.SolverResult` of
+        each solve made by `sweepFn`, e.g., to reject steps that the
+        solvers failed to converge, or that took them too many
+        iterations::
+
+            def solverFn(vardata, dt, error, results, *args, **kwargs):
+                if not all([result.converged for result in results]):
+                    return max(error, 2.)
+                return error
+        """
+        return error
+    solverFn = staticmethod(solverFn)
+
+    def _sweep(self, dt, sweepFn, *args, **kwargs):
+        from fipy.solvers.solver import _SolverResults
+
+        with _SolverResults() as results:
+            error = sweepFn(vardata=self.vardata, dt=dt, *args, **kwargs)
+
+        return self._solverFn(vardata=self.vardata, dt=dt,
+                              error=error, results=results, *args, **kwargs)
+
     def _lowerBound(self, dt):
         dt = max(dt, self.dtMin)
         if self.elapsed + dt == self.elapsed:
@@ -30,14 +55,15 @@ class Stepper:
         return dt
 
     def _step(self, dt, dtPrev, sweepFn, failFn, *args, **kwargs):
-        sweepFn(vardata=self.vardata, dt=dt, *args, **kwargs)
+        self._sweep(dt, sweepFn, *args, **kwargs)
         return dt, dt
 
     def step(self, dt, dtTry=None, dtMin=None, dtPrev=None,
-             sweepFn=None, successFn=None, failFn=None, *args, **kwargs):
+             sweepFn=None, successFn=None, failFn=None, solverFn=None, *args, **kwargs):
         sweepFn = sweepFn or self.sweepFn
         successFn = successFn or self.successFn
         failFn = failFn or self.failFn
+        self._solverFn = solverFn or self.solverFn
 
         dtTry = dtTry or dtMin or dt
         dtPrev = dtPrev or dtMin
@@ -152,6 +152,13 @@ class _AbstractConvectionTerm(FaceTerm):
             if (coeffShape is ()) or (coeffShape[0] != var.mesh.dim):
                 raise VectorCoeffError
 
+    def _getMaskedFaceVariables(self, var):
+        # faces with a constrained gradient use the unconstrained face value
+        if len(var.faceGrad.constraints) > 0:
+            return ()
+        else:
+            return (var.arithmeticFaceValue,)
+
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
 
         var, L, b = FaceTerm._buildMatrix(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
@@ -164,6 +164,12 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
             return None
 
+    def _dependsOnOld(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        return False
+
+    def _getMaskedFaceVariables(self, var):
+        return (var.faceGrad, var.arithmeticFaceValue)
+
     def _getCoefficientMatrixForTests(self, SparseMatrix, var, coeff):
         """
         This method was introduced because __getCoefficientMatrix is private, but
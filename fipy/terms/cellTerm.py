@@ -83,6 +83,10 @@ class CellTerm(_NonDiffusionTerm):
 
         return self.coeffVectors
 
+    def _dependsOnOld(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        weight = self._getWeight(var, transientGeomCoeff, diffusionGeomCoeff)
+        return numerix.any(numerix.asarray(weight['old value']) != 0)
+
     def _buildMatrixInline_(self, L, oldArray, b, dt, coeffVectors):
         oldArray = oldArray.value.ravel()
         N = len(oldArray)
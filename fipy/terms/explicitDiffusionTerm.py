@@ -19,6 +19,8 @@ class ExplicitDiffusionTerm(_AbstractDiffusionTerm):
 
     """
 
+    _reuseLinearSystem = False
+
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions = (), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         if hasattr(var, 'old'):
             varOld = var.old
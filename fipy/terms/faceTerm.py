@@ -125,6 +125,9 @@ class FaceTerm(_NonDiffusionTerm):
             vector.putAdd(b, id1, -(cell1diag * oldArrayId1 + cell1offdiag * oldArrayId2))
             vector.putAdd(b, id2, -(cell2diag * oldArrayId2 + cell2offdiag * oldArrayId1))
 
+    def _dependsOnOld(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        return 'explicit' in self._getWeight(var, transientGeomCoeff, diffusionGeomCoeff)
+
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         """Implicit portion considers
         """
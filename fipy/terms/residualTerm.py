@@ -20,6 +20,8 @@ class ResidualTerm(_ExplicitSourceTerm):
     def __repr__(self):
         return r"$\Delta$[" + repr(self.equation) + "]"
 
+    _reuseLinearSystem = False
+
     def _getGeomCoeff(self, var):
         return self.coeff
 
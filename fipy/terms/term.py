@@ -3,11 +3,62 @@ __docformat__ = 'restructuredtext'
 import os
 
 from fipy.tools import numerix
+from fipy.tools.performance import instrumentation
 from fipy.terms import AbstractBaseClassError
 from fipy.terms import SolutionVariableRequiredError
 
 __all__ = ["Term"]
 
+def _collectVariables(value, variables):
+    from fipy.variables.variable import Variable
+
+    if isinstance(value, Variable):
+        variables.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collectVariables(item, variables)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collectVariables(item, variables)
+
+def _subscribe(subscriber, variables, var=None, masked=()):
+    """Make `subscriber` require `variables` and everything they are
+    calculated from.
+
+    `Variable` objects in `masked` are only followed to their constraints,
+    not to `var`, and nothing that is calculated from `var` is required.
+    """
+    from fipy.variables.variable import Variable
+
+    reachesVar = {}
+
+    def _reachesVar(v):
+        if v is var:
+            return True
+        if id(v) not in reachesVar:
+            reachesVar[id(v)] = False
+            reachesVar[id(v)] = any([_reachesVar(r) for r in v.requiredVariables])
+        return reachesVar[id(v)]
+
+    stack = list(variables)
+    visited = set()
+    while stack:
+        v = stack.pop()
+        if id(v) in visited or v is var:
+            continue
+        visited.add(id(v))
+
+        if var is None or not _reachesVar(v):
+            subscriber._requires(v)
+
+        required = list(v.requiredVariables)
+        if any([m is v for m in masked]):
+            required = [r for r in required if r is not var]
+            required += [c.value for c in v.constraints]
+        required += [c.where for c in v.constraints]
+
+        stack.extend([r for r in required if isinstance(r, Variable)])
+
 class Term(object):
     """
     .. attention:: This class is abstract. Always create one of its subclasses.
@@ -32,6 +83,7 @@ class Term(object):
         self._matrix = None
         self._cacheRHSvector = False
         self._RHSvector = None
+        self._linearSystem = None
         self.var = var
 
     def _calcVars(self):
@@ -49,6 +101,174 @@ class Term(object):
     def _buildAndAddMatrices(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None, buildExplicitIfOther=False):
         raise NotImplementedError
 
+    _reuseLinearSystem = True
+
+    def _buildLinearSystem(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Call `_buildMatrix()`, but reuse the last matrix and RHS vector
+        if none of the `Variable` objects they were calculated from have
+        changed since.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m, hasOld=True)
+        >>> v.constrain(1., where=m.facesLeft)
+        >>> D = Variable(1.)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=D)
+        >>> diff = eq.other
+        >>> eq.solve(v, dt=1.)
+        >>> L = diff._linearSystem[3]
+
+        Neither the new solution nor the old value change the diffusion
+        contribution
+
+        >>> v.updateOld()
+        >>> eq.solve(v, dt=1.)
+        >>> diff._linearSystem[3] is L
+        True
+
+        but changing its coefficient does
+
+        >>> v.updateOld()
+        >>> v2 = CellVariable(mesh=m, hasOld=True, value=v.value)
+        >>> v2.constrain(1., where=m.facesLeft)
+        >>> eq2 = TransientTerm() == DiffusionTerm(coeff=2.)
+        >>> D.value = 2.
+        >>> eq.solve(v, dt=1.)
+        >>> diff._linearSystem[3] is L
+        False
+        >>> eq2.solve(v2, dt=1.)
+        >>> print numerix.allclose(v, v2)
+        True
+
+        as does changing the constraints
+
+        >>> v.updateOld()
+        >>> v3 = CellVariable(mesh=m, hasOld=True, value=v.value)
+        >>> v3.constrain(1., where=m.facesLeft)
+        >>> v3.constrain(0., where=m.facesRight)
+        >>> eq3 = TransientTerm() == DiffusionTerm(coeff=2.)
+        >>> v.constrain(0., where=m.facesRight)
+        >>> eq.solve(v, dt=1.)
+        >>> eq3.solve(v3, dt=1.)
+        >>> print numerix.allclose(v, v3)
+        True
+
+        A `TransientTerm` is rebuilt whenever the old value changes
+
+        >>> trans = eq.term
+        >>> eq.solve(v, dt=1.)
+        >>> b = trans._linearSystem[4]
+        >>> eq.solve(v, dt=1.)
+        >>> trans._linearSystem[4] is b
+        True
+        >>> v.updateOld()
+        >>> eq.solve(v, dt=1.)
+        >>> trans._linearSystem[4] is b
+        False
+
+        and a term with a nonlinear coefficient whenever the solution changes
+
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=1. + v)
+        >>> eq.solve(v, dt=1.)
+        >>> L = eq.other._linearSystem[3]
+        >>> eq.solve(v, dt=1.)
+        >>> eq.other._linearSystem[3] is L
+        False
+        """
+        if not self._reuseLinearSystem or len(boundaryConditions) > 0:
+            return self._buildMatrix(var, SparseMatrix,
+                                     boundaryConditions=boundaryConditions, dt=dt,
+                                     transientGeomCoeff=transientGeomCoeff,
+                                     diffusionGeomCoeff=diffusionGeomCoeff)
+
+        key = self._getLinearSystemKey(var, SparseMatrix, dt)
+
+        if (self._linearSystem is None
+            or self._linearSystem[0] is not var
+            or self._linearSystem[1] != key
+            or self._linearSystem[2].stale):
+
+            var, L, b = self._buildMatrix(var, SparseMatrix,
+                                          boundaryConditions=boundaryConditions, dt=dt,
+                                          transientGeomCoeff=transientGeomCoeff,
+                                          diffusionGeomCoeff=diffusionGeomCoeff)
+
+            dependencies = self._getLinearSystemDependencies(var,
+                                                             transientGeomCoeff=transientGeomCoeff,
+                                                             diffusionGeomCoeff=diffusionGeomCoeff)
+
+            self._linearSystem = (var, key, dependencies, L, b)
+
+        var, key, dependencies, L, b = self._linearSystem
+
+        # callers add to and under-relax what they are given in place
+        matrix = SparseMatrix(mesh=var.mesh)
+        matrix += L
+
+        return (var, matrix, b.copy())
+
+    def _getLinearSystemKey(self, var, SparseMatrix, dt):
+        constraints = list(var.constraints)
+        if hasattr(var, 'faceGrad'):
+            constraints += var.faceGrad.constraints + var.arithmeticFaceValue.constraints
+
+        if dt is not None:
+            dt = numerix.array(dt).tolist()
+
+        return (SparseMatrix._classKey(), dt, tuple(constraints))
+
+    def _getLinearSystemDependencies(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Subscribe a `Variable` to everything this `Term`'s matrix and RHS
+        vector were calculated from.
+        """
+        from fipy.variables.variable import Variable
+
+        variables = []
+        constraintVariables = []
+        self._collectVariables(variables, constraintVariables, terms=[])
+        _collectVariables((transientGeomCoeff, diffusionGeomCoeff), variables)
+
+        if self._dependsOnOld(var, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff):
+            variables.append(getattr(var, 'old', var))
+
+        dependencies = Variable()
+        _subscribe(dependencies, variables)
+
+        masked = self._getMaskedFaceVariables(var)
+        if len(masked) > 0:
+            _subscribe(dependencies, constraintVariables, var=var, masked=masked)
+        else:
+            _subscribe(dependencies, constraintVariables)
+
+        dependencies._markFresh()
+
+        return dependencies
+
+    def _getMaskedFaceVariables(self, var):
+        """Face variables of `var` that `constraintL` and `constraintB` only
+        use where they are constrained, so that their value elsewhere, and
+        hence `var`, does not affect the linear system.
+        """
+        return ()
+
+    def _collectVariables(self, variables, constraintVariables, terms):
+        if any([term is self for term in terms]):
+            return
+        terms.append(self)
+
+        for name, value in self.__dict__.items():
+            if name in ('var', '_var', '_linearSystem'):
+                continue
+            elif name in ('constraintL', 'constraintB'):
+                _collectVariables(value, constraintVariables)
+            elif isinstance(value, Term):
+                value._collectVariables(variables, constraintVariables, terms)
+            else:
+                _collectVariables(value, variables)
+
+    def _dependsOnOld(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        return True
+
     def _checkVar(self, var):
         raise NotImplementedError
 
@@ -146,7 +366,7 @@ class Term(object):
 
         return solver
 
-    def solve(self, var=None, solver=None, boundaryConditions=(), dt=None):
+    def solve(self, var=None, solver=None, boundaryConditions=(), dt=None, returnResult=False):
         r"""
         Builds and solves the `Term`'s linear system once. This method
         does not return the residual. It should be used when the
@@ -158,14 +378,22 @@ class Term(object):
            - `solver`: The iterative solver to be used to solve the linear system of equations. Defaults to `LinearPCGSolver` for Pysparse and `LinearLUSolver` for Trilinos.
            - `boundaryConditions`: A tuple of boundaryConditions.
            - `dt`: The time step size.
+           - `returnResult`: If `True`, return the
+             :class:`~fipy.solvers.solver.SolverResult` of the solve,
+             with the iterations and residuals of the solver
 
         """
 
-        solver = self._prepareLinearSystem(var, solver, boundaryConditions, dt)
+        with instrumentation.step("solve", var if var is not None else self.var):
+            with instrumentation.timer("prepareLinearSystem"):
+                solver = self._prepareLinearSystem(var, solver, boundaryConditions, dt)
 
-        solver._solve()
+            result = solver._timedSolve(residualHistory=returnResult)
+
+        if returnResult:
+            return result
 
-    def sweep(self, var=None, solver=None, boundaryConditions=(), dt=None, underRelaxation=None, residualFn=None, cacheResidual=False, cacheError=False):
+    def sweep(self, var=None, solver=None, boundaryConditions=(), dt=None, underRelaxation=None, residualFn=None, cacheResidual=False, cacheError=False, returnResult=False):
         r"""
         Builds and solves the `Term`'s linear system once. This method
         also recalculates and returns the residual as well as applying
@@ -184,29 +412,39 @@ class Term(object):
            - `cacheError`: If `True`, use the residual vector :math:`\vec{r}`
               to solve :math:`\mathsf{L}\vec{e}=\vec{r}` for the error vector :math:`\vec{e}`
               and store it in the `errorVector` member of `Term`
+           - `returnResult`: If `True`, return the residual and the
+             :class:`~fipy.solvers.solver.SolverResult` of the solve, with
+             the iterations and residuals of the solver
 
         """
-        solver = self._prepareLinearSystem(var=var, solver=solver, boundaryConditions=boundaryConditions, dt=dt)
-        solver._applyUnderRelaxation(underRelaxation=underRelaxation)
-        residual = solver._calcResidual(residualFn=residualFn)
+        with instrumentation.step("sweep", var if var is not None else self.var):
+            with instrumentation.timer("prepareLinearSystem"):
+                solver = self._prepareLinearSystem(var=var, solver=solver, boundaryConditions=boundaryConditions, dt=dt)
+            solver._applyUnderRelaxation(underRelaxation=underRelaxation)
 
-        if cacheResidual or cacheError:
-            self.residualVector = solver._calcResidualVector(residualFn=residualFn)
+            with instrumentation.timer("residual"):
+                residual = solver._calcResidual(residualFn=residualFn)
 
-        if cacheError:
-            self.errorVector = solver.var.copy()
-            var_tmp = solver.var
-            RHS_tmp = solver.RHSvector
-            solver._storeMatrix(var=self.errorVector, matrix=solver.matrix, RHSvector=self.residualVector)
-            solver._solve()
-            solver._storeMatrix(var=var_tmp, matrix=solver.matrix, RHSvector=RHS_tmp)
+                if cacheResidual or cacheError:
+                    self.residualVector = solver._calcResidualVector(residualFn=residualFn)
 
-        if not cacheResidual:
-            self.residualVector = None
+            if cacheError:
+                self.errorVector = solver.var.copy()
+                var_tmp = solver.var
+                RHS_tmp = solver.RHSvector
+                solver._storeMatrix(var=self.errorVector, matrix=solver.matrix, RHSvector=self.residualVector)
+                solver._solve()
+                solver._storeMatrix(var=var_tmp, matrix=solver.matrix, RHSvector=RHS_tmp)
 
-        solver._solve()
+            if not cacheResidual:
+                self.residualVector = None
 
-        return residual
+            result = solver._timedSolve(residualHistory=returnResult)
+
+        if returnResult:
+            return residual, result
+        else:
+            return residual
 
     def justResidualVector(self, var=None, solver=None, boundaryConditions=(), dt=None, underRelaxation=None, residualFn=None):
         r"""
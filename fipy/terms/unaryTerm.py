@@ -5,6 +5,7 @@ __all__ = []
 import os
 
 from fipy.tools import numerix
+from fipy.tools.performance import instrumentation
 from fipy.terms.term import Term
 
 class _UnaryTerm(Term):
@@ -57,19 +58,21 @@ class _UnaryTerm(Term):
         """
 
         if var is self.var or self.var is None:
-            var, matrix, RHSvector = self._buildMatrix(var,
-                                                       SparseMatrix,
-                                                       boundaryConditions=boundaryConditions,
-                                                       dt=dt,
-                                                       transientGeomCoeff=transientGeomCoeff,
-                                                       diffusionGeomCoeff=diffusionGeomCoeff)
+            with instrumentation.timer("buildMatrix", self.__class__.__name__):
+                var, matrix, RHSvector = self._buildLinearSystem(var,
+                                                                 SparseMatrix,
+                                                                 boundaryConditions=boundaryConditions,
+                                                                 dt=dt,
+                                                                 transientGeomCoeff=transientGeomCoeff,
+                                                                 diffusionGeomCoeff=diffusionGeomCoeff)
         elif buildExplicitIfOther:
-            _, matrix, RHSvector = self._buildMatrix(self.var,
-                                                     SparseMatrix,
-                                                     boundaryConditions=boundaryConditions,
-                                                     dt=dt,
-                                                     transientGeomCoeff=transientGeomCoeff,
-                                                     diffusionGeomCoeff=diffusionGeomCoeff)
+            with instrumentation.timer("buildMatrix", self.__class__.__name__):
+                _, matrix, RHSvector = self._buildMatrix(self.var,
+                                                         SparseMatrix,
+                                                         boundaryConditions=boundaryConditions,
+                                                         dt=dt,
+                                                         transientGeomCoeff=transientGeomCoeff,
+                                                         diffusionGeomCoeff=diffusionGeomCoeff)
             RHSvector = RHSvector - matrix * self.var.value
             matrix = SparseMatrix(mesh=var.mesh)
         else:
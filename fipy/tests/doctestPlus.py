@@ -114,6 +114,12 @@ class _SelectiveDocTestParser(doctest.DocTestParser):
     """
     Custom doctest parser that adds support for skipping test examples
     """
+    def __init__(self):
+        # the flags are registered by the modules that use them, which
+        # `import fipy` no longer imports until they are needed
+        import fipy
+        fipy.__all__
+
     def parse(self, string, name='<string>'):
         pieces = doctest.DocTestParser.parse(self, string, name)
 
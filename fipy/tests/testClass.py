@@ -201,8 +201,7 @@ def _TestClass(base):
                 try:
                     import weave
                 except ImportError, a:
-                    print >>sys.stderr, "!!! weave library is not installed"
-                    return
+                    print >>sys.stderr, "!!! weave library is not installed, only Variable expressions will be inlined"
 
             if self.pythoncompiled is not None:
                 import os
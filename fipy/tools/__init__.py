@@ -46,7 +46,31 @@ def _getComms():
 
     return serialComm, parallelComm
 
-serial, parallel = serialComm, parallelComm = _getComms()
+_comms = []
+
+def _getComm(index):
+    if len(_comms) == 0:
+        _comms.extend(_getComms())
+    return _comms[index]
+
+class _LazyComm(object):
+    """Stands in for the serial or the parallel communicator, which are
+    only set up, probing for :term:`Trilinos` and :term:`mpi4py`, when one
+    of them is first used.
+    """
+    def __init__(self, index):
+        self._index = index
+
+    def __getattr__(self, name):
+        # only called for the attributes of the communicator
+        if name.startswith("__") or name == "_index":
+            raise AttributeError(name)
+        return getattr(_getComm(self._index), name)
+
+    def __repr__(self):
+        return repr(_getComm(self._index))
+
+serial, parallel = serialComm, parallelComm = _LazyComm(0), _LazyComm(1)
 
 
 from fipy.tests.doctestPlus import register_skipper
@@ -78,19 +102,23 @@ for M in (2, 3):
                          why="not running on processor %d of %d" % (N, M),
                          skipWarning=False)
 
+import fipy.tools.checkpoint
 import fipy.tools.dump
 import fipy.tools.numerix
 import fipy.tools.vector
 from dimensions.physicalField import PhysicalField
 from fipy.tools.numerix import *
+from fipy.tools.parameterSweep import sweep
 from fipy.tools.vitals import Vitals
 
 __all__ = ["serialComm",
            "parallelComm",
+           "checkpoint",
            "dump",
            "numerix",
            "vector",
            "PhysicalField",
+           "sweep",
            "Vitals",
            "serial",
            "parallel"]
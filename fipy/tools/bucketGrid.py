@@ -0,0 +1,196 @@
+"""Nearest-neighbor lookup on a uniform grid of buckets
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+class _BucketGrid(object):
+    """
+    Index of a set of points that finds the nearest of them to other
+    points without comparing every pair.
+
+    The bounding box of `data` is split into a uniform grid of buckets
+    holding about `pointsPerBucket` points each. The search for each query
+    point starts in its own bucket and grows by rings of buckets until no
+    unsearched bucket can hold a closer point, so the result is the same
+    as :func:`~fipy.tools.numerix.nearest`, including the choice of the
+    lowest index among equidistant points.
+
+        >>> from fipy import Grid2D
+        >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
+        >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
+        >>> index = _BucketGrid(m0.cellCenters.globalValue)
+        >>> print index.nearest(m1.cellCenters.globalValue)
+        [4 5 7 8]
+
+    Points can lie outside of the data
+
+        >>> print index.nearest(((-100., 1e3), (-100., 1e3)))
+        [0 8]
+
+    and ties go to the lowest index
+
+        >>> m2 = Grid2D(nx=3, ny=3)
+        >>> print _BucketGrid(m2.cellCenters.globalValue).nearest(((1., 2., 1.5), (1., 2., 1.5)))
+        [0 4 4]
+
+    The result agrees with an exhaustive search
+
+        >>> from fipy.tools import numerix
+        >>> numerix.random.seed(13)
+        >>> data = numerix.random.random((3, 1000))
+        >>> points = numerix.random.random((3, 500)) * 1.2 - 0.1
+        >>> print (_BucketGrid(data).nearest(points)
+        ...        == numerix.nearest(data, points)).all()
+        True
+        >>> flat = numerix.array((data[0], data[1] * 1e-3, 0 * data[2]))
+        >>> print (_BucketGrid(flat).nearest(points)
+        ...        == numerix.nearest(flat, points)).all()
+        True
+        >>> print _BucketGrid(numerix.zeros((2, 0))).nearest(points[:2])
+        []
+    """
+    def __init__(self, data, pointsPerBucket=2):
+        self.data = numerix.asarray(data)
+
+        D, N = self.data.shape
+
+        if N > 0:
+            self.lower = self.data.min(axis=1)
+            self.upper = self.data.max(axis=1)
+        else:
+            self.lower = self.upper = numerix.zeros((D,))
+
+        extent = (self.upper - self.lower).astype(float)
+        spanned = extent > 0
+
+        if N > 0 and spanned.any():
+            volume = numerix.prod(extent[spanned])
+            size = (volume * pointsPerBucket / N)**(1. / spanned.sum())
+            self.shape = numerix.where(spanned,
+                                       numerix.maximum(numerix.ceil(extent / size), 1),
+                                       1).astype(int)
+        else:
+            self.shape = numerix.ones((D,), dtype=int)
+
+        self.bucketSize = numerix.where(spanned, extent / self.shape, 1.)
+
+        # absolute tolerance for points that round into the wrong bucket
+        self.tolerance = 1e-10 * max((abs(self.lower) + abs(self.upper) + self.bucketSize).max(), 1.)
+
+        buckets = numerix.ravel_multi_index(self._buckets(self.data), self.shape)
+        self.order = numerix.argsort(buckets, kind='mergesort')
+        self.starts = numerix.searchsorted(buckets[self.order],
+                                           numerix.arange(numerix.prod(self.shape) + 1))
+
+    def _buckets(self, points):
+        buckets = numerix.floor((points - self.lower[..., numerix.newaxis])
+                                / self.bucketSize[..., numerix.newaxis])
+        return numerix.clip(buckets, 0, self.shape[..., numerix.newaxis] - 1).astype(int)
+
+    def _ring(self, r):
+        """Offsets of the buckets `r` buckets away from the center one"""
+        D = len(self.shape)
+        reach = numerix.minimum(r, self.shape - 1)
+        offsets = numerix.indices(tuple(2 * reach + 1)).reshape((D, -1)) - reach[..., numerix.newaxis]
+        return offsets[..., abs(offsets).max(axis=0) == r]
+
+    def nearest(self, points):
+        """Find the indices of the data that are closest to `points`
+
+        :Parameters:
+          - `points`: a (D, M) array of coordinates
+        """
+        points = numerix.asarray(points)
+        M = points.shape[-1]
+
+        nearestIndices = numerix.zeros((M,), dtype=numerix.INT_DTYPE)
+        if self.data.shape[-1] == 0:
+            return numerix.arange(0)
+
+        distances = numerix.empty((M,))
+        distances[:] = numerix.inf
+
+        centers = self._buckets(points)
+        unresolved = numerix.arange(M)
+        r = 0
+        while len(unresolved) > 0:
+            self._search(points, centers, unresolved, self._ring(r),
+                         nearestIndices, distances)
+
+            # distance from each point to the buckets that are still unsearched
+            center = centers[..., unresolved]
+            lowest = center - r
+            highest = center + r
+            below = numerix.where(lowest > 0,
+                                  points[..., unresolved]
+                                  - (self.lower[..., numerix.newaxis]
+                                     + lowest * self.bucketSize[..., numerix.newaxis]),
+                                  numerix.inf)
+            above = numerix.where(highest < self.shape[..., numerix.newaxis] - 1,
+                                  (self.lower[..., numerix.newaxis]
+                                   + (highest + 1) * self.bucketSize[..., numerix.newaxis])
+                                  - points[..., unresolved],
+                                  numerix.inf)
+            gap = numerix.maximum(numerix.minimum(below, above) - self.tolerance, 0)
+
+            # any data point is at least this far from a point outside of the data
+            outside = numerix.maximum(numerix.maximum(self.lower[..., numerix.newaxis]
+                                                      - points[..., unresolved],
+                                                      points[..., unresolved]
+                                                      - self.upper[..., numerix.newaxis]),
+                                      0)
+            outside = outside * outside
+            bound = (gap * gap + outside.sum(axis=0) - outside).min(axis=0)
+
+            done = distances[unresolved] < bound
+            unresolved = unresolved[~done]
+            r += 1
+
+        return nearestIndices
+
+    def _search(self, points, centers, unresolved, offsets, nearestIndices, distances):
+        # (D, K, U) buckets around each unresolved point
+        buckets = (centers[..., numerix.newaxis, unresolved]
+                   + offsets[..., numerix.newaxis])
+        inside = ((buckets >= 0)
+                  & (buckets < self.shape[..., numerix.newaxis, numerix.newaxis])).all(axis=0)
+        pointIDs = numerix.resize(unresolved, inside.shape)[inside]
+        buckets = numerix.ravel_multi_index(buckets[..., inside], self.shape)
+
+        # pair every point with each data point in its buckets
+        counts = self.starts[buckets + 1] - self.starts[buckets]
+        total = counts.sum()
+        if total == 0:
+            return
+        firsts = numerix.cumsum(counts) - counts
+        offsetsInBuckets = numerix.arange(total) - numerix.repeat(firsts, counts)
+        candidates = self.order[numerix.repeat(self.starts[buckets], counts) + offsetsInBuckets]
+        pointIDs = numerix.repeat(pointIDs, counts)
+
+        # same arithmetic as `numerix.nearest`, so that ties are identical
+        tmp = self.data[..., candidates] - points[..., pointIDs]
+        d2 = numerix.dot(tmp, tmp, axis=0)
+
+        # closest, then lowest index, candidate for each point
+        order = numerix.lexsort((candidates, d2, pointIDs))
+        pointIDs = pointIDs[order]
+        first = numerix.ones(pointIDs.shape, dtype=bool)
+        first[1:] = pointIDs[1:] != pointIDs[:-1]
+        pointIDs = pointIDs[first]
+        candidates = candidates[order][first]
+        d2 = d2[order][first]
+
+        better = ((d2 < distances[pointIDs])
+                  | ((d2 == distances[pointIDs]) & (candidates < nearestIndices[pointIDs])))
+        nearestIndices[pointIDs[better]] = candidates[better]
+        distances[pointIDs[better]] = d2[better]
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,383 @@
+"""Binary checkpoints of `CellVariable` values that are written and read in parallel
+
+Unlike :mod:`fipy.tools.dump`, which pickles an entire object graph into a
+single gzipped stream on process 0, a checkpoint is a directory holding
+one ``.npy`` file for each array of cell values, in the order of the
+global cells. Each process writes only the cells it owns, directly into
+the shared file, and each process of a later run reads only the cells of
+its own partition, whatever the number of processes.
+
+    >>> import shutil, tempfile
+    >>> from fipy import Grid2D, CellVariable
+    >>> mesh = Grid2D(nx=4, ny=3)
+    >>> phi = CellVariable(mesh=mesh, name="phi", value=mesh.x * mesh.y, hasOld=True)
+    >>> phi.updateOld()
+    >>> phi.setValue(-phi.old)
+    >>> psi = CellVariable(mesh=mesh, value=(mesh.x, mesh.y), elementshape=(2,))
+    >>> directory = tempfile.mkdtemp()
+    >>> write(directory, dict(phi=phi, psi=psi, elapsed=1.5))
+
+    >>> data = read(directory)
+    >>> print sorted(data.keys()), data["elapsed"]
+    ['elapsed', 'phi', 'psi'] 1.5
+    >>> print data["phi"].name, data["phi"].mesh
+    phi UniformGrid2D(dx=1.0, nx=4, dy=1.0, ny=3)
+    >>> print numerix.allclose(data["phi"], phi), numerix.allclose(data["phi"].old, phi.old)
+    True True
+    >>> print numerix.allclose(data["psi"], psi), data["psi"].old is data["psi"]
+    True True
+
+The values can be placed on a new mesh with the same global cells, e.g.,
+one partitioned differently
+
+    >>> from fipy.tools import serialComm
+    >>> data = read(directory, mesh=Grid2D(nx=4, ny=3, communicator=serialComm))
+    >>> print numerix.allclose(data["psi"].globalValue, psi.globalValue)
+    True
+
+A new checkpoint of the same name replaces the old one
+
+    >>> write(directory, dict(elapsed=3.))
+    >>> print read(directory)
+    {'elapsed': 3.0}
+
+    >>> shutil.rmtree(directory)
+"""
+__docformat__ = 'restructuredtext'
+
+import atexit
+import cPickle
+import os
+import Queue
+import shutil
+import tempfile
+import threading
+import weakref
+
+from numpy.lib.format import open_memmap
+
+from fipy.tools import numerix
+from fipy.tools import parallelComm
+
+__all__ = ["write", "read", "BackgroundWriter"]
+
+_INDEX = "index.pickle"
+
+def write(directory, data, communicator=parallelComm):
+    """
+    Save a checkpoint.
+
+    The checkpoint is assembled next to `directory` and then moved into
+    place, so an interrupted write never damages a previous checkpoint of
+    the same name.
+
+    All processes must call `write`.
+
+    :Parameters:
+      - `directory`: the checkpoint to write
+      - `data`: a dictionary of `CellVariable` objects, and of small
+        picklable objects like the elapsed time, to save
+      - `communicator`: the processes that share the checkpoint
+    """
+    checkpoint = _Checkpoint(directory, data, communicator)
+    checkpoint.fill()
+    communicator.Barrier()
+    checkpoint.commit()
+    communicator.Barrier()
+
+def read(directory, communicator=parallelComm, mesh=None):
+    """
+    Restore a checkpoint saved by `write`, as a dictionary of new
+    `CellVariable` objects and of the other saved objects.
+
+    Structured grids are rebuilt from their parameters, so they are
+    partitioned for the processes that read them. Other meshes are only
+    stored when they are not partitioned; to restore values saved from
+    such a mesh in parallel, create the mesh again and pass it as `mesh`.
+
+    All processes must call `read`.
+
+    :Parameters:
+      - `directory`: the checkpoint to read
+      - `communicator`: the processes that share the checkpoint
+      - `mesh`: the mesh to define all of the restored variables on,
+        instead of the saved mesh
+    """
+    from fipy.variables.cellVariable import CellVariable
+
+    if communicator.procID == 0:
+        f = open(os.path.join(directory, _INDEX), "rb")
+        try:
+            index = f.read()
+        finally:
+            f.close()
+    else:
+        index = None
+
+    if communicator.Nproc > 1:
+        index = communicator.bcast(index, root=0)
+
+    index = cPickle.loads(index)
+
+    if mesh is not None:
+        meshes = [mesh] * len(index["meshes"])
+    else:
+        meshes = []
+        for state in index["meshes"]:
+            if state is None:
+                raise ValueError, "the mesh of %s was partitioned when saved and must be given" % directory
+            meshes.append(cPickle.loads(state))
+
+    data = dict(index["values"])
+    for key, description in index["variables"].items():
+        varMesh = meshes[description["mesh"]]
+        values = [_localValue(varMesh, os.path.join(directory, name))
+                  for name in description["files"]]
+
+        var = CellVariable(mesh=varMesh,
+                           name=description["name"],
+                           value=values[0],
+                           unit=description["unit"],
+                           elementshape=description["elementshape"],
+                           hasOld=len(values) > 1)
+        if len(values) > 1:
+            var.old.value = values[1]
+
+        data[key] = var
+
+    return data
+
+class BackgroundWriter(object):
+    """
+    Writes checkpoints in a background thread, so that the calculation
+    can continue while they go to disk.
+
+    Each call to `write` copies the cells that this process owns out of
+    the variables before returning, so the variables may change right
+    away. At most `maxPending` checkpoints are held in memory; once that
+    many are waiting, `write` blocks until the oldest is on disk.
+
+        >>> import os, shutil, tempfile
+        >>> from fipy import Grid1D, CellVariable
+        >>> mesh = Grid1D(nx=10)
+        >>> phi = CellVariable(mesh=mesh, value=0.)
+        >>> directory = tempfile.mkdtemp()
+        >>> restart = os.path.join(directory, "restart")
+        >>> writer = BackgroundWriter(maxPending=2)
+        >>> for step in range(5):
+        ...     phi.setValue(step)
+        ...     writer.write(restart, dict(phi=phi, step=step))
+        >>> writer.close()
+        >>> data = read(restart)
+        >>> print data["step"], data["phi"]
+        4 [ 4.  4.  4.  4.  4.  4.  4.  4.  4.  4.]
+        >>> print os.listdir(directory)
+        ['restart']
+        >>> shutil.rmtree(directory)
+
+    In a :class:`~fipy.steppers.stepper.Stepper`, checkpoints can be
+    written from the `successFn` of each step.
+
+    All processes must make the same calls to the writer, which it uses
+    to agree on when each checkpoint has been completely written. Only
+    the main thread communicates.
+
+    Checkpoints are moved into place by `write`, `wait` and `close`. A
+    writer that is still open when the interpreter exits is closed then,
+    so a script that ends without calling `close` still leaves finished
+    checkpoints, rather than ``.partial`` directories, behind.
+
+    :Parameters:
+      - `maxPending`: the number of checkpoints that may be waiting to
+        be written
+      - `communicator`: the processes that share the checkpoints
+    """
+    def __init__(self, maxPending=2, communicator=parallelComm):
+        self.maxPending = maxPending
+        self.communicator = communicator
+        self.pending = []
+        self.queue = Queue.Queue()
+        self.thread = threading.Thread(target=self._run)
+        self.thread.setDaemon(True)
+        self.thread.start()
+        atexit.register(_closeAtExit, weakref.ref(self))
+
+    def write(self, directory, data):
+        """Begin writing a checkpoint, as for
+        :func:`~fipy.tools.checkpoint.write`.
+        """
+        self._commit(keep=self.maxPending - 1)
+
+        checkpoint = _Checkpoint(directory, data, self.communicator)
+        checkpoint.filled = threading.Event()
+        checkpoint.error = None
+        self.pending.append(checkpoint)
+        self.queue.put(checkpoint)
+
+    def wait(self):
+        """Block until every checkpoint has been written."""
+        self._commit(keep=0)
+
+    def close(self):
+        """Write every checkpoint and stop the background thread."""
+        self.wait()
+        self.queue.put(None)
+        self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def _run(self):
+        while True:
+            checkpoint = self.queue.get()
+            if checkpoint is None:
+                break
+            try:
+                checkpoint.fill()
+            except Exception, e:
+                checkpoint.error = e
+            checkpoint.filled.set()
+
+    def _commit(self, keep):
+        # move the oldest checkpoints into place once every process has
+        # filled them, waiting for as many as it takes to leave `keep`
+        while len(self.pending) > 0:
+            oldest = self.pending[0]
+            if len(self.pending) > keep:
+                oldest.filled.wait()
+
+            if not self.communicator.all(numerix.array(oldest.filled.isSet())):
+                break
+
+            self.pending.pop(0)
+            if not self.communicator.all(numerix.array(oldest.error is None)):
+                raise IOError, "checkpoint %s could not be written: %s" % (oldest.directory, oldest.error)
+
+            oldest.commit()
+
+def _closeAtExit(writer):
+    # the background thread keeps the writer alive until it is closed
+    writer = writer()
+    if writer is not None and writer.thread.isAlive():
+        writer.close()
+
+class _Checkpoint(object):
+    """
+    A checkpoint in the making.
+
+    Creating it copies the cells that this process owns out of each
+    variable and, on process 0, allocates the files, so the variables may
+    change as soon as it returns. `fill()` then writes this process's
+    copies without communicating, and once every process has filled the
+    checkpoint, `commit()` moves it into place.
+    """
+    def __init__(self, directory, data, communicator):
+        from fipy.variables.cellVariable import CellVariable
+
+        self.directory = directory.rstrip(os.sep)
+        self.communicator = communicator
+
+        meshes = []
+        meshIDs = []
+        variables = {}
+        values = {}
+        self.arrays = []
+        for key, item in data.items():
+            if isinstance(item, CellVariable):
+                if id(item.mesh) not in meshIDs:
+                    meshIDs.append(id(item.mesh))
+                    meshes.append(item.mesh)
+                description = dict(name=item.name,
+                                   unit=item.unit,
+                                   mesh=meshIDs.index(id(item.mesh)),
+                                   elementshape=item.shape[:-1],
+                                   files=[])
+                for var in [item] + [item.old] * (item._old is not None):
+                    mesh = var.mesh
+                    value = _numericValue(var)
+                    description["files"].append("%d.npy" % len(self.arrays))
+                    self.arrays.append((mesh.globalNumberOfCells,
+                                        mesh._globalNonOverlappingCellIDs,
+                                        numerix.rollaxis(value[..., mesh._localNonOverlappingCellIDs], -1)))
+                variables[key] = description
+            else:
+                values[key] = item
+
+        if communicator.procID == 0:
+            parent, name = os.path.split(self.directory)
+            temporary = tempfile.mkdtemp(prefix=name + ".", suffix=".partial", dir=parent or os.curdir)
+
+            for i, (numberOfCells, globalIDs, rows) in enumerate(self.arrays):
+                # allocated here and filled in by each process
+                open_memmap(os.path.join(temporary, "%d.npy" % i),
+                            mode="w+", dtype=rows.dtype,
+                            shape=(numberOfCells,) + rows.shape[1:])
+
+            f = open(os.path.join(temporary, _INDEX), "wb")
+            try:
+                cPickle.dump(dict(meshes=[_meshState(mesh) for mesh in meshes],
+                                  variables=variables,
+                                  values=values), f, cPickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+        else:
+            temporary = None
+
+        self.temporary = communicator.bcast(temporary, root=0)
+
+        communicator.Barrier()
+
+    def fill(self):
+        """Write the cells owned by this process."""
+        for i, (numberOfCells, globalIDs, rows) in enumerate(self.arrays):
+            stored = open_memmap(os.path.join(self.temporary, "%d.npy" % i), mode="r+")
+            stored[globalIDs] = rows
+            stored.flush()
+            del stored
+        self.arrays = []
+
+    def commit(self):
+        """Replace `directory` with the filled checkpoint."""
+        if self.communicator.procID == 0:
+            if os.path.exists(self.directory):
+                previous = self.temporary[:-len(".partial")] + ".previous"
+                os.rename(self.directory, previous)
+                os.rename(self.temporary, self.directory)
+                shutil.rmtree(previous)
+            else:
+                os.rename(self.temporary, self.directory)
+
+def _numericValue(var):
+    value = var.value
+    if hasattr(value, "unit"):
+        value = value.value
+    return numerix.asarray(value)
+
+def _meshState(mesh):
+    from fipy.meshes.representations.gridRepresentation import _GridRepresentation
+
+    if (isinstance(mesh.representation, _GridRepresentation)
+        or mesh.communicator.Nproc == 1):
+        return cPickle.dumps(mesh, cPickle.HIGHEST_PROTOCOL)
+    else:
+        return None
+
+def _localValue(mesh, path):
+    stored = numerix.load(path, mmap_mode="r")
+    if mesh.numberOfCells == mesh.globalNumberOfCells:
+        # a value for every global cell is mapped to the local cells
+        # when it initializes a `CellVariable`
+        value = numerix.array(stored)
+    else:
+        value = numerix.array(stored[mesh._globalOverlappingCellIDs])
+    return numerix.rollaxis(value, 0, value.ndim)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
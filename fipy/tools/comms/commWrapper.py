@@ -46,6 +46,60 @@ class CommWrapper(object):
     def allgather(self, obj):
         return obj
 
+    def Bcast(self, buf, root=0):
+        """Broadcast the contents of the array `buf` from process `root`
+        into `buf` on every other process.
+        """
+        return buf
+
+    def Allgather(self, sendbuf, recvbuf):
+        """Gather the equal-sized arrays `sendbuf` of every process into
+        `recvbuf`, in the order of the processes.
+        """
+        recvbuf[...] = numerix.reshape(sendbuf, recvbuf.shape)
+
+    def Allgatherv(self, sendbuf, recvbuf, counts, displacements):
+        """Gather the arrays `sendbuf` of every process into `recvbuf`.
+
+        :Parameters:
+          - `sendbuf`: contiguous array to send from this process
+          - `recvbuf`: contiguous array to receive into, with the same
+            trailing shape as `sendbuf`
+          - `counts`: the length of `sendbuf` along its first axis on each
+            process
+          - `displacements`: the position along the first axis of
+            `recvbuf` where each process's values go
+        """
+        recvbuf[displacements[0]:displacements[0] + counts[0]] = sendbuf
+
+    def Gatherv(self, sendbuf, recvbuf, counts, displacements, root=0):
+        """Like `Allgatherv`, but only process `root` receives the values.
+        `recvbuf` is ignored on the other processes.
+        """
+        self.Allgatherv(sendbuf, recvbuf, counts, displacements)
+
+    def alltoall(self, objs):
+        """Send `objs[i]` to process `i` and return the list of objects
+        received from each process.
+        """
+        return objs
+
+    def Isend(self, buf, dest, tag=0):
+        """Begin sending the array `buf` to process `dest` and return a
+        request to pass to `Waitall`.
+        """
+        raise NotImplementedError, "%s has no other process to send to" % self.__class__.__name__
+
+    def Irecv(self, buf, source, tag=0):
+        """Begin receiving into the array `buf` from process `source` and
+        return a request to pass to `Waitall`.
+        """
+        raise NotImplementedError, "%s has no other process to receive from" % self.__class__.__name__
+
+    def Waitall(self, requests):
+        """Wait for all of the nonblocking `requests` to complete."""
+        pass
+
     def sum(self, a, axis=None):
         summed = numerix.array(a).sum(axis=axis)
         shape = summed.shape
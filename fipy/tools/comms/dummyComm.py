@@ -21,3 +21,26 @@ class DummyComm(SerialCommWrapper):
 
     def __setstate__(self, dict):
         self.__init__()
+
+class _RankComm(DummyComm):
+    """Stands in for process `procID` of `Nproc` in a serial run, so that
+    the share of a partitioned mesh built by that process can be examined
+    without MPI. Nothing is communicated.
+    """
+    def __init__(self, procID=0, Nproc=1):
+        self._procID = procID
+        self._Nproc = Nproc
+
+    @property
+    def procID(self):
+        return self._procID
+
+    @property
+    def Nproc(self):
+        return self._Nproc
+
+    def __setstate__(self, dict):
+        self.__init__(**dict)
+
+    def __getstate__(self):
+        return dict(procID=self._procID, Nproc=self._Nproc)
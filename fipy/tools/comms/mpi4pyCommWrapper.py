@@ -33,7 +33,26 @@ class Mpi4pyCommWrapper(CommWrapper):
         return self.mpi4py_comm.allreduce(numerix.allequal(a, b), op=self.MPI.LAND)
 
     def bcast(self, obj, root=0):
-        return self.mpi4py_comm.bcast(obj=obj, root=root)
+        """mpi4py bcast
+
+        Arrays are sent as buffers, rather than pickled, after their shape
+        and type have been broadcast.
+        """
+        if self.procID == root and self._isBuffer(obj):
+            header = (obj.shape, obj.dtype.str)
+        else:
+            header = None
+        header = self.mpi4py_comm.bcast(obj=header, root=root)
+
+        if header is None:
+            return self.mpi4py_comm.bcast(obj=obj, root=root)
+
+        shape, dtype = header
+        if self.procID == root:
+            buf = numerix.ascontiguousarray(obj)
+        else:
+            buf = numerix.empty(shape, dtype=dtype)
+        return self.Bcast(buf, root=root)
 
     def allgather(self, obj):
         """mpi4py allgather
@@ -45,5 +64,64 @@ class Mpi4pyCommWrapper(CommWrapper):
         >>> for i in range(self.mpi4py_comm.Get_size()):
         ...     assert m4count[i] == i
 
+        Arrays that share their type and all but their first dimension are
+        sent as buffers, rather than pickled.
         """
-        return self.mpi4py_comm.allgather(sendobj=obj)
+        if self._isBuffer(obj) and obj.ndim > 0:
+            header = (obj.shape, obj.dtype.str)
+        else:
+            header = None
+        headers = self.mpi4py_comm.allgather(sendobj=header)
+
+        if (None in headers
+            or len(set([(shape[1:], dtype) for shape, dtype in headers])) > 1):
+            return self.mpi4py_comm.allgather(sendobj=obj)
+
+        counts = numerix.array([shape[0] for shape, dtype in headers])
+        displacements = numerix.concatenate(([0], numerix.cumsum(counts)[:-1]))
+        recvbuf = numerix.empty((counts.sum(),) + obj.shape[1:], dtype=obj.dtype)
+        self.Allgatherv(numerix.ascontiguousarray(obj), recvbuf, counts, displacements)
+
+        return [recvbuf[start:start + count]
+                for start, count in zip(displacements, counts)]
+
+    @staticmethod
+    def _isBuffer(obj):
+        return (type(obj) is numerix.ndarray
+                and obj.dtype.kind in "biufc")
+
+    def _vectorSpec(self, buf, counts, displacements):
+        # mpi4py counts elements, but callers count rows of `buf`
+        rowSize = int(numerix.prod(buf.shape[1:]))
+        return [buf, ([int(count) * rowSize for count in counts],
+                      [int(displacement) * rowSize for displacement in displacements])]
+
+    def Bcast(self, buf, root=0):
+        self.mpi4py_comm.Bcast(buf, root=root)
+        return buf
+
+    def Allgather(self, sendbuf, recvbuf):
+        self.mpi4py_comm.Allgather(sendbuf, recvbuf)
+
+    def Allgatherv(self, sendbuf, recvbuf, counts, displacements):
+        self.mpi4py_comm.Allgatherv(sendbuf,
+                                    self._vectorSpec(recvbuf, counts, displacements))
+
+    def Gatherv(self, sendbuf, recvbuf, counts, displacements, root=0):
+        if self.procID == root:
+            recvbuf = self._vectorSpec(recvbuf, counts, displacements)
+        else:
+            recvbuf = None
+        self.mpi4py_comm.Gatherv(sendbuf, recvbuf, root=root)
+
+    def alltoall(self, objs):
+        return self.mpi4py_comm.alltoall(objs)
+
+    def Isend(self, buf, dest, tag=0):
+        return self.mpi4py_comm.Isend(buf, dest=dest, tag=tag)
+
+    def Irecv(self, buf, source, tag=0):
+        return self.mpi4py_comm.Irecv(buf, source=source, tag=tag)
+
+    def Waitall(self, requests):
+        self.MPI.Request.Waitall(requests)
@@ -0,0 +1,206 @@
+"""Counter-based random numbers that can be drawn independently for each element
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+_M0 = numerix.uint64(0xD2511F53)
+_M1 = numerix.uint64(0xCD9E8D57)
+_W0 = numerix.uint64(0x9E3779B9)
+_W1 = numerix.uint64(0xBB67AE85)
+_MASK = numerix.uint64(0xFFFFFFFF)
+
+def _philox(counter, key, rounds=10):
+    """
+    The Philox-4x32 block cipher of Salmon *et al.*, "Parallel random
+    numbers: as easy as 1, 2, 3" (SC11, 2011), applied to each column of
+    the `counter` array of four 32-bit words with the two 32-bit words of
+    `key`.
+
+    The known answers of the Random123 library are reproduced
+
+        >>> print ["%08x" % w for w in _philox(numerix.zeros((4, 1), 'l'), (0, 0))[:, 0]]
+        ['6627e8d5', 'e169c58d', 'bc57ac4c', '9b00dbd8']
+        >>> print ["%08x" % w for w in _philox(numerix.ones((4, 1), 'l') * 0xffffffff,
+        ...                                    (0xffffffff, 0xffffffff))[:, 0]]
+        ['408f276d', '41c83b0e', 'a20bc7c6', '6d5451fd']
+        >>> print ["%08x" % w for w in _philox(numerix.array([[0x243f6a88], [0x85a308d3],
+        ...                                                   [0x13198a2e], [0x03707344]]),
+        ...                                    (0xa4093822, 0x299f31d0))[:, 0]]
+        ['d16cfe09', '94fdcceb', '5001e420', '24126ea1']
+    """
+    c0, c1, c2, c3 = [numerix.asarray(word).astype(numerix.uint64) & _MASK for word in counter]
+    k0, k1 = [numerix.uint64(k) & _MASK for k in key]
+
+    for round in range(rounds):
+        if round > 0:
+            k0 = (k0 + _W0) & _MASK
+            k1 = (k1 + _W1) & _MASK
+        product0 = _M0 * c0
+        product1 = _M1 * c2
+        c0, c1, c2, c3 = (((product1 >> numerix.uint64(32)) ^ c1 ^ k0),
+                          product1 & _MASK,
+                          ((product0 >> numerix.uint64(32)) ^ c3 ^ k1),
+                          product0 & _MASK)
+
+    return numerix.array((c0, c1, c2, c3))
+
+class _CounterRandom(object):
+    """
+    Random numbers for a set of elements, each drawn from a stream
+    determined only by the element's global ID, the `key`, and the
+    `counter`.
+
+    Because the value for an element does not depend on which other
+    elements are drawn, nor in what order, each process can draw the
+    values for its own elements without communicating, and the values are
+    the same no matter how the elements are partitioned
+
+        >>> ids = numerix.arange(10)
+        >>> everything = _CounterRandom(key=(1, 2), counter=3, ids=ids).normal(0., 1.)
+        >>> evens = _CounterRandom(key=(1, 2), counter=3, ids=ids[::2]).normal(0., 1.)
+        >>> print numerix.allequal(everything[::2], evens)
+        True
+
+    A different `counter` gives different values
+
+        >>> print (_CounterRandom(key=(1, 2), counter=4, ids=ids).normal(0., 1.)
+        ...        != everything).all()
+        True
+
+    Each call draws from a new stream
+
+        >>> numbers = _CounterRandom(key=(1, 2), counter=3, ids=ids)
+        >>> print (numbers.uniform(0., 1.) != numbers.uniform(0., 1.)).all()
+        True
+
+    Parameters can vary from element to element
+
+        >>> print numbers.uniform(ids, ids + 1e-9) - ids < 1e-9
+        [ True  True  True  True  True  True  True  True  True  True]
+
+    The distributions have the expected moments
+
+        >>> numbers = _CounterRandom(key=(5, 6), counter=0, ids=numerix.arange(200000))
+        >>> def moments(x, mean, variance):
+        ...     return (abs(x.mean() - mean) < 0.01 * numerix.sqrt(variance)
+        ...             and abs(x.var() / variance - 1.) < 0.01)
+        >>> print moments(numbers.uniform(-1., 3.), 1., 4. / 3.)
+        True
+        >>> print moments(numbers.normal(2., 3.), 2., 9.)
+        True
+        >>> print moments(numbers.exponential(2.), 2., 4.)
+        True
+        >>> print moments(numbers.gamma(3., 2.), 6., 12.)
+        True
+        >>> print moments(numbers.gamma(0.5, 2.), 1., 2.)
+        True
+        >>> print moments(numbers.beta(2., 3.), 0.4, 0.04)
+        True
+
+    :Parameters:
+      - `key`: a pair of integers that select a family of streams
+      - `counter`: an integer that selects a draw from each stream,
+        e.g., the number of times the values have been refreshed
+      - `ids`: the global IDs of the elements, less than :math:`2^{32}`
+    """
+    def __init__(self, key, counter, ids):
+        self.key = key
+        self.counter = counter
+        self.ids = numerix.asarray(ids)
+        self.streams = 0
+
+    def _uniforms(self, stream, attempt, ids):
+        """Two independent arrays of values uniformly distributed on (0, 1),
+        with 53 random bits each.
+        """
+        words = _philox((ids,
+                         numerix.zeros(ids.shape, 'l') + attempt,
+                         numerix.zeros(ids.shape, 'l') + self.counter,
+                         numerix.zeros(ids.shape, 'l') + stream), self.key)
+        words = words.astype(float)
+        return [((numerix.floor(words[i] / 32.) * 67108864. + numerix.floor(words[i + 1] / 64.))
+                 + 0.5) / 9007199254740992.
+                for i in (0, 2)]
+
+    def _newStream(self):
+        self.streams += 1
+        return self.streams - 1
+
+    def _broadcast(self, parameter):
+        return numerix.zeros(self.ids.shape) + numerix.asarray(parameter, dtype=float)
+
+    def _standardNormal(self, stream, attempt, ids):
+        u0, u1 = self._uniforms(stream, attempt, ids)
+        return numerix.sqrt(-2. * numerix.log(u0)) * numerix.cos(2. * numerix.pi * u1)
+
+    def uniform(self, low, high):
+        """Values uniformly distributed between `low` and `high`."""
+        u0, u1 = self._uniforms(self._newStream(), 0, self.ids)
+        return low + (high - low) * u0
+
+    def normal(self, loc, scale):
+        """Values normally distributed with mean `loc` and standard deviation
+        `scale`.
+        """
+        return loc + scale * self._standardNormal(self._newStream(), 0, self.ids)
+
+    def exponential(self, scale):
+        """Values exponentially distributed with mean `scale`."""
+        u0, u1 = self._uniforms(self._newStream(), 0, self.ids)
+        return -scale * numerix.log(u0)
+
+    def gamma(self, shape, scale):
+        """Values from the gamma distribution with `shape` and `scale`.
+
+        Uses the rejection method of Marsaglia and Tsang, "A simple method
+        for generating gamma variables", ACM TOMS 26, 363 (2000). Each
+        attempt for an element draws from the element's own stream, so the
+        number of attempts does not depend on the other elements.
+        """
+        shape = self._broadcast(shape)
+        scale = self._broadcast(scale)
+        normalStream = self._newStream()
+        uniformStream = self._newStream()
+
+        # boost shapes below one and correct below
+        small = shape < 1.
+        d = numerix.where(small, shape + 1., shape) - 1. / 3.
+        c = 1. / numerix.sqrt(9. * d)
+
+        value = numerix.zeros(self.ids.shape)
+        pending = numerix.arange(len(self.ids))
+        attempt = 0
+        while len(pending) > 0:
+            ids = self.ids[pending]
+            x = self._standardNormal(normalStream, attempt, ids)
+            u, boost = self._uniforms(uniformStream, attempt, ids)
+            v = (1. + c[pending] * x)**3
+            positive = v > 0
+            accept = positive & (numerix.log(u) < 0.5 * x**2 + d[pending]
+                                 - d[pending] * numerix.where(positive, v, 1.)
+                                 + d[pending] * numerix.log(numerix.where(positive, v, 1.)))
+            accepted = pending[accept]
+            value[accepted] = d[accepted] * v[accept]
+            boost = boost[accept]
+            value[accepted] *= numerix.where(small[accepted],
+                                             boost**(1. / shape[accepted]), 1.)
+            pending = pending[~accept]
+            attempt += 1
+
+        return value * scale
+
+    def beta(self, a, b):
+        """Values from the beta distribution with parameters `a` and `b`."""
+        x = self.gamma(a, 1.)
+        y = self.gamma(b, 1.)
+        return x / (x + y)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -1,13 +1,23 @@
-__all__ = ["doInline"]
+__all__ = ["doInline", "doFuse"]
 
 import inspect
 import os
 import sys
 
 if '--inline' in [s.lower() for s in sys.argv[1:]]:
-    doInline = True
+    doFuse = True
 else:
-    doInline = 'FIPY_INLINE' in os.environ
+    doFuse = 'FIPY_INLINE' in os.environ
+
+# `Variable` expressions are fused with NumPy (see
+# `fipy.variables.fusedEvaluator`), but the C kernels need weave
+doInline = False
+if doFuse:
+    try:
+        import weave
+        doInline = True
+    except ImportError:
+        pass
 
 _inlineFrameComment = 'FIPY_INLINE_COMMENT' in os.environ
 
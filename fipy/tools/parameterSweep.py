@@ -0,0 +1,142 @@
+"""Run one model for many sets of parameters in a pool of processes
+"""
+__docformat__ = 'restructuredtext'
+
+import os
+
+__all__ = ["sweep"]
+
+# what the worker processes should run; inherited when they are forked
+_sweep = None
+
+def sweep(run, parameters, processes=None, prepare=None):
+    """
+    Call `run` once for each set of `parameters`, in separate processes,
+    and return what each call returns, in order.
+
+    Everything that exists when `sweep` is called, e.g., a mesh, the
+    variables and the equations of a model, is shared with every run,
+    so it is built only once. Each run starts in a new process forked
+    from the caller. The process has a copy-on-write view of the
+    caller's memory, so the arrays of a mesh are not copied, and changes
+    made by one run are not seen by the caller or by the other runs.
+
+    Coefficients that differ from run to run should be `Variable`
+    objects that `run` sets, so that the terms of the equations can be
+    built before the sweep.
+
+        >>> from fipy import Grid1D, CellVariable, Variable, TransientTerm, DiffusionTerm
+        >>> from fipy.tools import numerix
+        >>> mesh = Grid1D(nx=20, dx=0.05)
+        >>> phi = CellVariable(mesh=mesh, value=0.)
+        >>> phi.constrain(1., where=mesh.facesLeft)
+        >>> D = Variable(value=1.)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=D)
+        >>> def run(diffusivity, steps=10):
+        ...     D.setValue(diffusivity)
+        ...     for step in range(steps):
+        ...         eq.solve(var=phi, dt=0.01)
+        ...     return phi.cellVolumeAverage.value
+
+        >>> averages = sweep(run, [dict(diffusivity=0.01),
+        ...                        dict(diffusivity=0.1),
+        ...                        dict(diffusivity=1., steps=0)], processes=2)
+        >>> print averages[0] < averages[1], averages[2]
+        True 0.0
+
+    The model is left as it was
+
+        >>> print D, phi.cellVolumeAverage
+        1.0 0.0
+
+    and a run gives the same result whether or not it is swept
+
+        >>> print numerix.allclose(run(diffusivity=0.1), averages[1])
+        True
+
+    A run starts with whatever the caller has cached, like the sparsity
+    pattern of the matrices of the equations on a mesh, or the column
+    ordering that a solver reuses from its last factorization, but what
+    a run caches is lost with its process. A `prepare` function, called
+    by the caller before any run starts, can build those caches once for
+    all of the runs; whatever it changes, it should set back
+
+        >>> from fipy import DefaultSolver
+        >>> solver = DefaultSolver()
+        >>> def run(diffusivity, steps=10):
+        ...     D.setValue(diffusivity)
+        ...     for step in range(steps):
+        ...         eq.solve(var=phi, dt=0.01, solver=solver)
+        ...     return phi.cellVolumeAverage.value
+        >>> def prepare():
+        ...     eq.solve(var=phi, dt=0.01, solver=solver)
+        ...     phi.setValue(0.)
+        >>> prepared = sweep(run, [dict(diffusivity=0.01),
+        ...                        dict(diffusivity=0.1)], processes=2,
+        ...                  prepare=prepare)
+        >>> print numerix.allclose(prepared, averages[:2])
+        True
+
+    The processes are not MPI processes; a sweep is run by a single
+    processor. Where processes cannot be forked, the runs could not each
+    start from the state of the caller, so `sweep` raises an `OSError`
+    rather than give different results
+
+        >>> fork = os.fork
+        >>> del os.fork
+        >>> try:
+        ...     sweep(run, [dict(diffusivity=0.1)])
+        ... finally:
+        ...     os.fork = fork
+        Traceback (most recent call last):
+            ...
+        OSError: a sweep needs os.fork() to give each run a copy of the model
+
+    :Parameters:
+      - `run`: the function to call with each set of parameters; what it
+        returns must be picklable
+      - `parameters`: a sequence of dictionaries, each holding the keyword
+        arguments of one call to `run`
+      - `processes`: the number of runs at once; by default, the number
+        of CPUs
+      - `prepare`: a function, taking no arguments, to call before the
+        runs, e.g., to assemble and solve the equations once so that every
+        run inherits what that caches
+    """
+    global _sweep
+
+    parameters = list(parameters)
+
+    if not hasattr(os, "fork"):
+        # without `fork`, workers would not inherit the model, and runs
+        # made in turn by the caller would each start where the last ended
+        raise OSError, "a sweep needs os.fork() to give each run a copy of the model"
+
+    if prepare is not None:
+        prepare()
+
+    import multiprocessing
+
+    _sweep = (run, parameters)
+    try:
+        # each worker does a single run, so every run starts from the
+        # state of the caller
+        pool = multiprocessing.Pool(processes=processes, maxtasksperchild=1)
+        try:
+            return pool.map(_runWorker, range(len(parameters)), chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _sweep = None
+
+def _runWorker(index):
+    run, parameters = _sweep
+    return run(**parameters[index])
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,261 @@
+"""The graph of `Variable` objects and what each one is calculated from
+
+Every `Variable` holds strong references to the `Variable` objects it
+requires, and weak references to those that subscribe to it. Whenever a
+`Variable` changes, every subscriber that can be reached from it is marked
+stale. A `DependencyGraph` shows where those invalidations go and, with a
+:class:`~fipy.tools.performance.instrumentation.Report`, which of them led
+to costly recalculations
+
+    >>> from fipy import Grid1D, CellVariable
+    >>> from fipy.tools.performance.instrumentation import instrument
+    >>> mesh = Grid1D(nx=10)
+    >>> phi = CellVariable(mesh=mesh, name="phi", value=1.)
+    >>> D = (phi * 2 + 1) ** 2
+    >>> D.name = "D"
+    >>> with instrument() as report:
+    ...     for sweep in range(3):
+    ...         phi.value = sweep
+    ...         value = D.value
+    >>> graph = DependencyGraph([D], report=report)
+    >>> print len(graph.nodes)
+    7
+    >>> node = graph.node(D)
+    >>> print node["name"], node["recalculations"], node["requires"]
+    D 3 2
+    >>> print graph.node(phi)["reach"]
+    3
+
+The graph can be printed as a table, most costly first, or as a
+:term:`Graphviz` DOT file
+
+    >>> print graph # doctest: +ELLIPSIS
+    recalculations time(s) reach subscribers class name
+    ...
+    >>> print graph.toDOT() # doctest: +ELLIPSIS
+    digraph dependencies {
+    ...
+    }
+
+`collapse()` removes chains of intermediate operators from the paths that
+invalidations follow
+
+    >>> print collapse(D)
+    2
+    >>> print [ref() is D for ref in phi.subscribedVariables]
+    [True]
+    >>> phi.value = 1.
+    >>> print D.value[0]
+    9.0
+"""
+__docformat__ = 'restructuredtext'
+
+import gc
+
+__all__ = ["DependencyGraph", "collapse"]
+
+class DependencyGraph(object):
+    """
+    A snapshot of the `Variable` objects that are connected to `vars`.
+
+    Each of the `nodes` is a dictionary of
+
+      - `var`: the `Variable`
+      - `name`: its name, or the name of its class
+      - `class`: the name of its class
+      - `shape`: its shape
+      - `cached`: whether it keeps its value
+      - `collapsed`: whether its subscriptions were passed on by `collapse()`
+      - `requires`: the number of `Variable` objects it is calculated from
+      - `subscribers`: the number of `Variable` objects that subscribe to it
+      - `reach`: the number of `Variable` objects that are marked stale
+        when it changes
+      - `recalculations`: the number of times it was recalculated and
+      - `time`: the time spent doing so, without the `Variable` objects
+        it requires, both from `report`
+
+    :Parameters:
+      - `vars`: the `Variable` objects to start from; everything they
+        require, or that subscribes to them, directly or not, is in the
+        graph. If `None`, the graph holds every `Variable` that is alive.
+      - `report`: a :class:`~fipy.tools.performance.instrumentation.Report`
+        of the recalculations
+    """
+    def __init__(self, vars=None, report=None):
+        from fipy.variables.variable import Variable
+
+        if vars is None:
+            vars = [obj for obj in gc.get_objects() if isinstance(obj, Variable)]
+            self._vars = vars
+        else:
+            if isinstance(vars, Variable):
+                vars = [vars]
+            self._vars = []
+            seen = set()
+            stack = list(vars)
+            while stack:
+                var = stack.pop()
+                if id(var) in seen:
+                    continue
+                seen.add(id(var))
+                self._vars.append(var)
+                stack.extend([v for v in var.requiredVariables if isinstance(v, Variable)])
+                stack.extend(_subscribers(var))
+
+        self._index = dict([(id(var), i) for i, var in enumerate(self._vars)])
+
+        self.nodes = []
+        for var in self._vars:
+            if report is None:
+                recalculations, time = 0, 0.
+            else:
+                recalculations, time = report.recalculationsOf(var)
+            self.nodes.append({
+                "var": var,
+                "name": var.name or var.__class__.__name__,
+                "class": var.__class__.__name__,
+                "shape": var.shape,
+                "cached": var._isCached(),
+                "collapsed": var._collapsedSources is not None,
+                "requires": len(var.requiredVariables),
+                "subscribers": len(_subscribers(var)),
+                "reach": _reach(var),
+                "recalculations": recalculations,
+                "time": time
+            })
+
+    def node(self, var):
+        """Return the node of `var`."""
+        return self.nodes[self._index[id(var)]]
+
+    def __str__(self):
+        lines = ["recalculations time(s) reach subscribers class name"]
+        nodes = sorted(self.nodes, key=lambda node: (-node["time"], -node["reach"]))
+        for node in nodes:
+            lines.append("%d %g %d %d %s %s" % (node["recalculations"], node["time"],
+                                                node["reach"], node["subscribers"],
+                                                node["class"], node["name"]))
+        return "\n".join(lines)
+
+    def toDOT(self):
+        """
+        Return the graph in the DOT language of :term:`Graphviz`, with an
+        edge from each `Variable` to each of its subscribers.
+        """
+        lines = ["digraph dependencies {"]
+        for i, node in enumerate(self.nodes):
+            label = "%s\\n%s" % (node["name"].replace('"', '\\"'), node["class"])
+            if node["recalculations"] > 0:
+                label += "\\n%d in %.3g s" % (node["recalculations"], node["time"])
+            style = []
+            if node["cached"]:
+                style.append("bold")
+            if node["collapsed"]:
+                style.append("dashed")
+            lines.append('  %d [label="%s", style="%s"];' % (i, label, ",".join(style)))
+        for i, var in enumerate(self._vars):
+            for subscriber in _subscribers(var):
+                j = self._index.get(id(subscriber), None)
+                if j is not None:
+                    lines.append("  %d -> %d;" % (i, j))
+        lines.append("}")
+        return "\n".join(lines)
+
+def _subscribers(var):
+    subscribers = [ref() for ref in var.subscribedVariables]
+    return [subscriber for subscriber in subscribers if subscriber is not None]
+
+def _reach(var):
+    seen = set()
+    stack = _subscribers(var)
+    while stack:
+        subscriber = stack.pop()
+        if id(subscriber) not in seen:
+            seen.add(id(subscriber))
+            stack.extend(_subscribers(subscriber))
+    return len(seen)
+
+def collapse(*vars):
+    """
+    Pass the subscriptions of every intermediate operator that `vars`
+    are calculated from on to the one `Variable` that uses it, so that
+    changes skip the operators on their way to it.
+
+    An `_OperatorVariable` with a single subscriber does not keep its
+    value, so it is recalculated whenever it is read and never needs to
+    know that it is stale. Invalidations that went through chains of such
+    operators then each mark a single `Variable`, instead of every link of
+    the chain. The results are unchanged
+
+        >>> from fipy import Variable
+        >>> a = Variable(value=1.)
+        >>> b = Variable(value=2.)
+        >>> c = (((a + b) * 2 - 1) / a)
+        >>> c.cacheMe()
+        >>> print c
+        5.0
+        >>> print collapse(c)
+        3
+        >>> a.value = 2.
+        >>> print c
+        3.5
+
+    and an operator that comes to be used more than once, or that is
+    asked to keep its value, is restored
+
+        >>> d = c - b
+        >>> e = (a + b) * 2
+        >>> f = e + 1
+        >>> print collapse(f)
+        2
+        >>> g = e - 1
+        >>> b.value = 3.
+        >>> print c, f, g
+        4.5 11.0 9.0
+
+    Nothing is collapsed when every `Variable` is cached (with
+    :option:`--cache`).
+
+    :Parameters:
+      - `vars`: the `Variable` objects whose requirements are collapsed
+
+    :Returns: the number of `Variable` objects that were collapsed
+    """
+    from fipy.variables.variable import Variable
+
+    if Variable._cacheAlways:
+        return 0
+
+    # children before their subscribers, so that chains are passed on to
+    # the end that is not collapsed
+    order = []
+    seen = set()
+    stack = [(var, False) for var in vars]
+    while stack:
+        var, done = stack.pop()
+        if done:
+            order.append(var)
+        elif id(var) not in seen:
+            seen.add(id(var))
+            stack.append((var, True))
+            stack.extend([(v, False) for v in var.requiredVariables
+                          if isinstance(v, Variable)])
+
+    collapsed = 0
+    for var in order:
+        subscribers = _subscribers(var)
+        if (hasattr(var, "opShape")
+            and var._collapsedSources is None
+            and not Variable._isCached(var)
+            and len(subscribers) == 1):
+            var._collapseInto(subscribers[0])
+            collapsed += 1
+
+    return collapsed
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
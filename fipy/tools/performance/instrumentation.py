@@ -0,0 +1,278 @@
+"""Timers and counters of the work done by each solve and sweep
+
+Instrumentation is off unless it is asked for, and then costs a few
+calls to :func:`time.time` for each solve. Within an `instrument` block,
+every call to :meth:`~fipy.terms.term.Term.solve` or
+:meth:`~fipy.terms.term.Term.sweep` adds a step to the report
+
+    >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm, LinearLUSolver
+    >>> mesh = Grid1D(nx=10)
+    >>> phi = CellVariable(mesh=mesh, name="phi", value=0.)
+    >>> phi.constrain(1., where=mesh.facesLeft)
+    >>> eq = TransientTerm() == DiffusionTerm(coeff=phi.arithmeticFaceValue + 1.)
+    >>> with instrument() as report:
+    ...     for sweep in range(3):
+    ...         residual = eq.sweep(var=phi, dt=1., solver=LinearLUSolver())
+    >>> print len(report.steps)
+    3
+    >>> step = report.steps[-1]
+    >>> print step["kind"], step["var"], step["solver"]["name"]
+    sweep phi LinearLUSolver
+    >>> print sorted(step["buildMatrix"].keys())
+    ['DiffusionTerm', 'TransientTerm']
+    >>> print sorted(key for key in step if isinstance(step[key], float))
+    ['prepareLinearSystem', 'recalculationTime', 'residual', 'solve', 'time']
+
+The iterations of the solver and the residual it reached are counted
+instead of being printed
+
+    >>> print step["solver"]["iterations"] > 0, step["solver"]["residual"] < 1e-10
+    True True
+
+and so are the recalculations of the variables that the equation
+depends on
+
+    >>> print step["recalculations"] > 0
+    True
+
+Nothing is recorded outside of the block
+
+    >>> residual = eq.sweep(var=phi, dt=1., solver=LinearLUSolver())
+    >>> print len(report.steps)
+    3
+
+The report is plain data, so it can be saved as :term:`JSON`
+
+    >>> import json
+    >>> print json.loads(report.toJSON())[0]["kind"]
+    sweep
+
+Setting the :envvar:`FIPY_INSTRUMENT` environment variable to the name of
+a file instruments the whole run, and appends each step to the file as a
+line of :term:`JSON`. In parallel, each processor appends to its own file,
+named with its number as a suffix.
+"""
+__docformat__ = 'restructuredtext'
+
+import json
+import os
+import time
+import weakref
+
+__all__ = ["instrument", "Report"]
+
+# the report being collected, if any
+_report = None
+
+class Report(object):
+    """
+    The timers and counters of each solve and sweep.
+
+    `steps` holds a dictionary for each step, with
+
+      - `kind`: "solve" or "sweep"
+      - `var`: the name of the solution variable
+      - `time`: the wall time of the whole step, in seconds
+      - `prepareLinearSystem`: the time spent building the matrix and
+        right-hand side
+      - `buildMatrix`: the time spent building the matrix of each type of
+        term, keyed by the name of its class
+      - `residual`: the time spent calculating the residual of a sweep
+      - `solve`: the time spent in the solver
+      - `solver`: the name of the solver, and the `iterations` and
+        final `residual` of the solve, where the solver provides them
+      - `recalculations`: the number of times that a `Variable` was
+        recalculated during the step, and `recalculationTime`, the time
+        spent doing so
+
+    `recalculations` and `recalculationTime` also count the
+    recalculations made outside of any step.
+    """
+    def __init__(self, filename=None):
+        self.steps = []
+        self.recalculations = 0
+        self.recalculationTime = 0.
+        self.filename = filename
+        self._step = None
+        # the time spent recalculating what each recalculation in
+        # progress depends on
+        self._recalculating = []
+        # `[weakref, count, time]` for each recalculated `Variable`, by `id`
+        self._variables = {}
+
+    def toJSON(self):
+        """Return the steps as a :term:`JSON` string."""
+        return json.dumps(self.steps)
+
+    def recalculationsOf(self, var):
+        """
+        Return the number of times that `var` was recalculated, and the
+        time spent doing so, not counting the time spent recalculating
+        the `Variable` objects that it depends on.
+
+            >>> from fipy import Variable
+            >>> a = Variable(value=1.)
+            >>> b = (a + 1) * 2
+            >>> with instrument() as report:
+            ...     for value in range(3):
+            ...         a.value = value
+            ...         print b
+            2.0
+            4.0
+            6.0
+            >>> print report.recalculationsOf(b)[0], report.recalculationsOf(a)
+            3 (0, 0.0)
+        """
+        entry = self._variables.get(id(var), None)
+        if entry is None or entry[0]() is not var:
+            return (0, 0.)
+        return (entry[1], entry[2])
+
+    def _countRecalculation(self, var, elapsed):
+        entry = self._variables.get(id(var), None)
+        if entry is None or entry[0]() is not var:
+            # a `Variable` that was collected may have had the same `id`
+            entry = self._variables[id(var)] = [weakref.ref(var), 0, 0.]
+        entry[1] += 1
+        entry[2] += elapsed
+
+    def _finish(self, step):
+        self.steps.append(step)
+        if self.filename is not None:
+            from fipy.tools import parallelComm
+
+            filename = self.filename
+            if parallelComm.Nproc > 1:
+                filename += ".%d" % parallelComm.procID
+            f = open(filename, "a")
+            f.write(json.dumps(step) + "\n")
+            f.close()
+
+class _NoTimer(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, type, value, traceback):
+        return False
+
+_noTimer = _NoTimer()
+
+class _Timer(object):
+    def __init__(self, record, key, name=None):
+        self.record = record
+        self.key = key
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.time()
+        return self.record
+
+    def __exit__(self, type, value, traceback):
+        elapsed = time.time() - self.start
+        if self.name is None:
+            self.record[self.key] = self.record.get(self.key, 0.) + elapsed
+        else:
+            times = self.record.setdefault(self.key, {})
+            times[self.name] = times.get(self.name, 0.) + elapsed
+        return False
+
+class _Step(_Timer):
+    def __init__(self, report, kind, var):
+        _Timer.__init__(self, record=dict(kind=kind,
+                                          var=getattr(var, "name", ""),
+                                          buildMatrix={},
+                                          solver={},
+                                          recalculations=0,
+                                          recalculationTime=0.),
+                        key="time")
+        self.report = report
+
+    def __enter__(self):
+        self.report._step = self.record
+        return _Timer.__enter__(self)
+
+    def __exit__(self, type, value, traceback):
+        _Timer.__exit__(self, type, value, traceback)
+        self.report._step = None
+        if type is None:
+            self.report._finish(self.record)
+        return False
+
+class instrument(object):
+    """
+    Collect a `Report` of the solves and sweeps made within a ``with``
+    block.
+
+    :Parameters:
+      - `filename`: if not `None`, append each step to this file as a line
+        of :term:`JSON` as soon as it finishes
+    """
+    def __init__(self, filename=None):
+        self.report = Report(filename=filename)
+
+    def __enter__(self):
+        global _report
+        self.previous = _report
+        _report = self.report
+        return self.report
+
+    def __exit__(self, type, value, traceback):
+        global _report
+        _report = self.previous
+        return False
+
+def step(kind, var):
+    """Time a solve or a sweep of `var`."""
+    if _report is None or _report._step is not None:
+        return _noTimer
+    return _Step(_report, kind, var)
+
+def timer(key, name=None):
+    """Add the time taken within a ``with`` block to `key` of the current
+    step, or to `name` within `key`.
+    """
+    if _report is None or _report._step is None:
+        return _noTimer
+    return _Timer(_report._step, key, name)
+
+def recording():
+    """Whether a step is being recorded, so that counters that cost
+    something to find are worth finding.
+    """
+    return _report is not None and _report._step is not None
+
+def record(key, **counters):
+    """Set `counters` within `key` of the current step, if any."""
+    if recording():
+        _report._step.setdefault(key, {}).update(counters)
+
+def _startRecalculation():
+    _report._recalculating.append(0.)
+    return (_report, time.time())
+
+def _finishRecalculation(start, var):
+    report, start = start
+    elapsed = time.time() - start
+    inner = report._recalculating.pop()
+    if len(report._recalculating) > 0:
+        report._recalculating[-1] += elapsed
+    else:
+        # only the outermost recalculation adds to the totals, as it
+        # includes the recalculations of the variables it depends on
+        report.recalculationTime += elapsed
+        if report._step is not None:
+            report._step["recalculationTime"] += elapsed
+    report.recalculations += 1
+    if report._step is not None:
+        report._step["recalculations"] += 1
+    report._countRecalculation(var, elapsed - inner)
+
+if os.environ.get("FIPY_INSTRUMENT"):
+    _report = Report(filename=os.environ["FIPY_INSTRUMENT"])
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
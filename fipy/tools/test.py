@@ -8,7 +8,13 @@ def _suite():
             'dimensions.physicalField',
             'numerix',
             'dump',
+            'checkpoint',
             'vector',
+            'bucketGrid',
+            'counterRandom',
+            'parameterSweep',
+            'performance.instrumentation',
+            'performance.dependencyGraph',
         ), base = __name__)
 
     return theSuite
@@ -74,5 +74,23 @@ class _AddOverFacesVariable(CellVariable):
 
         faceContributions = contributions * self.mesh._cellToFaceOrientations[s]
 
-        return numerix.tensordot(numerix.ones(faceContributions.shape[-2], 'd'),
-                                 numerix.MA.filled(faceContributions, 0.), (0, -2)) / self.mesh.cellVolumes
+        faceContributions = numerix.MA.filled(faceContributions, 0.)
+
+        if (type(faceContributions) is not numerix.ndarray
+            or faceContributions.dtype != numerix.result_type(faceContributions, self.mesh.cellVolumes)):
+            return numerix.tensordot(numerix.ones(faceContributions.shape[-2], 'd'),
+                                     faceContributions, (0, -2)) / self.mesh.cellVolumes
+
+        # sum over the faces as `tensordot` does, but into the array of
+        # the last value
+        numberOfFaces = faceContributions.shape[-2]
+        key = (faceContributions.shape[:-2] + faceContributions.shape[-1:], faceContributions.dtype)
+        value = self._evaluationBuffer(key)
+        if value is None:
+            value = self._ownValue(numerix.empty(*key), key)
+
+        numerix.NUMERIX.dot(numerix.ones((1, numberOfFaces), faceContributions.dtype),
+                            numerix.rollaxis(faceContributions, -2, 0).reshape((numberOfFaces, -1)),
+                            value.reshape((1, -1)))
+
+        return numerix.divide(value, self.mesh.cellVolumes, value)
@@ -1,6 +1,5 @@
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["BetaNoiseVariable"]
@@ -88,9 +87,9 @@ class BetaNoiseVariable(NoiseVariable):
         self.alpha = self._requires(alpha)
         self.beta = self._requires(beta)
 
-    def random(self):
-        return random.beta(a = self.alpha, b = self.beta,
-                           size = [self.mesh.globalNumberOfCells])
+    def random(self, generator):
+        return generator.beta(a=self._localValue(self.alpha),
+                              b=self._localValue(self.beta))
 
 def _test():
     import fipy.tests.doctestPlus
@@ -116,24 +116,18 @@ class CellVariable(_MeshVariable):
         return self.mesh._localNonOverlappingCellIDs
 
     @property
-    def globalValue(self):
-        """Concatenate and return values from all processors
-
-        When running on a single processor, the result is identical to
-        :attr:`~fipy.variables.variable.Variable.value`.
-        """
-        return self._getGlobalValue(self.mesh._localNonOverlappingCellIDs,
-                                    self.mesh._globalNonOverlappingCellIDs)
+    def _globalLayout(self):
+        return self.mesh._globalCellLayout
 
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
 
     def __call__(self, points=None, order=0, nearestCellIDs=None):
         r"""
-        Interpolates the CellVariable to a set of points using a
-        method that has a memory requirement on the order of Ncells by
-        Npoints in general, but uses only Ncells when the
-        CellVariable's mesh is a UniformGrid object.
+        Interpolates the CellVariable to a set of points. The nearest
+        cells are found directly when the CellVariable's mesh is a
+        UniformGrid object and with a spatial index of the cell centers,
+        built once per mesh, otherwise.
 
         :Parameters:
 
@@ -462,6 +456,40 @@ class CellVariable(_MeshVariable):
         else:
             self._old.value = self.value.copy()
 
+    def updateGhosts(self, wait=True):
+        """
+        Copy the values of the cells owned by each process into the
+        overlapping (ghost) cells of the other processes that share them.
+
+        The ghost cells are normally only brought up to date as a side
+        effect of a :term:`Trilinos` solve. This exchanges them directly
+        with nonblocking messages to each neighboring process. When `wait`
+        is `False`, the messages are only posted and a request is
+        returned, so that work on the cells this process owns can
+        proceed while they are in flight; call its `wait()` method before
+        using the ghost cells.
+
+        >>> from fipy import *
+        >>> v = CellVariable(mesh=Grid1D(nx=3), value=(1., 2., 3.))
+        >>> request = v.updateGhosts(wait=False)
+        >>> request.wait()
+        >>> print v.globalValue
+        [ 1.  2.  3.]
+        """
+        if self._value is None:
+            self._getValue()
+
+        value = self._value
+        if hasattr(value, "unit"):
+            value = value.value
+
+        request = self.mesh._cellHaloExchange.start(value, done=self._markFresh)
+
+        if wait:
+            request.wait()
+        else:
+            return request
+
     def _resetToOld(self):
         if self._old is not None:
             self.value = (self._old.value)
@@ -575,7 +603,13 @@ class CellVariable(_MeshVariable):
                 self.faceConstraints = []
             self.faceConstraints.append(value)
             self._requires(value.value)
-            # self._requires(value.where) ???
+            from fipy.variables.variable import Variable
+            if isinstance(value.where, Variable):
+                self._requires(value.where)
+            for name in ('_arithmeticFaceValue', '_harmonicFaceValue', '_minmodFaceValue'):
+                faceVar = self.__dict__.get(name, None)
+                if hasattr(faceVar, '_constraintMask'):
+                    faceVar._constraintMask._requires(value.where)
             self._markStale()
         else:
 ##            _MeshVariable.constrain(value, where)
@@ -641,8 +675,22 @@ class CellVariable(_MeshVariable):
         """
 
 class _ReMeshedCellVariable(CellVariable):
+    """
+    The values of a `CellVariable` at the nearest cells of another mesh
+
+        >>> from fipy import *
+        >>> m0 = Grid2D(nx=2, ny=2)
+        >>> m1 = Grid2D(nx=4, ny=4, dx=.5, dy=.5)
+        >>> v0 = CellVariable(mesh=m0, value=m0.x * m0.y, name="v0")
+        >>> v1 = _ReMeshedCellVariable(v0, m1)
+        >>> print v1.mesh is m1, v1.name
+        True v0
+        >>> print v1
+        [ 0.25  0.25  0.75  0.75  0.25  0.25  0.75  0.75  0.75  0.75  2.25  2.25
+          0.75  0.75  2.25  2.25]
+    """
     def __init__(self, oldVar, newMesh):
-        newValues = oldVar.getValue(points = newMesh.cellCenters)
+        newValues = oldVar(points=newMesh.cellCenters.globalValue)
         CellVariable.__init__(self, newMesh, name = oldVar.name, value = newValues, unit = oldVar.unit)
 
 def _test():
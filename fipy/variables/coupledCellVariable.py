@@ -53,6 +53,12 @@ class _CoupledCellVariable(object):
     def globalValue(self):
         return numerix.concatenate([numerix.array(var.globalValue) for var in self.vars])
 
+    def gatherToRoot(self, root=0):
+        values = [var.gatherToRoot(root=root) for var in self.vars]
+        if values[0] is None:
+            return None
+        return numerix.concatenate([numerix.array(value) for value in values])
+
     @property
     def numericValue(self):
         return numerix.concatenate([var.numericValue for var in self.vars])
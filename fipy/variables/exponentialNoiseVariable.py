@@ -1,6 +1,5 @@
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["ExponentialNoiseVariable"]
@@ -79,9 +78,8 @@ class ExponentialNoiseVariable(NoiseVariable):
         NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
         self.mean = self._requires(mean)
 
-    def random(self):
-        return random.exponential(scale = self.mean,
-                                  size = [self.mesh.globalNumberOfCells])
+    def random(self, generator):
+        return generator.exponential(scale=self._localValue(self.mean))
 
 def _test():
     import fipy.tests.doctestPlus
@@ -34,6 +34,17 @@ class _FaceGradVariable(FaceVariable):
     >>> print (v2.faceGrad.globalValue  == v.faceGrad.globalValue[:,2]).all()
     True
 
+    A gradient is recalculated into the array of its last value, which
+    it lends out read-only
+
+    >>> g = v2.faceGrad
+    >>> held = g.value
+    >>> v2.value = y**2
+    >>> print (g.globalValue == _FaceGradVariable(v2).globalValue).all()
+    True
+    >>> print g.value.base is held.base, (held == g.value).all()
+    True True
+
     """
     def __init__(self, var):
         FaceVariable.__init__(self, mesh=var.mesh, elementshape=(var.mesh.dim,) + var.shape[:-1])
@@ -139,7 +150,19 @@ class _FaceGradVariable(FaceVariable):
         T1 = (t1grad1 + t1grad2) / 2.
         T2 = (t2grad1 + t2grad2) / 2.
 
-        return normals[s] * N[numerix.newaxis] + tangents1[s] * T1[numerix.newaxis] + tangents2[s] * T2[numerix.newaxis]
+        if type(N) is not numerix.ndarray:
+            return normals[s] * N[numerix.newaxis] + tangents1[s] * T1[numerix.newaxis] + tangents2[s] * T2[numerix.newaxis]
+
+        key = (normals.shape[:1] + N.shape, numerix.result_type(normals, N, T1, T2))
+        value = self._evaluationBuffer(key)
+        if value is None:
+            value = self._ownValue(numerix.empty(*key), key)
+
+        numerix.multiply(normals[s], N[numerix.newaxis], value)
+        value += tangents1[s] * T1[numerix.newaxis]
+        value += tangents2[s] * T2[numerix.newaxis]
+
+        return value
 
 def _test():
     import fipy.tests.doctestPlus
@@ -31,9 +31,8 @@ class FaceVariable(_MeshVariable):
                                               value=self.value)
 
     @property
-    def globalValue(self):
-        return self._getGlobalValue(self.mesh._localNonOverlappingFaceIDs,
-                                    self.mesh._globalNonOverlappingFaceIDs)
+    def _globalLayout(self):
+        return self.mesh._globalFaceLayout
 
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
@@ -0,0 +1,328 @@
+"""
+Evaluation of `_OperatorVariable` expressions in a single pass.
+
+An expression such as `(a * b + c) / d` normally allocates a new array for
+every operator. When :option:`--inline` is set, the tree of
+`_OperatorVariable` objects is instead flattened into a sequence of NumPy
+ufunc calls, each writing into a buffer that is reused by the next one,
+and only the final result is newly allocated. The plan of ufunc calls and
+its buffers are cached per expression structure and the types and shapes
+of its inputs.
+
+A cached `_OperatorVariable`, fused or a single ufunc, instead evaluates
+into the array of its last value, which it owns and lends out read-only
+(see `Variable._evaluationBuffer()`).
+"""
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.tools import numerix
+
+def _opcodes(fn):
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return None
+    return (code.co_code, code.co_names, code.co_consts)
+
+# The `lambda` operators of `Variable` and the ufunc they are equivalent to.
+# They are recognized by their byte code, so they must be written exactly
+# as in `Variable`. The flag is `True` if the arguments are swapped.
+_lambdaUfuncs = {}
+for _fn, _ufunc, _swap in (
+        (lambda a,b: a+b, numerix.add, False),
+        (lambda a,b: a-b, numerix.subtract, False),
+        (lambda a,b: b-a, numerix.subtract, True),
+        (lambda a,b: a*b, numerix.multiply, False),
+        (lambda a,b: a/b, numerix.divide, False),
+        (lambda a,b: b/a, numerix.divide, True),
+        (lambda a,b: pow(a,b), numerix.power, False),
+        (lambda a,b: pow(b,a), numerix.power, True),
+        (lambda a,b: numerix.fmod(a, b), numerix.fmod, False),
+        (lambda a,b: a<b, numerix.less, False),
+        (lambda a,b: a<=b, numerix.less_equal, False),
+        (lambda a,b: a==b, numerix.equal, False),
+        (lambda a,b: a!=b, numerix.not_equal, False),
+        (lambda a,b: a>b, numerix.greater, False),
+        (lambda a,b: a>=b, numerix.greater_equal, False),
+        (lambda a: -a, numerix.negative, False),
+        (lambda a: numerix.fabs(a), numerix.fabs, False)):
+    _lambdaUfuncs[_opcodes(_fn)] = (_ufunc, _swap)
+del _fn, _ufunc, _swap
+
+_maxPlans = 64
+_plans = {}
+
+def _ufuncOf(var):
+    """Return `(ufunc, swap)` if `var` is an `_OperatorVariable` that can
+    be fused, or `None`.
+    """
+    op = getattr(var, "op", None)
+    if (op is None
+        or not hasattr(var, "opShape")
+        or not getattr(var, "canInline", False)
+        or len(var.constraints) > 0):
+        return None
+
+    if isinstance(op, numerix.ufunc):
+        if op.nin == len(var.var) and op.nout == 1:
+            return (op, False)
+        return None
+
+    return _lambdaUfuncs.get(_opcodes(op), None)
+
+def _plainArrays(values):
+    """Return `values` as `ndarray` objects, or `None` if any of them is
+    not a plain number or array.
+    """
+    arrays = []
+    for value in values:
+        if isinstance(value, numerix.ndarray):
+            if type(value) is not numerix.ndarray:
+                # e.g., masked arrays
+                return None
+        elif not isinstance(value, (numerix.generic, int, long, float, bool)):
+            # e.g., `PhysicalField`
+            return None
+        arrays.append(numerix.asarray(value))
+    return arrays
+
+def _signature(value):
+    if value.ndim == 0:
+        # numpy casts scalars by value, not by type
+        return (numerix.min_scalar_type(value), ())
+    return (value.dtype, value.shape)
+
+class _FusedPlan(object):
+    """The sequence of ufunc calls that evaluates an expression.
+
+    Each step is `(ufunc, inputs, output)`. Inputs are `(isLeaf, index)`
+    pairs and the output is the index of a reusable buffer, or `None` for
+    the newly allocated result of the last step.
+    """
+
+    def __init__(self, steps, leaves):
+        # evaluate once without buffers to learn what each step returns
+        results = []
+        for ufunc, inputs in steps:
+            results.append(ufunc(*self._arguments(inputs, leaves, results)))
+        self.result = results[-1]
+
+        self.shape = self.result.shape
+        self.dtype = self.result.dtype
+
+        self.buffers = []
+        self.steps = []
+        slots = [None] * len(steps)
+        free = []
+        for i, (ufunc, inputs) in enumerate(steps):
+            for isLeaf, index in inputs:
+                if not isLeaf:
+                    free.append(slots[index])
+
+            if i == len(steps) - 1:
+                slot = None
+            else:
+                r = results[i]
+                matches = [s for s in free
+                           if self.buffers[s].shape == r.shape
+                           and self.buffers[s].dtype == r.dtype]
+                if matches:
+                    slot = matches[0]
+                    free.remove(slot)
+                else:
+                    slot = len(self.buffers)
+                    self.buffers.append(numerix.empty(r.shape, dtype=r.dtype))
+            slots[i] = slot
+
+            self.steps.append((ufunc, [(isLeaf, index if isLeaf else slots[index])
+                                       for isLeaf, index in inputs], slot))
+
+    def _arguments(self, inputs, leaves, values):
+        return [leaves[index] if isLeaf else values[index]
+                for isLeaf, index in inputs]
+
+    def __call__(self, leaves, result=None):
+        if result is None:
+            result = numerix.empty(self.shape, dtype=self.dtype)
+        for ufunc, inputs, slot in self.steps:
+            if slot is None:
+                out = result
+            else:
+                out = self.buffers[slot]
+            ufunc(*self._arguments(inputs, leaves, self.buffers), out=out)
+
+        return result
+
+def _fusedValue(var):
+    """Evaluate the `_OperatorVariable` `var` in one pass.
+
+    Returns `None` if `var` is not worth fusing, i.e., it is a single
+    operation on already evaluated values.
+
+        >>> from fipy import CellVariable, Grid1D, numerix
+        >>> m = Grid1D(nx=4)
+        >>> a = CellVariable(mesh=m, value=(1., 2., 4., 8.))
+        >>> b = CellVariable(mesh=m, value=2.)
+        >>> c = CellVariable(mesh=m, value=(4, 3, 2, 1))
+        >>> expr = (a * b + c) / (-a) - 1
+        >>> print _fusedValue(expr)
+        [-7.    -4.5   -3.5   -3.125]
+        >>> print numerix.allclose(_fusedValue(expr), expr._calcValue_())
+        True
+
+    The plan is reused, including its buffers, but not the result
+
+        >>> plans = len(_plans)
+        >>> first = _fusedValue(expr)
+        >>> a.value = 2.
+        >>> print _fusedValue(expr)
+        [-5.  -4.5 -4.  -3.5]
+        >>> print first
+        [-7.    -4.5   -3.5   -3.125]
+        >>> len(_plans) == plans
+        True
+
+    An identical expression of other variables shares the plan
+
+        >>> expr2 = (b * a + c) / (-b) - 1
+        >>> print numerix.allclose(_fusedValue(expr2), expr2._calcValue_())
+        True
+        >>> len(_plans) == plans
+        True
+
+    Integer arithmetic, comparisons and ufuncs keep their types
+
+        >>> i = CellVariable(mesh=m, value=(1, 2, 3, 4))
+        >>> print _fusedValue(i * 3 - i / 2)
+        [ 3  5  8 10]
+        >>> print _fusedValue(numerix.sin(a) * a > 2 * i)
+        [False False False False]
+        >>> print _fusedValue(numerix.exp(i * 1.5) ** 0.5 >= numerix.exp(i))
+        [False False False False]
+
+    Intermediate `Variable` objects that are cached, or cannot be fused,
+    are evaluated separately
+
+        >>> d = a * b
+        >>> d.cacheMe()
+        >>> print _fusedValue(d * c + a)
+        [ 18.  14.  10.   6.]
+        >>> print _fusedValue(a * (a * b).dot(c) + 1)
+        [ 33.  25.  17.   9.]
+
+    and the fused `Variable` objects are refreshed
+
+        >>> e = a * b
+        >>> f = e + c
+        >>> print _fusedValue(f)
+        [ 8.  7.  6.  5.]
+        >>> e.stale
+        0
+        >>> a.value = 1.
+        >>> e.stale
+        1
+    """
+    if _ufuncOf(var) is None:
+        return None
+
+    steps = []
+    leaves = []
+    fused = []
+
+    def _visit(v, isRoot=False):
+        ufuncAndSwap = _ufuncOf(v)
+        if ufuncAndSwap is None or (not isRoot and v._isCached()):
+            leaves.append(v.value)
+            return (True, len(leaves) - 1)
+        else:
+            ufunc, swap = ufuncAndSwap
+            inputs = [_visit(child) for child in v.var]
+            if swap:
+                inputs.reverse()
+            steps.append((ufunc, inputs))
+            fused.append(v)
+            return (False, len(steps) - 1)
+
+    _visit(var, isRoot=True)
+
+    if len(steps) < 2:
+        return None
+
+    leaves = _plainArrays(leaves)
+    if leaves is None:
+        return None
+
+    key = (tuple([(ufunc, tuple(inputs)) for ufunc, inputs in steps]),
+           tuple([_signature(leaf) for leaf in leaves]))
+
+    plan = _plans.get(key, None)
+    if plan is None:
+        if len(_plans) >= _maxPlans:
+            _plans.clear()
+        plan = _FusedPlan(steps, leaves)
+        _plans[key] = plan
+        value = plan.result
+        del plan.result
+    else:
+        value = plan(leaves, result=var._evaluationBuffer(key))
+    var._ownValue(value, key)
+
+    for v in fused[:-1]:
+        # as if evaluated, without leaving an old value behind
+        v._value = None
+        v._markFresh()
+
+    return value
+
+def _inPlaceValue(var):
+    """Evaluate the `_OperatorVariable` `var`, a single ufunc, into the
+    array it was last evaluated into, if it owns one for inputs of the
+    same types and shapes (see `Variable._evaluationBuffer()`).
+
+    Returns `None` if `var` is not a single ufunc of plain arrays.
+
+        >>> from fipy import CellVariable, Grid1D
+        >>> m = Grid1D(nx=3)
+        >>> a = CellVariable(mesh=m, value=(1., 2., 3.))
+        >>> b = a + 1
+        >>> b.cacheMe()
+        >>> first = b.value
+        >>> a.value = 0.
+        >>> print b.value.base is first.base
+        True
+        >>> print first
+        [ 1.  1.  1.]
+        >>> a.value = (1, 2, 3)
+        >>> print b.value.base is first.base
+        True
+        >>> print b
+        [ 2.  3.  4.]
+    """
+    ufuncAndSwap = _ufuncOf(var)
+    if ufuncAndSwap is None:
+        return None
+
+    from fipy.variables.variable import Variable
+    inputs = _plainArrays([v.value if isinstance(v, Variable) else v
+                           for v in var.var])
+    if inputs is None:
+        return None
+
+    ufunc, swap = ufuncAndSwap
+    if swap:
+        inputs.reverse()
+
+    key = (ufunc,) + tuple([_signature(value) for value in inputs])
+    buffer = var._evaluationBuffer(key)
+    if buffer is not None:
+        return ufunc(*inputs, out=buffer)
+
+    return var._ownValue(numerix.asarray(ufunc(*inputs)), key)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
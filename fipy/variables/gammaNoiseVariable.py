@@ -1,6 +1,5 @@
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GammaNoiseVariable"]
@@ -87,9 +86,9 @@ class GammaNoiseVariable(NoiseVariable):
         self.shapeParam = self._requires(shape)
         self.rate = self._requires(rate)
 
-    def random(self):
-        return random.gamma(shape=self.shapeParam, scale=self.rate,
-                            size=[self.mesh.globalNumberOfCells])
+    def random(self, generator):
+        return generator.gamma(shape=self._localValue(self.shapeParam),
+                               scale=self._localValue(self.rate))
 
 def _test():
     import fipy.tests.doctestPlus
@@ -110,21 +110,43 @@ class _MeshVariable(Variable):
             value = value.value
         return value
 
-    def _getGlobalValue(self, localIDs, globalIDs):
+    def _getGlobalValue(self, layout, root=None):
         localValue = self.value
         if self.mesh.communicator.Nproc > 1:
-            if localValue.shape[-1] != 0:
-                localValue = localValue[..., localIDs]
-            globalIDs = numerix.concatenate(self.mesh.communicator.allgather(globalIDs))
-
-            globalValue = numerix.empty(localValue.shape[:-1] + (max(globalIDs) + 1,),
-                                        dtype=numerix.obj2sctype(localValue))
-            globalValue[..., globalIDs] = numerix.concatenate(self.mesh.communicator.allgather(localValue), axis=-1)
-
-            return globalValue
+            return layout.gather(localValue, root=root)
         else:
             return localValue
 
+    @property
+    def _globalLayout(self):
+        raise NotImplementedError
+
+    @property
+    def globalValue(self):
+        """Concatenate and return values from all processors
+
+        When running on a single processor, the result is identical to
+        :attr:`~fipy.variables.variable.Variable.value`.
+        """
+        return self._getGlobalValue(self._globalLayout)
+
+    def gatherToRoot(self, root=0):
+        """Concatenate the values from all processors on processor `root`
+        only, e.g., to write them out.
+
+        Returns `None` on every other processor. When running on a single
+        processor, the result is identical to
+        :attr:`~fipy.variables.variable.Variable.value`.
+
+            >>> from fipy import CellVariable, Grid1D
+            >>> var = CellVariable(mesh=Grid1D(nx=3), value=(1., 2., 3.))
+            >>> print var.gatherToRoot() # doctest: +PROCESSOR_0
+            [ 1.  2.  3.]
+            >>> print var.gatherToRoot() # doctest: +PROCESSOR_NOT_0
+            None
+        """
+        return self._getGlobalValue(self._globalLayout, root=root)
+
     def __str__(self):
         return str(self.globalValue)
 
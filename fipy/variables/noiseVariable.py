@@ -1,5 +1,6 @@
 __docformat__ = 'restructuredtext'
 
+from fipy.tools import numerix
 from fipy.variables.cellVariable import CellVariable
 
 __all__ = ["NoiseVariable"]
@@ -14,15 +15,42 @@ class NoiseVariable(CellVariable):
 
         <Specific>NoiseVariable(...).faceGrad.divergence
 
+    The random values are drawn independently for each cell from a
+    counter-based generator, keyed by the cell's global ID and by the
+    number of times the noise has been refreshed. Each process draws
+    the values for its own cells, and the noise is the same whatever
+    the number of processes.
+
     The `seed()` and `get_seed()` functions of the
     `fipy.tools.numerix.random` module can be set and query the random
-    number generated used by all `NoiseVariable` objects.
+    number generated used to choose the key of each `NoiseVariable`
+    when it is created.
+
+    >>> from fipy import Grid1D, UniformNoiseVariable, numerix
+    >>> mesh = Grid1D(nx=5)
+    >>> numerix.random.seed(2)
+    >>> first = UniformNoiseVariable(mesh=mesh)
+    >>> numerix.random.seed(2)
+    >>> second = UniformNoiseVariable(mesh=mesh)
+    >>> print numerix.allequal(first, second)
+    True
+    >>> second.scramble()
+    >>> print (first.value != second.value).all()
+    True
     """
     def __init__(self, mesh, name = '', hasOld = 0):
         if self.__class__ is NoiseVariable:
             raise NotImplementedError, "can't instantiate abstract base class"
 
         CellVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+
+        if mesh.communicator.procID == 0:
+            key = tuple(numerix.random.randint(0, 2**31, size=2))
+        else:
+            key = None
+        self._key = mesh.communicator.bcast(key, root=0)
+        self._refreshes = 0
+
         self.scramble()
 
     def copy(self):
@@ -40,24 +68,35 @@ class NoiseVariable(CellVariable):
         """
         self._markStale()
 
-    def random(self):
-        pass
-
-    def parallelRandom(self):
+    def random(self, generator):
+        """
+        Return the noise for the cells of this process, drawn from
+        `generator`, a
+        :class:`~fipy.tools.counterRandom._CounterRandom` for their global IDs.
+        """
+        raise NotImplementedError
 
-        if self.mesh.communicator.procID == 0:
-            return self.random()
+    @staticmethod
+    def _localValue(parameter):
+        # the value of a parameter on the cells of this process
+        if hasattr(parameter, 'value'):
+            return parameter.value
         else:
-            return None
+            return parameter
 
     def _calcValue(self):
-        from fipy.tools import parallelComm
+        from fipy.tools.counterRandom import _CounterRandom
 
-        rnd = self.parallelRandom()
+        self._refreshes += 1
+        generator = _CounterRandom(key=self._key,
+                                   counter=self._refreshes,
+                                   ids=self.mesh._globalOverlappingCellIDs)
 
-        if parallelComm.Nproc > 1:
-            rnd = parallelComm.bcast(rnd, root=0)
+        return self.random(generator)
 
-            return rnd[self.mesh._globalOverlappingCellIDs]
-        else:
-            return rnd
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -45,10 +45,17 @@ def _OperatorVariableClass(baseClass=object):
                 return self._calcValue_()
             else:
                 from fipy.tools import inline
-                if inline.doInline:
-                    return self._execInline(comment=self.comment)
-                else:
-                    return self._calcValue_()
+                from fipy.variables import fusedEvaluator
+                if inline.doFuse:
+                    value = fusedEvaluator._fusedValue(self)
+                    if value is not None:
+                        return value
+                if self._isCached():
+                    # evaluated into the array of its last value, if it can be
+                    value = fusedEvaluator._inPlaceValue(self)
+                    if value is not None:
+                        return value
+                return self._calcValue_()
 
         def _calcValue_(self):
             pass
@@ -1,14 +1,61 @@
 __docformat__ = 'restructuredtext'
 
 import os
+import weakref
 
 from fipy.tools.dimensions import physicalField
 from fipy.tools import numerix
 from fipy.tools import parser
 from fipy.tools import inline
+from fipy.tools.performance import instrumentation
 
 __all__ = ["Variable"]
 
+def _subscriberPruner(subscribee):
+    """Return the callback that removes the weak reference to a
+    subscriber of `subscribee` once the subscriber has been collected.
+    """
+    subscribee = weakref.ref(subscribee)
+    def _prune(subscriber):
+        var = subscribee()
+        if var is not None:
+            # a dead reference only compares equal to itself
+            try:
+                var._subscribedVariables.remove(subscriber)
+            except ValueError:
+                pass
+    return _prune
+
+def _constraintState(item):
+    """Record the value or mask `item` of a constraint as it is applied.
+
+    A `Variable` marks the `Variable` it constrains stale when it changes,
+    but an array or list can be changed in place without anyone knowing,
+    so its contents are kept to compare against.
+    """
+    if isinstance(item, numerix.ndarray):
+        return (item, item.copy())
+    elif isinstance(item, list):
+        return (item, numerix.array(item))
+    else:
+        return (item, None)
+
+def _sameConstraints(constrainedBy, constraints):
+    """Whether `constraints`, with their values and masks, are the ones
+    that were last applied, as recorded in `constrainedBy`.
+    """
+    if constrainedBy is None or len(constrainedBy) != len(constraints):
+        return False
+    for (constraint, states), current in zip(constrainedBy, constraints):
+        if constraint is not current:
+            return False
+        for (item, contents), currentItem in zip(states, (current.value, current.where)):
+            if (item is not currentItem
+                or (contents is not None
+                    and not numerix.array_equal(contents, currentItem))):
+                return False
+    return True
+
 class Variable(object):
     """
     Lazily evaluated quantity with units.
@@ -67,6 +114,7 @@ class Variable(object):
 
         self.requiredVariables = []
         self.subscribedVariables = []
+        self._pruneSubscriber = _subscriberPruner(self)
 
         if isinstance(value, Variable):
             value = value.value
@@ -474,33 +522,120 @@ class Variable(object):
 
         """
 
+        constraints = self.constraints
         if self.stale or not self._isCached() or self._value is None:
-            value = self._calcValue()
+            if instrumentation._report is None:
+                value = self._calcValue()
+            else:
+                start = instrumentation._startRecalculation()
+                try:
+                    value = self._calcValue()
+                finally:
+                    instrumentation._finishRecalculation(start, self)
             if self._isCached():
                 self._setValueInternal(value=value)
             else:
                 self._setValueInternal(value=None)
-            self._markFresh()
+            if len(constraints) > 0:
+                # before `_markFresh()`, as constraint values and masks that
+                # are recalculated when read mark `self` stale again
+                value = self._constrainValue(value, constraints)
+            if self.stale or self._isCached():
+                self._markFresh()
+            # else nothing that `self` is calculated from has changed, and
+            # its subscribers must not be told otherwise just because it
+            # was not cached
+        elif len(constraints) > 0:
+            if _sameConstraints(self._constrainedBy, constraints):
+                return self._constrainedValue
+            value = self._constrainValue(self._value, constraints)
         else:
-            value = self._value
+            return self._lend(self._value)
 
-        if len(self.constraints) > 0:
-            value = value.copy()
-            for constraint in self.constraints:
-                if constraint.where is None:
-                    value[:] = constraint.value
-                else:
-                    mask = constraint.where
-                    if not hasattr(mask, 'dtype') or mask.dtype != bool:
-                        mask = numerix.array(mask, dtype=numerix.NUMERIX.bool)
+        if len(constraints) > 0 and self._isCached():
+            self._constrainedValue = value
+            self._constrainedBy = [(constraint,
+                                    (_constraintState(constraint.value),
+                                     _constraintState(constraint.where)))
+                                   for constraint in constraints]
 
-                    if 0 not in value.shape:
-                        try:
-                            value[..., mask] = constraint.value
-                        except:
-                            value[..., mask] = numerix.array(constraint.value)[..., mask]
+        return self._lend(value)
 
-        return value
+    def _constrainValue(self, value, constraints):
+        """
+        Return `value` with `constraints` applied.
+
+        A cached `Variable` applies its constraints once each time it
+        changes and then hands out the same constrained array until it
+        changes again or its constraints are replaced
+
+            >>> v = Variable((0., 1., 2., 3.))
+            >>> v.constrain(5., numerix.array((False, True, False, False)))
+            >>> v.value is v.value
+            True
+            >>> first = v.value
+            >>> v[:] = 10.
+            >>> print v
+            [ 10.   5.  10.  10.]
+            >>> print first
+            [ 0.  5.  2.  3.]
+            >>> c = Variable(value=7.)
+            >>> v.constrain(c, numerix.array((False, False, True, False)))
+            >>> print v
+            [ 10.   5.   7.  10.]
+            >>> c.value = 8.
+            >>> print v
+            [ 10.   5.   8.  10.]
+            >>> v.constraints[1].where = numerix.array((True, False, False, False))
+            >>> print v
+            [  8.   5.  10.  10.]
+
+        A mask that is a `Variable` is followed like the constraint
+        value
+
+            >>> mask = Variable(value=(False, False, False, True))
+            >>> v.constrain(9., mask)
+            >>> print v
+            [  8.   5.  10.   9.]
+            >>> mask[:] = (False, False, True, False)
+            >>> print v
+            [  8.   5.   9.  10.]
+
+        and so is a mask or value that is an ordinary array changed in place
+
+            >>> where = numerix.array((False, True, False, False))
+            >>> values = numerix.array((1., 2., 3., 4.))
+            >>> v.constrain(values, where)
+            >>> print v
+            [  8.   2.   9.  10.]
+            >>> where[:] = (False, False, False, True)
+            >>> values[3] = 6.
+            >>> print v
+            [ 8.  5.  9.  6.]
+
+        The constrained array of each change is a new one, so an array
+        handed out earlier is never overwritten
+
+            >>> print first
+            [ 0.  5.  2.  3.]
+        """
+        constrained = value.copy()
+
+        for constraint in constraints:
+            if constraint.where is None:
+                constrained[:] = constraint.value
+            else:
+                mask = constraint.where
+                if not hasattr(mask, 'dtype') or mask.dtype != bool:
+                    mask = numerix.array(mask, dtype=numerix.NUMERIX.bool)
+
+                if 0 not in constrained.shape:
+                    try:
+                        constrained[..., mask] = constraint.value
+                    except:
+                        constrained[..., mask] = numerix.array(constraint.value)[..., mask]
+
+        return constrained
 
     def _setValueProperty(self, newVal):
         """Since `self.setValue` contains optional, named parameters, we will
@@ -566,6 +701,8 @@ class Variable(object):
             self._constraints = []
         self._constraints.append(value)
         self._requires(value.value)
+        if isinstance(value.where, Variable):
+            self._requires(value.where)
         self._markStale()
 
     def release(self, constraint):
@@ -592,6 +729,9 @@ class Variable(object):
 
     def cacheMe(self, recursive=False):
         self._cached = True
+        if self._collapsedSources is not None:
+            # a cached value must know when it is stale
+            self._expandCollapsed()
         if recursive:
             for var in self.requiredVariables:
                 var.cacheMe(recursive=True)
@@ -602,6 +742,75 @@ class Variable(object):
             for var in self.requiredVariables:
                 var.dontCacheMe(recursive=False)
 
+    def _evaluationBuffer(self, key):
+        """
+        Return the array that `self` last evaluated into, for the next
+        evaluation to overwrite, or `None`.
+
+        `self` owns that array for as long as it remains its value. It only
+        lends it out read-only, and a `Variable` given it as a value takes
+        a copy, so the array can be overwritten without changing anything
+        but the value of `self`. `key` describes the inputs that the array
+        was evaluated from, e.g., their shapes and types, and must be the
+        same for it to be reused.
+
+            >>> a = Variable(value=(1., 2.))
+            >>> b = a * 2
+            >>> b.cacheMe()
+            >>> first = b.value
+            >>> buffer = b._evaluationBuffer(b._ownedKey)
+            >>> buffer is first.base
+            True
+            >>> first[0] = 5.
+            Traceback (most recent call last):
+                ...
+            ValueError: assignment destination is read-only
+            >>> c = Variable(value=b)
+            >>> a.value = (3., 4.)
+            >>> b._evaluationBuffer(b._ownedKey) is buffer
+            True
+
+        The array is overwritten, so a value read earlier changes with
+        `self`, but `c` holds its own copy
+
+            >>> print b
+            [ 6.  8.]
+            >>> print first, c
+            [ 6.  8.] [ 2.  4.]
+            >>> b._evaluationBuffer(key="other") is None
+            True
+        """
+        buffer = self.__dict__.get('_ownedValue', None)
+        if (buffer is not None
+            and buffer is self.__dict__.get('_value', None)
+            and self._ownedKey == key):
+            return buffer
+        else:
+            return None
+
+    def _ownValue(self, value, key):
+        """
+        Take ownership of `value`, an array that `self` has just evaluated
+        into from inputs described by `key`, so that its next evaluation
+        can reuse it (see `_evaluationBuffer()`). Only a cached `Variable`
+        keeps its value to reuse.
+        """
+        if self._isCached() and type(value) is numerix.ndarray:
+            if value is not self.__dict__.get('_ownedValue', None):
+                view = value.view()
+                view.flags.writeable = False
+                self._ownedValue = value
+                self._ownedView = view
+            self._ownedKey = key
+        return value
+
+    def _lend(self, value):
+        """Return `value`, read-only if it is the array that `self` owns."""
+        if value is not None and value is self.__dict__.get('_ownedValue', None):
+            return self._ownedView
+        else:
+            return value
+
     def _setValueInternal(self, value, unit=None, array=None):
         self._value = self._makeValue(value=value, unit=unit, array=array)
 
@@ -618,6 +827,10 @@ class Variable(object):
         if isinstance(value, Variable):
             value = value.value
 
+        if isinstance(value, numerix.ndarray) and not value.flags.writeable:
+            # e.g., lent by the `Variable` that evaluated into it
+            value = value.copy()
+
         PF = physicalField.PhysicalField
 
         if not isinstance(value, PF):
@@ -779,8 +992,8 @@ class Variable(object):
         raise NotImplementedError
 
     def _getSubscribedVariables(self):
-        self._subscribedVariables = [sub for sub in self._subscribedVariables if sub() is not None]
-
+        # dead references are removed by `_pruneSubscriber` as their
+        # subscribers are collected
         return self._subscribedVariables
 
     def _setSubscribedVariables(self, sVars):
@@ -790,7 +1003,9 @@ class Variable(object):
                                    _setSubscribedVariables)
 
     def __markStale(self):
-        for subscriber in self.subscribedVariables:
+        # a copy, as a subscriber collected while walking them would
+        # remove itself from the list
+        for subscriber in tuple(self._subscribedVariables):
             if subscriber() is not None:
                 ## Even though getSubscribedVariables() strips out dead
                 ## references, subscriber() might still be dead due to the
@@ -802,6 +1017,7 @@ class Variable(object):
 
     def _markFresh(self):
         self.stale = 0
+        self._constrainedBy = None
         self.__markStale()
 
     def _markStale(self):
@@ -822,11 +1038,81 @@ class Variable(object):
     def _requiredBy(self, var):
         assert isinstance(var, Variable)
 
+        if self._collapsedSources is not None:
+            # it is no longer used once
+            self._expandCollapsed()
+
         # we retain a weak reference to avoid a memory leak
         # due to circular references between the subscriber
         # and the subscribee
-        import weakref
-        self.subscribedVariables.append(weakref.ref(var))
+        self._subscribedVariables.append(weakref.ref(var, self._pruneSubscriber))
+
+    # the `Variable` objects whose subscriptions to this one were passed
+    # on to its only subscriber by `_collapseInto`, or `None`
+    _collapsedSources = None
+    _constrainedBy = None
+
+    def _collapseInto(self, subscriber):
+        """
+        Pass the subscriptions to this `Variable` on to its only
+        `subscriber`, so that the `Variable` objects it is calculated from
+        mark `subscriber` stale directly. Only a `Variable` that is
+        recalculated whenever it is read, so has no use for being stale
+        itself, may be collapsed.
+
+            >>> a = Variable(value=1.)
+            >>> b = a * 2
+            >>> c = b + 1
+            >>> c.cacheMe()
+            >>> print c
+            3.0
+            >>> b._collapseInto(c)
+            >>> [ref() is c for ref in a.subscribedVariables]
+            [True]
+            >>> a.value = 3.
+            >>> print c
+            7.0
+
+        Anything else that requires the `Variable` undoes the collapse
+
+            >>> d = b - 1
+            >>> print b._collapsedSources
+            None
+            >>> a.value = 4.
+            >>> print c, d
+            9.0 7.0
+        """
+        holders = list(self.requiredVariables)
+        for var in self.requiredVariables:
+            # those of a collapsed `Variable` were passed on to this one
+            holders += var._collapsedSources or []
+
+        sources = []
+        for holder in holders:
+            if any([source is holder for source in sources]):
+                continue
+            subscriptions = holder._subscribedVariables
+            kept = [ref for ref in subscriptions if ref() is not self]
+            if len(kept) == len(subscriptions):
+                continue
+            # not `remove()`, as live references compare their `Variable`
+            # objects by value
+            subscriptions[:] = kept
+            if not any([ref() is subscriber for ref in subscriptions]):
+                subscriptions.append(weakref.ref(subscriber, holder._pruneSubscriber))
+            sources.append(holder)
+
+        self._collapsedSources = sources
+
+    def _expandCollapsed(self):
+        """Restore the subscriptions passed on by `_collapseInto`."""
+        sources = self._collapsedSources
+        self._collapsedSources = None
+        for source in sources:
+            if not any([ref() is self for ref in source._subscribedVariables]):
+                source._subscribedVariables.append(weakref.ref(self, source._pruneSubscriber))
+        self.stale = 0
+        self._markStale()
 
     @property
     def _variableClass(self):
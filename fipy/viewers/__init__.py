@@ -17,10 +17,14 @@ except:
 from fipy.viewers.multiViewer import *
 from fipy.viewers.tsvViewer import *
 from fipy.viewers.vtkViewer import *
+from fipy.viewers.xdmfViewer import *
+from fipy.viewers.vtuViewer import *
 
 __all__.extend(multiViewer.__all__)
 __all__.extend(tsvViewer.__all__)
 __all__.extend(vtkViewer.__all__)
+__all__.extend(xdmfViewer.__all__)
+__all__.extend(vtuViewer.__all__)
 
 # what about vector variables?
 
@@ -12,6 +12,8 @@ def _suite():
         'vtkViewer.test',),
                                    docTestModuleNames = (
         'tsvViewer',
+        'xdmfViewer',
+        'vtuViewer',
         ), base = __name__)
 
 if __name__ == '__main__':
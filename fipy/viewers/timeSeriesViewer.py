@@ -0,0 +1,83 @@
+__docformat__ = 'restructuredtext'
+
+import os
+
+from fipy.viewers.viewer import AbstractViewer
+
+__all__ = []
+
+class _TimeSeriesViewer(AbstractViewer):
+    """
+    Base class for viewers that record each call to `plot()` as a snapshot
+    of a time series on disk, with an XML index, named by `filename`,
+    that lists the snapshots and a directory next to it that holds their
+    data.
+
+    The index is written once, ending with the closing tags in `_tail`,
+    and processor 0 appends each snapshot by overwriting those tags, so
+    the index is never read back or rewritten as it grows.
+    """
+
+    _tail = ""
+
+    def __init__(self, vars, filename, title=None, limits={}, **kwlimits):
+        """
+        Creates the data directory.
+
+        :Parameters:
+          vars
+            a `CellVariable`, a `FaceVariable`, or a tuple of them to
+            record
+          filename
+            the name of the index; the data are kept in a directory next
+            to it, named after it
+          title
+            the name of the time series
+          limits : dict
+            a (deprecated) alternative to limit keyword arguments
+        """
+        kwlimits.update(limits)
+        AbstractViewer.__init__(self, vars=vars, title=title, **kwlimits)
+
+        self.mesh = self.vars[0].mesh
+        for var in self.vars:
+            assert self.mesh is var.mesh
+
+        self.communicator = self.mesh.communicator
+        self.filename = filename
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        self.dataDirectory = stem + "_data"
+        self.directory = os.path.join(os.path.dirname(filename), self.dataDirectory)
+
+        if self.communicator.procID == 0 and not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        self.communicator.Barrier()
+
+        self.snapshots = 0
+
+    def _name(self, index):
+        return self.vars[index].name or "var%d" % index
+
+    def _startIndex(self, head):
+        """Write the index, with the opening tags in `head`."""
+        if self.communicator.procID == 0:
+            f = open(self.filename, "w")
+            f.write(head)
+            f.write(self._tail)
+            f.close()
+
+    def _appendToIndex(self, snapshot):
+        """Add the XML `snapshot` to the index, once every processor has
+        written its data.
+        """
+        self.communicator.Barrier()
+
+        if self.communicator.procID == 0:
+            # replace the closing tags with the new snapshot
+            f = open(self.filename, "r+")
+            f.seek(-len(self._tail), os.SEEK_END)
+            f.write(snapshot)
+            f.write(self._tail)
+            f.close()
+
+        self.snapshots += 1
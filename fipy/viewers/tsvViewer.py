@@ -14,6 +14,7 @@ class TSVViewer(AbstractViewer):
     "Views" one or more variables in tab-separated-value format.
 
     Output is a list of coordinates and variable values at each cell center.
+    A file whose name ends in ".gz" is compressed.
 
     File contents will be, e.g.::
 
@@ -42,8 +43,8 @@ class TSVViewer(AbstractViewer):
 
         :Parameters:
           vars
-            a `CellVariable`, a `FaceVariable`, a tuple of `CellVariable`
-            objects, or a tuple of `FaceVariable` objects to plot
+            a `CellVariable`, a `FaceVariable`, or a tuple of them to plot;
+            the rows of the cells come before those of the faces
           title
             displayed at the top of the `Viewer` window
           limits : dict
@@ -61,38 +62,73 @@ class TSVViewer(AbstractViewer):
             assert mesh is var.mesh
 
 
-    def _plot(self, values, f, dim):
-        for index in range(values.shape[-1]):
-            lineValues = values[...,index]
+    _rowsPerChunk = 10000
 
-            # omit any elements whose cell centers lie outside of the specified limits
-            skip = False
-            for axis in range(dim):
-                mini = self._getLimit("%smin" % self._axis[axis])
-                maxi = self._getLimit("%smax" % self._axis[axis])
+    def _rows(self, values, dim):
+        """The columns of `values` as rows, omitting any elements whose
+        centers lie outside of the specified limits and replacing any values
+        that lie outside of the specified datalimits with `nan`.
+        """
+        values = numerix.array(values, dtype=float)
 
-                if (mini and lineValues[axis] < mini) or (maxi and lineValues[axis] > maxi):
-                    skip = True
-                    break
+        inside = numerix.ones(values.shape[-1], dtype=bool)
+        for axis in range(dim):
+            mini = self._getLimit("%smin" % self._axis[axis])
+            maxi = self._getLimit("%smax" % self._axis[axis])
 
-            if skip:
-                continue
+            if mini:
+                inside &= ~(values[axis] < mini)
+            if maxi:
+                inside &= ~(values[axis] > maxi)
 
-            # replace any values that lie outside of the specified datalimits with 'nan'
-            for valIndex in range(dim, len(lineValues)):
-                mini = self._getLimit("datamin")
-                maxi = self._getLimit("datamax")
+        values = values[..., inside]
 
-                if (mini and lineValues[valIndex] < mini) or (maxi and lineValues[valIndex] > maxi):
-                    lineValues[valIndex] = float("NaN")
-                    break
+        data = values[dim:]
+        mini = self._getLimit("datamin")
+        maxi = self._getLimit("datamax")
+        if mini:
+            data[data < mini] = numerix.nan
+        if maxi:
+            data[data > maxi] = numerix.nan
 
-            line = ["%.15g" % value for value in lineValues]
-            f.write("\t".join(line))
-            f.write("\n")
+        return values.swapaxes(0, 1)
 
-    def plot(self, filename=None):
+    def _text(self, rows):
+        """Format `rows` in chunks, with a single string operation for each
+        chunk, rather than one for each value.
         """
+        if len(rows) > 0:
+            line = "\t".join(["%.15g"] * rows.shape[-1]) + "\n"
+            for start in range(0, len(rows), self._rowsPerChunk):
+                chunk = rows[start:start + self._rowsPerChunk]
+                yield (line * len(chunk)) % tuple(chunk.flat)
+
+    def _columns(self, centers, Var, valueOf):
+        values = numerix.array(valueOf(centers))
+        for var in self.vars:
+            if not isinstance(var, Var):
+                # a variable of the other table has no values here
+                columns = numerix.empty(((1, len(values))[var.rank == 1], values.shape[-1]))
+                columns[:] = numerix.nan
+            elif var.rank == 1:
+                columns = numerix.array(valueOf(var))
+            else:
+                columns = (numerix.array(valueOf(var)),)
+            values = numerix.concatenate((values, columns))
+
+        return values
+
+    def _tables(self, valueOf):
+        mesh = self.vars[0].mesh
+
+        if len([var for var in self.vars if isinstance(var, CellVariable)]) > 0:
+            yield self._columns(mesh.cellCenters, CellVariable, valueOf)
+
+        if len([var for var in self.vars if isinstance(var, FaceVariable)]) > 0:
+            yield self._columns(mesh.faceCenters, FaceVariable, valueOf)
+
+    def plot(self, filename=None):
+        r"""
         "plot" the coordinates and values of the variables to `filename`.
         If `filename` is not provided, "plots" to stdout.
 
@@ -116,6 +152,52 @@ class TSVViewer(AbstractViewer):
         0.05    0.45    -2      35      -3.33333333333333
         0.15    0.45    5       35      5
 
+        Cells outside of the limits are omitted and values outside of the
+        datalimits are replaced with `nan`
+
+        >>> TSVViewer(vars = (v, v.grad), xmin=0.1, datamax=9.).plot() #doctest: +NORMALIZE_WHITESPACE
+        x       y       var     var_gauss_grad_x        var_gauss_grad_y
+        0.15    0.15    2       nan     5
+        0.15    0.45    5       nan     5
+
+        When writing to a file, each processor formats and writes the rows
+        of its own cells, in turn, rather than gathering the values onto
+        one processor, and then those of its own faces. A `filename`
+        ending in ".gz" is compressed, with each processor's rows of each
+        table in a separate gzip member
+
+        >>> import gzip, os, tempfile
+        >>> m = Grid1D(nx = 1000)
+        >>> v = CellVariable(mesh = m, name = "var", value = m.x**2)
+        >>> (f, filename) = tempfile.mkstemp(".tsv.gz")
+        >>> os.close(f)
+        >>> TSVViewer(vars = v, title = "squares").plot(filename)
+        >>> f = gzip.open(filename)
+        >>> lines = f.readlines()
+        >>> f.close()
+        >>> print len(lines), lines[:3], lines[-1:]
+        1002 ['squares\n', 'x\tvar\n', '0.5\t0.25\n'] ['999.5\t999000.25\n']
+        >>> os.remove(filename)
+
+        The cells are followed by the faces, with no values in the columns
+        of the variables of the other
+
+        >>> m = Grid1D(nx = 2)
+        >>> v = CellVariable(mesh = m, name = "var", value = (1, 3))
+        >>> from fipy.variables.faceVariable import FaceVariable
+        >>> w = FaceVariable(mesh = m, name = "face", value = (1, 2, 3))
+        >>> (f, filename) = tempfile.mkstemp(".tsv")
+        >>> os.close(f)
+        >>> TSVViewer(vars = (v, w)).plot(filename)
+        >>> print open(filename).read(), #doctest: +NORMALIZE_WHITESPACE
+        x       var     face
+        0.5     1       nan
+        1.5     3       nan
+        0       nan     1
+        1       nan     2
+        2       nan     3
+        >>> os.remove(filename)
+
         :Parameters:
           filename
             If not `None`, the name of a file to save the image into.
@@ -124,22 +206,9 @@ class TSVViewer(AbstractViewer):
         mesh = self.vars[0].mesh
         dim = mesh.dim
 
-        if filename is not None:
-            import os
-            if mesh.communicator.procID == 0:
-                if os.path.splitext(filename)[1] == ".gz":
-                    import gzip
-                    f = gzip.GzipFile(filename = filename, mode = 'w', fileobj = None)
-                else:
-                    f = open(filename, "w")
-            else:
-                f = open(os.devnull, mode='w')
-        else:
-            f = sys.stdout
-
+        header = ""
         if self.title and len(self.title) > 0:
-            f.write(self.title)
-            f.write("\n")
+            header += self.title + "\n"
 
         headings = []
         for index in range(dim):
@@ -153,34 +222,61 @@ class TSVViewer(AbstractViewer):
             else:
                 headings.extend([name])
 
-        f.write("\t".join(headings))
-        f.write("\n")
+        header += "\t".join(headings) + "\n"
+
+        if filename is None:
+            sys.stdout.write(header)
+            for values in self._tables(lambda var: var.globalValue):
+                for text in self._text(self._rows(values, dim)):
+                    sys.stdout.write(text)
+        else:
+            self._write(filename, header, dim)
+
+    def _write(self, filename, header, dim):
+        import os
+
+        communicator = self.vars[0].mesh.communicator
+
+        # each table is written in turn by every processor, so that, as in
+        # serial, all of the cells come before all of the faces
+        tables = [list(self._text(self._rows(values, dim)))
+                  for values in self._tables(lambda var: var.value[..., var._localNonOverlappingIDs])]
+        if communicator.procID == 0:
+            tables[0].insert(0, header)
+
+        if communicator.procID == 0:
+            open(filename, "wb").close()
+
+        communicator.Barrier()
+
+        offset = 0
+        for text in tables:
+            text = "".join(text)
 
-        cellVars = [var for var in self.vars if isinstance(var, CellVariable)]
-        faceVars = [var for var in self.vars if isinstance(var, FaceVariable)]
+            if os.path.splitext(filename)[1] == ".gz":
+                import gzip
+                from StringIO import StringIO
 
-        if len(cellVars) > 0:
-            values = mesh.cellCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, CellVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
+                buffer = StringIO()
+                if len(text) > 0:
+                    f = gzip.GzipFile(filename=os.path.basename(filename[:-3]), mode='wb', fileobj=buffer)
+                    f.write(text)
+                    f.close()
+                text = buffer.getvalue()
 
-            self._plot(values, f, dim)
+            # each processor writes its text after that of the processors before it
+            lengths = numerix.zeros((communicator.Nproc, 1), 'l')
+            communicator.Allgather(numerix.array([len(text)], 'l'), lengths)
 
-        if len(faceVars) > 0:
-            values = mesh.faceCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, FaceVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
+            if len(text) > 0:
+                f = open(filename, "r+b")
+                f.seek(offset + int(lengths[:communicator.procID].sum()))
+                f.write(text)
+                f.close()
 
-            self._plot(values, f, dim)
+            offset += int(lengths.sum())
 
-        if f is not sys.stdout:
-            f.close()
+        communicator.Barrier()
 
 def _test():
     import fipy.tests.doctestPlus
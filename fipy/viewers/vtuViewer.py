@@ -0,0 +1,323 @@
+__docformat__ = 'restructuredtext'
+
+import os
+import sys
+from xml.sax.saxutils import quoteattr
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+from fipy.viewers.timeSeriesViewer import _TimeSeriesViewer
+from fipy.variables.cellVariable import CellVariable
+from fipy.variables.faceVariable import FaceVariable
+
+__all__ = ["VTUViewer"]
+
+_BYTE_ORDER = {"little": "LittleEndian", "big": "BigEndian"}[sys.byteorder]
+
+# the VTK cell type of a single point
+_VTK_VERTEX = 1
+
+class VTUViewer(_TimeSeriesViewer):
+    """
+    "Views" one or more variables as a time series of :term:`VTK` XML
+    unstructured grids, with a ``.pvd`` collection that
+    :term:`ParaView` and :term:`VisIt` can read.
+
+    Unlike the :class:`~fipy.viewers.vtkViewer.VTKViewer`, it needs nothing
+    but :term:`NumPy`, so it can be used where no graphical libraries are
+    installed. The points and cells of the mesh are encoded once, and each
+    call to `plot()` only encodes the values of the variables, which are
+    appended in raw binary after the encoded mesh.
+
+    Each processor writes a ``.vtu`` piece with the cells (and faces) that
+    it owns; in parallel, processor 0 also writes the ``.pvtu`` file that
+    assembles the pieces of each snapshot.
+
+        >>> import os, shutil, tempfile
+        >>> from fipy import Grid2D, CellVariable
+        >>> directory = tempfile.mkdtemp()
+        >>> mesh = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=mesh, name="phi", value=0.)
+        >>> viewer = VTUViewer(vars=(phi, phi.grad, phi.faceValue),
+        ...                    filename=os.path.join(directory, "run.pvd"))
+        >>> for step in range(3):
+        ...     phi.setValue(mesh.x * step)
+        ...     viewer.plot(time=step * 0.5)
+
+    The snapshots are listed in the collection, with the cells and the faces
+    as separate parts
+
+        >>> from xml.etree import ElementTree
+        >>> steps = ElementTree.parse(os.path.join(directory, "run.pvd")).findall("Collection/DataSet")
+        >>> print [(step.get("timestep"), step.get("part")) for step in steps]
+        [('0', '0'), ('0', '1'), ('0.5', '0'), ('0.5', '1'), ('1', '0'), ('1', '1')]
+        >>> print steps[4].get("file") # doctest: +SERIAL
+        run_data/cells_2.vtu
+
+    The XML of a piece is followed by the appended data, each array of which
+    starts with its length in bytes
+
+        >>> text = open(os.path.join(directory, steps[4].get("file")), "rb").read()
+        >>> start = text.index('<AppendedData encoding="raw">')
+        >>> appended = text[text.index("_", start) + 1:]
+        >>> piece = ElementTree.fromstring(text[:start] + "</VTKFile>").find("UnstructuredGrid/Piece")
+        >>> print piece.get("NumberOfPoints"), piece.get("NumberOfCells") # doctest: +SERIAL
+        12 6
+        >>> item = piece.find("CellData/DataArray[@Name='phi']")
+        >>> print item.get("type")
+        Float64
+        >>> offset = int(item.get("offset"))
+        >>> length = numerix.frombuffer(appended, dtype=numerix.uint64, count=1, offset=offset)[0]
+        >>> print numerix.frombuffer(appended, dtype=float, count=int(length) / 8,
+        ...                          offset=offset + 8) # doctest: +SERIAL
+        [ 1.  3.  5.  1.  3.  5.]
+
+        >>> shutil.rmtree(directory)
+
+    .. note::
+
+       All of the variables must have the same mesh. The limits are not
+       used. All processors must call `plot()`.
+    """
+
+    _tail = """  </Collection>
+</VTKFile>
+"""
+
+    def __init__(self, vars, filename, title=None, limits={}, **kwlimits):
+        """
+        Creates a `VTUViewer`, encoding the mesh.
+
+        :Parameters:
+          vars
+            a `CellVariable`, a `FaceVariable`, or a tuple of them to
+            record
+          filename
+            the name of the ``.pvd`` collection; the snapshots are kept in
+            a directory next to it, named after it
+          title
+            not used
+          limits : dict
+            a (deprecated) alternative to limit keyword arguments
+        """
+        _TimeSeriesViewer.__init__(self, vars=vars, filename=filename,
+                                   title=title, limits=limits, **kwlimits)
+
+        self.pieces = []
+        for name, Var, ids, elements, data in (("cells", CellVariable,
+                                               self.mesh._localNonOverlappingCellIDs,
+                                               self._cells, "CellData"),
+                                              ("faces", FaceVariable,
+                                               self.mesh._localNonOverlappingFaceIDs,
+                                               self._faces, "PointData")):
+            vars = [(i, var) for i, var in enumerate(self.vars) if isinstance(var, Var)]
+            if len(vars) == 0:
+                continue
+
+            points, connectivity, offsets, types = elements(ids)
+
+            mesh, appended = self._dataArrays((("Points", (), points),
+                                               ("Cells", (("Name", "connectivity"),), connectivity),
+                                               ("Cells", (("Name", "offsets"),), offsets),
+                                               ("Cells", (("Name", "types"),), types)))
+
+            self.pieces.append(dict(name=name,
+                                    ids=ids,
+                                    vars=vars,
+                                    data=data,
+                                    numberOfPoints=len(points),
+                                    numberOfCells=len(types),
+                                    mesh=mesh,
+                                    appended=appended))
+
+        self._startIndex('<?xml version="1.0"?>\n'
+                         '<VTKFile type="Collection" version="0.1" byte_order="%s">\n'
+                         '  <Collection>\n' % _BYTE_ORDER)
+
+    def _cells(self, ids):
+        """Return the points, connectivity, offsets, and types of the cells
+        `ids`.
+        """
+        mesh = self.mesh
+        vertexIDs = MA.masked_array(mesh._orderedCellVertexIDs)[..., ids].swapaxes(0, 1)
+
+        return (self._points(numerix.array(mesh.vertexCoords)),
+                MA.compressed(vertexIDs),
+                numerix.cumsum(vertexIDs.count(axis=1)),
+                numerix.zeros((len(ids),), 'B') + mesh._VTKCellType)
+
+    def _faces(self, ids):
+        """Return the points, connectivity, offsets, and types of a vertex at
+        the center of each of the faces `ids`.
+        """
+        n = len(ids)
+        return (self._points(numerix.array(self.mesh.faceCenters)[..., ids]),
+                numerix.arange(n),
+                numerix.arange(1, n + 1),
+                numerix.zeros((n,), 'B') + _VTK_VERTEX)
+
+    def _points(self, coordinates):
+        return numerix.concatenate((coordinates,
+                                    numerix.zeros((3 - coordinates.shape[0],)
+                                                  + coordinates.shape[1:]))).swapaxes(0, 1)
+
+    @staticmethod
+    def _dataArrays(arrays, offset=0):
+        """Return the XML elements describing `arrays`, given as the name of
+        their parent element, their attributes, and their values, and the
+        binary data to append for them, starting `offset` bytes into the
+        appended data.
+        """
+        elements = []
+        appended = []
+        for parent, attributes, value in arrays:
+            value = numerix.ascontiguousarray(value)
+            if value.dtype.kind == "f":
+                value = value.astype(numerix.float64)
+                type = "Float64"
+            elif value.dtype == numerix.uint8:
+                type = "UInt8"
+            else:
+                value = value.astype(numerix.int64)
+                type = "Int64"
+
+            if value.ndim > 1:
+                attributes = attributes + (("NumberOfComponents", value.shape[-1]),)
+
+            data = value.tostring()
+            elements.append((parent,
+                             '<DataArray type="%s" %sformat="appended" offset="%d"/>'
+                             % (type,
+                                "".join(['%s=%s ' % (key, quoteattr(str(attribute)))
+                                         for key, attribute in attributes]),
+                                offset)))
+            appended.append(numerix.array([len(data)], dtype=numerix.uint64).tostring())
+            appended.append(data)
+            offset += 8 + len(data)
+
+        return elements, "".join(appended)
+
+    @staticmethod
+    def _components(value, rank):
+        if rank == 1:
+            # vectors are always given in three dimensions
+            value = numerix.concatenate((value,
+                                         numerix.zeros((3 - value.shape[0],) + value.shape[1:])))
+        elif rank > 1:
+            value = value.reshape((int(numerix.prod(value.shape[:-1])), value.shape[-1]))
+
+        return numerix.rollaxis(value, -1)
+
+    def _attributes(self, piece):
+        """The active scalars and vectors of the `piece`."""
+        attributes = ""
+        for attribute, rank in (("Scalars", 0), ("Vectors", 1)):
+            names = [self._name(index) for index, var in piece["vars"] if var.rank == rank]
+            if len(names) > 0:
+                attributes += " %s=%s" % (attribute, quoteattr(names[0]))
+        return attributes
+
+    def _pieceName(self, piece, snapshot, procID=None):
+        name = "%s_%d" % (piece["name"], snapshot)
+        if procID is not None:
+            name += "_%d" % procID
+        return name
+
+    def _writePiece(self, piece, filename):
+        fields, appended = self._dataArrays([(piece["data"],
+                                              (("Name", self._name(index)),),
+                                              self._components(numerix.array(var.value, dtype=float)[..., piece["ids"]],
+                                                               var.rank))
+                                             for index, var in piece["vars"]],
+                                            offset=len(piece["appended"]))
+
+        xml = ['<?xml version="1.0"?>\n',
+               '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="%s" header_type="UInt64">\n' % _BYTE_ORDER,
+               '  <UnstructuredGrid>\n',
+               '    <Piece NumberOfPoints="%d" NumberOfCells="%d">\n' % (piece["numberOfPoints"],
+                                                                        piece["numberOfCells"])]
+        for parent, attributes in (("Points", ""),
+                                   ("Cells", ""),
+                                   (piece["data"], self._attributes(piece))):
+            xml.append('      <%s%s>\n' % (parent, attributes))
+            xml.extend(['        %s\n' % element
+                        for elementParent, element in piece["mesh"] + fields
+                        if elementParent == parent])
+            xml.append('      </%s>\n' % parent)
+        xml.extend(['    </Piece>\n',
+                    '  </UnstructuredGrid>\n',
+                    '  <AppendedData encoding="raw">\n',
+                    '   _'])
+
+        f = open(filename, "wb")
+        f.write("".join(xml))
+        f.write(piece["appended"])
+        f.write(appended)
+        f.write('\n'
+                '  </AppendedData>\n'
+                '</VTKFile>\n')
+        f.close()
+
+    def _writeParallelPiece(self, piece, filename):
+        xml = ['<?xml version="1.0"?>\n',
+               '<VTKFile type="PUnstructuredGrid" version="1.0" byte_order="%s" header_type="UInt64">\n' % _BYTE_ORDER,
+               '  <PUnstructuredGrid GhostLevel="0">\n',
+               '    <PPoints>\n',
+               '      <PDataArray type="Float64" NumberOfComponents="3"/>\n',
+               '    </PPoints>\n',
+               '    <P%s%s>\n' % (piece["data"], self._attributes(piece))]
+        for index, var in piece["vars"]:
+            components = self._components(numerix.zeros(var.shape[:-1] + (0,)), var.rank).shape[1:]
+            xml.append('      <PDataArray type="Float64" Name=%s%s/>\n'
+                       % (quoteattr(self._name(index)),
+                          "".join([' NumberOfComponents="%d"' % n for n in components])))
+        xml.append('    </P%s>\n' % piece["data"])
+        for procID in range(self.communicator.Nproc):
+            xml.append('    <Piece Source="%s.vtu"/>\n' % self._pieceName(piece, self.snapshots, procID))
+        xml.extend(['  </PUnstructuredGrid>\n',
+                    '</VTKFile>\n'])
+
+        f = open(filename, "w")
+        f.write("".join(xml))
+        f.close()
+
+    def plot(self, filename=None, time=None):
+        """
+        Write a snapshot of the variables and add it to the collection.
+
+        :Parameters:
+          filename
+            ignored; the collection is written to the `filename` given when
+            the `VTUViewer` was created
+          time
+            the time of the snapshot; the number of the snapshot if `None`
+        """
+        if time is None:
+            time = self.snapshots
+
+        procID = self.communicator.procID
+        parallel = self.communicator.Nproc > 1
+
+        dataSets = []
+        for part, piece in enumerate(self.pieces):
+            if parallel:
+                self._writePiece(piece, os.path.join(self.directory,
+                                                     self._pieceName(piece, self.snapshots, procID) + ".vtu"))
+                name = self._pieceName(piece, self.snapshots) + ".pvtu"
+                if procID == 0:
+                    self._writeParallelPiece(piece, os.path.join(self.directory, name))
+            else:
+                name = self._pieceName(piece, self.snapshots) + ".vtu"
+                self._writePiece(piece, os.path.join(self.directory, name))
+
+            dataSets.append('    <DataSet timestep="%.15g" part="%d" file=%s/>\n'
+                            % (time, part, quoteattr(self.dataDirectory + "/" + name)))
+
+        self._appendToIndex("".join(dataSets))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
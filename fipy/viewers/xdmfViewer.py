@@ -0,0 +1,295 @@
+__docformat__ = 'restructuredtext'
+
+import os
+import sys
+from xml.sax.saxutils import quoteattr
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+from fipy.viewers.timeSeriesViewer import _TimeSeriesViewer
+from fipy.variables.cellVariable import CellVariable
+from fipy.variables.faceVariable import FaceVariable
+
+__all__ = ["XDMFViewer"]
+
+class XDMFViewer(_TimeSeriesViewer):
+    """
+    "Views" one or more variables as a time series, written to binary
+    files with an `XDMF <http://www.xdmf.org>`_ index that
+    :term:`ParaView` and :term:`VisIt` can read.
+
+    The mesh is written once, and each call to `plot()` appends one
+    snapshot of the variables to a binary file for each variable, so the
+    output grows by the size of the data and nothing is rewritten. Each
+    processor writes the mesh and the values of the cells (and faces) that
+    it owns, and the index describes the pieces of every processor.
+
+        >>> import os, shutil, tempfile
+        >>> from fipy import Grid2D, CellVariable
+        >>> directory = tempfile.mkdtemp()
+        >>> mesh = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=mesh, name="phi", value=0.)
+        >>> viewer = XDMFViewer(vars=(phi, phi.grad, phi.faceValue),
+        ...                     filename=os.path.join(directory, "run.xmf"))
+        >>> for step in range(3):
+        ...     phi.setValue(mesh.x * step)
+        ...     viewer.plot(time=step * 0.5)
+
+    The snapshots can be found from the index
+
+        >>> from xml.etree import ElementTree
+        >>> steps = ElementTree.parse(os.path.join(directory, "run.xmf")).findall("Domain/Grid/Grid")
+        >>> print [step.find("Time").get("Value") for step in steps]
+        ['0', '0.5', '1']
+        >>> attribute = steps[2].find("Grid/Attribute")
+        >>> print attribute.get("Name"), attribute.get("Center"), attribute.get("AttributeType")
+        phi Cell Scalar
+        >>> item = attribute.find("DataItem")
+        >>> print item.get("Dimensions"), item.get("Format")
+        6 Binary
+        >>> print numerix.memmap(os.path.join(directory, item.text.strip()),
+        ...                      dtype=float, mode="r", offset=int(item.get("Seek")), shape=(6,))
+        [ 1.  3.  5.  1.  3.  5.]
+
+        >>> shutil.rmtree(directory)
+
+    .. note::
+
+       All of the variables must have the same mesh. The limits are not
+       used. All processors must call `plot()`.
+    """
+
+    _tail = """    </Grid>
+  </Domain>
+</Xdmf>
+"""
+
+    def __init__(self, vars, filename, title=None, limits={}, **kwlimits):
+        """
+        Creates an `XDMFViewer`, writing the mesh.
+
+        :Parameters:
+          vars
+            a `CellVariable`, a `FaceVariable`, or a tuple of them to
+            record
+          filename
+            the name of the XDMF index; the binary files are kept in a
+            directory next to it, named after it
+          title
+            the name of the time series
+          limits : dict
+            a (deprecated) alternative to limit keyword arguments
+        """
+        _TimeSeriesViewer.__init__(self, vars=vars, filename=filename,
+                                   title=title, limits=limits, **kwlimits)
+
+        procID = self.communicator.procID
+        self.pieces = []
+        for center, ids, layout in (("Cell",
+                                     self.mesh._localNonOverlappingCellIDs,
+                                     self.mesh._globalCellLayout),
+                                    ("Node",
+                                     self.mesh._localNonOverlappingFaceIDs,
+                                     self.mesh._globalFaceLayout)):
+            vars = [(i, var) for i, var in enumerate(self.vars)
+                    if isinstance(var, {"Cell": CellVariable, "Node": FaceVariable}[center])]
+            if len(vars) == 0:
+                continue
+
+            if center == "Cell":
+                topology, numberOfElements, geometry = self._cellTopology(ids)
+                topologyType = ("Polyline", "Mixed", "Mixed")[self.mesh.dim - 1]
+            else:
+                geometry = numerix.array(self.mesh.faceCenters)[..., ids]
+                numberOfElements = geometry.shape[-1]
+                topology = numerix.arange(numberOfElements)
+                topologyType = "Polyvertex"
+
+            geometry = numerix.concatenate((geometry,
+                                            numerix.zeros((3 - geometry.shape[0],) + geometry.shape[1:])))
+            geometry = numerix.ascontiguousarray(geometry.swapaxes(0, 1), dtype=float)
+            topology = numerix.ascontiguousarray(topology, dtype=numerix.int64)
+
+            name = "%s.%d" % (center.lower(), procID)
+            geometry.tofile(os.path.join(self.directory, name + ".xyz"))
+            topology.tofile(os.path.join(self.directory, name + ".topology"))
+
+            sizes = numerix.zeros((self.communicator.Nproc, 3), 'l')
+            self.communicator.Allgather(numerix.array((numberOfElements, len(topology), len(geometry)), 'l'),
+                                        sizes)
+
+            self.pieces.append(dict(center=center,
+                                    ids=ids,
+                                    layout=layout,
+                                    vars=vars,
+                                    topologyType=topologyType,
+                                    sizes=sizes))
+
+        self.files = [os.path.join(self.directory, self._dataName(i)) for i in range(len(self.vars))]
+        if procID == 0:
+            for name in self.files:
+                open(name, "wb").close()
+        self.communicator.Barrier()
+
+        self.offsets = [0] * len(self.vars)
+
+        self._startIndex(self._head())
+
+    def _dataName(self, index):
+        return "var%d.bin" % index
+
+    def _cellTopology(self, ids):
+        """Return the XDMF topology of the cells `ids`, the number of cells,
+        and the coordinates of the vertices that it refers to.
+        """
+        mesh = self.mesh
+        n = len(ids)
+        if mesh.dim == 3:
+            # a polyhedron is described by each of its faces
+            faceVertexIDs = MA.masked_array(mesh.faceVertexIDs)
+            faces = MA.concatenate((faceVertexIDs.count(axis=0)[numerix.newaxis],
+                                    faceVertexIDs))
+            cellFaceIDs = MA.masked_array(mesh.cellFaceIDs)[..., ids]
+            cellFaces = MA.take(faces, MA.filled(cellFaceIDs, 0), axis=1)
+            cellFaces = MA.masked_array(MA.getdata(cellFaces),
+                                        mask=(MA.getmaskarray(cellFaces)
+                                              | MA.getmaskarray(cellFaceIDs)[numerix.newaxis]))
+            # (items, faces, cells) -> (cells, faces, items)
+            cellFaces = cellFaces.transpose(2, 1, 0)
+            vertexIDs = cellFaces[..., 1:]
+            header = numerix.array((16 * numerix.ones(n, 'l'),
+                                    cellFaceIDs.count(axis=0))).swapaxes(0, 1)
+        else:
+            vertexIDs = MA.masked_array(mesh._orderedCellVertexIDs)[..., ids].swapaxes(0, 1)
+            if mesh.dim == 2:
+                header = numerix.array((3 * numerix.ones(n, 'l'),
+                                        vertexIDs.count(axis=1))).swapaxes(0, 1)
+            else:
+                header = numerix.zeros((n, 0), 'l')
+
+        # number only the vertices of these cells
+        vertices = numerix.unique(MA.compressed(vertexIDs))
+        renumber = numerix.zeros((mesh.vertexCoords.shape[-1],), 'l')
+        renumber[vertices] = numerix.arange(len(vertices))
+        cells = MA.masked_array(renumber[MA.filled(vertexIDs, 0)],
+                                mask=MA.getmaskarray(vertexIDs))
+
+        if mesh.dim == 3:
+            cells = MA.concatenate((cellFaces[..., :1], cells), axis=2)
+            cells = cells.reshape((n, cells.shape[1] * cells.shape[2]))
+
+        topology = MA.compressed(MA.concatenate((MA.masked_array(header), cells), axis=1))
+
+        return topology, n, numerix.take(numerix.array(mesh.vertexCoords), vertices, axis=-1)
+
+    def _dataItem(self, dimensions, numberType, precision, name, seek=0, indent=""):
+        return ('%s<DataItem Dimensions="%s" NumberType="%s" Precision="%d" Format="Binary" Endian="%s" Seek="%d">\n'
+                '%s  %s/%s\n'
+                '%s</DataItem>\n') % (indent, " ".join([str(d) for d in dimensions]),
+                                      numberType, precision,
+                                      {"little": "Little", "big": "Big"}[sys.byteorder], seek,
+                                      indent, self.dataDirectory, name,
+                                      indent)
+
+    def _head(self):
+        xml = ['<?xml version="1.0" ?>\n',
+               '<Xdmf Version="3.0">\n',
+               '  <Domain>\n']
+        for piece in self.pieces:
+            center = piece["center"].lower()
+            for procID, (elements, length, vertices) in enumerate(piece["sizes"]):
+                if elements == 0:
+                    # processors without cells have nothing to show
+                    continue
+                name = "%s.%d" % (center, procID)
+                if piece["topologyType"] == "Polyline":
+                    xml.append('    <Topology Name="%s" TopologyType="Polyline" NodesPerElement="2" NumberOfElements="%d">\n'
+                               % (name, elements))
+                else:
+                    xml.append('    <Topology Name="%s" TopologyType="%s" NumberOfElements="%d">\n'
+                               % (name, piece["topologyType"], elements))
+                xml.append(self._dataItem((length,), "Int", 8, name + ".topology", indent="      "))
+                xml.append('    </Topology>\n')
+                xml.append('    <Geometry Name="%s" GeometryType="XYZ">\n' % name)
+                xml.append(self._dataItem((vertices, 3), "Float", 8, name + ".xyz", indent="      "))
+                xml.append('    </Geometry>\n')
+        xml.append('    <Grid Name=%s GridType="Collection" CollectionType="Temporal">\n'
+                   % quoteattr(self.title or "fipy"))
+        return "".join(xml)
+
+    def _snapshot(self, time, seeks):
+        xml = ['      <Grid GridType="Collection" CollectionType="Spatial">\n',
+               '        <Time Value="%.15g" />\n' % time]
+        for piece in self.pieces:
+            center = piece["center"].lower()
+            for procID in numerix.nonzero(piece["sizes"][..., 0])[0]:
+                name = "%s.%d" % (center, procID)
+                xml.append('        <Grid Name="%s" GridType="Uniform">\n' % name)
+                xml.append('          <Topology Reference="/Xdmf/Domain/Topology[@Name=\'%s\']" />\n' % name)
+                xml.append('          <Geometry Reference="/Xdmf/Domain/Geometry[@Name=\'%s\']" />\n' % name)
+                for index, var in piece["vars"]:
+                    count = piece["layout"].counts[procID]
+                    components = self._components(var)
+                    if var.rank == 0:
+                        attributeType, dimensions = "Scalar", (count,)
+                    elif var.rank == 1:
+                        attributeType, dimensions = "Vector", (count, components)
+                    else:
+                        attributeType, dimensions = "Matrix", (count, components)
+                    displacement = piece["layout"].displacements[procID] * components * 8
+                    xml.append('          <Attribute Name=%s Center="%s" AttributeType="%s">\n'
+                               % (quoteattr(self._name(index)), piece["center"], attributeType))
+                    xml.append(self._dataItem(dimensions, "Float", 8, self._dataName(index),
+                                              seek=seeks[index] + displacement, indent="            "))
+                    xml.append('          </Attribute>\n')
+                xml.append('        </Grid>\n')
+        xml.append('      </Grid>\n')
+        return "".join(xml)
+
+    @staticmethod
+    def _components(var):
+        if var.rank == 1:
+            # vectors are always given in three dimensions
+            return 3
+        else:
+            return int(numerix.prod(var.shape[:-1]))
+
+    def plot(self, filename=None, time=None):
+        """
+        Append a snapshot of the variables to the time series.
+
+        :Parameters:
+          filename
+            ignored; the series is written to the `filename` given when
+            the `XDMFViewer` was created
+          time
+            the time of the snapshot; the number of the snapshot if `None`
+        """
+        if time is None:
+            time = self.snapshots
+
+        seeks = list(self.offsets)
+        for piece in self.pieces:
+            for index, var in piece["vars"]:
+                components = self._components(var)
+                value = numerix.array(var.value, dtype=float)[..., piece["ids"]]
+                value = value.reshape((int(numerix.prod(value.shape[:-1])), value.shape[-1]))
+                rows = numerix.zeros((value.shape[-1], components))
+                rows[..., :value.shape[0]] = value.swapaxes(0, 1)
+
+                layout = piece["layout"]
+                f = open(self.files[index], "r+b")
+                f.seek(seeks[index] + layout.displacements[self.communicator.procID] * components * 8)
+                rows.tofile(f)
+                f.close()
+
+                self.offsets[index] += layout.counts.sum() * components * 8
+
+        self._appendToIndex(self._snapshot(time, seeks))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()